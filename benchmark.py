@@ -0,0 +1,318 @@
+"""
+PyScheduler 성능 측정 스크립트
+
+모든 일정 유형의 합성 작업을 여러 규모(기본 1천/1만/10만 개)로 만들어
+저장소 처리량, 스케줄러 시작 시간, 다음 실행 시각 계산 처리량, 동시 실행 폭주 시 디스패치 지연을 측정하고
+커밋 간 비교할 수 있도록 JSON으로 기록합니다. UI 없이 실행되며, 작업 프로세스로는 바로 종료하는 스텁을 씁니다.
+
+    uv run python benchmark.py --scales 1000 10000 --output benchmark.json
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import random
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from scheduler.events import RUN_FINISHED
+from scheduler.metrics import MetricsRegistry
+from scheduler.models import Task
+from scheduler.recurrence import RecurrenceCache
+from scheduler.scheduler import Scheduler
+from scheduler.sqlite_storage import SQLiteStorage
+from scheduler.storage import Storage
+
+SCHEDULE_TYPES = ["once", "daily", "weekly", "monthly", "interval"]
+DEFAULT_SCALES = [1000, 10000, 100000]
+
+# 헤드리스 실행기와 같은 지연 기록 간격(초)
+FLUSH_INTERVAL = 0.2
+
+
+def make_stub(directory: Path) -> str:
+    """
+    실행하자마자 종료하는 스텁 실행 파일을 만들고 경로를 반환합니다.
+    """
+    path = directory / "stub.sh"
+    path.write_text("#!/bin/sh\nexit 0\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(path)
+
+
+def generate_tasks(count: int, file_path: str, seed: int = 0, prefix: str = "bench") -> List[Task]:
+    """
+    모든 일정 유형을 고르게 섞은 합성 작업 목록을 만듭니다. 같은 seed면 같은 작업 목록입니다.
+    """
+    rng = random.Random(seed)
+    tasks: List[Task] = []
+    for i in range(count):
+        schedule_type = SCHEDULE_TYPES[i % len(SCHEDULE_TYPES)]
+        options: Dict[str, Any] = {}
+        if schedule_type != "interval":
+            options["time"] = f"{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}"
+        if schedule_type == "weekly":
+            options["days"] = sorted(rng.sample(range(7), rng.randint(1, 7)))
+        elif schedule_type == "monthly":
+            if rng.random() < 0.1:
+                options["is_last_day_of_month"] = True
+            else:
+                options["date"] = rng.randint(1, 31)
+        elif schedule_type == "interval":
+            options["interval_minutes"] = rng.choice([1, 5, 15, 30, 60, 240, 1440])
+        tasks.append(Task(id=f"{prefix}-{seed}-{i}", name=f"{prefix}-{i}", file_path=file_path,
+                          schedule_type=schedule_type, **options))
+    return tasks
+
+
+def open_storage(backend: str, data_dir: Path, registry: MetricsRegistry):
+    if backend == "sqlite":
+        return SQLiteStorage(str(data_dir), metrics=registry)
+    return Storage(str(data_dir), flush_interval=FLUSH_INTERVAL, metrics=registry)
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else float("inf")
+
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    values = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(values[min(len(values) - 1, math.ceil(q * len(values)) - 1)], 6)
+
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": round(values[-1], 6)}
+
+
+def bench_storage(backend: str, count: int, ops: int, stub: str, workdir: Path, seed: int) -> Dict[str, Any]:
+    """
+    작업 count개가 들어 있는 저장소에서 add_task/update_task 처리량과 load_tasks 시간, 읽은 작업이 차지하는 작업당 메모리를 측정합니다.
+    개별 연산은 마지막 ops개 작업으로 측정하고, 나머지는 add_tasks로 한 번에 채웁니다.
+    """
+    tasks = generate_tasks(count, stub, seed)
+    ops = min(ops, count)
+    seeded, measured = tasks[:count - ops], tasks[count - ops:]
+    data_dir = workdir / f"storage-{backend}-{count}"
+    registry = MetricsRegistry()
+    storage = open_storage(backend, data_dir, registry)
+
+    started = time.perf_counter()
+    storage.add_tasks(seeded)
+    storage.flush()
+    bulk_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for task in measured:
+        storage.add_task(task)
+    storage.flush()
+    add_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for task in measured:
+        task.name += "-updated"
+        storage.update_task(task)
+    storage.flush()
+    update_seconds = time.perf_counter() - started
+
+    storage.close()
+
+    # 새 인스턴스로 파일/DB에서 처음부터 읽음
+    cold = open_storage(backend, data_dir, MetricsRegistry())
+    started = time.perf_counter()
+    loaded = cold.load_tasks()
+    load_seconds = time.perf_counter() - started
+    cold.close()
+    assert len(loaded) == count, f"{backend}: {len(loaded)} != {count}"
+    del loaded
+
+    # 추적하면 느려지므로 메모리는 따로 한 번 더 읽어 측정 (읽은 뒤 남아 있는 작업 목록과 저장소 캐시)
+    tracemalloc.start()
+    try:
+        resident = open_storage(backend, data_dir, MetricsRegistry())
+        loaded = resident.load_tasks()
+        resident_bytes = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    resident.close()
+
+    return {
+        "bulk_add_seconds": round(bulk_seconds, 4),
+        "bulk_add_per_second": _rate(len(seeded), bulk_seconds),
+        "add_task_per_second": _rate(ops, add_seconds),
+        "update_task_per_second": _rate(ops, update_seconds),
+        "load_tasks_seconds": round(load_seconds, 4),
+        "load_tasks_per_second": _rate(count, load_seconds),
+        "resident_bytes_per_task": resident_bytes // count,
+        "write_bytes": registry.get("storage_write_bytes_total", backend=backend),
+        "writes": registry.get("storage_writes_total", backend=backend),
+    }
+
+
+def bench_scheduler(count: int, burst: int, stub: str, workdir: Path, seed: int,
+                    timeout: float) -> Dict[str, Any]:
+    """
+    작업 count개로 스케줄러 시작 시간과 _update_next_run 처리량을 측정한 뒤,
+    같은 스케줄러에 같은 시각에 실행되는 작업 burst개를 추가해 디스패치 지연을 측정합니다.
+    """
+    data_dir = workdir / f"scheduler-{count}"
+    storage = Storage(str(data_dir), flush_interval=FLUSH_INTERVAL)
+    storage.add_tasks(generate_tasks(count, stub, seed))
+    storage.flush()
+
+    registry = MetricsRegistry()
+    scheduler = Scheduler(storage, name="bench", metrics=registry)
+    result: Dict[str, Any] = {}
+    try:
+        started = time.perf_counter()
+        scheduler.start()
+        startup_seconds = time.perf_counter() - started
+        result["startup_seconds"] = round(startup_seconds, 4)
+        result["startup_tasks_per_second"] = _rate(count, startup_seconds)
+
+        tasks = storage.get_enabled_tasks()
+        started = time.perf_counter()
+        for task in tasks:
+            scheduler._update_next_run(task)
+        result["update_next_run_per_second"] = _rate(len(tasks), time.perf_counter() - started)
+
+        # 반복 규칙 캐시를 비운 상태(작업마다 처음 계산)
+        scheduler.recurrences = RecurrenceCache(scheduler.spread_seconds)
+        started = time.perf_counter()
+        for task in tasks:
+            scheduler._update_next_run(task)
+        result["update_next_run_cold_per_second"] = _rate(len(tasks), time.perf_counter() - started)
+
+        result["dispatch"] = _bench_burst(scheduler, registry, burst, stub, seed, timeout)
+    finally:
+        scheduler.stop()
+        storage.close()
+    return result
+
+
+def _bench_burst(scheduler: Scheduler, registry: MetricsRegistry, burst: int, stub: str, seed: int,
+                 timeout: float) -> Dict[str, Any]:
+    """
+    같은 초에 실행되는 작업 burst개를 등록하고, 예정 시각부터 프로세스 시작까지의 지연을 측정합니다.
+    """
+    # 작업 시각은 초 단위이므로 다음 정각 초에서 2초 뒤로 잡음
+    fire_at = datetime.fromtimestamp(math.ceil(time.time())) + timedelta(seconds=2)
+    tasks = [Task(id=f"burst-{seed}-{i}", name=f"burst-{i}", file_path=stub, schedule_type="daily",
+                  time=fire_at.strftime("%H:%M:%S")) for i in range(burst)]
+    ids = {task.id for task in tasks}
+
+    started_at: List[float] = []
+    failed = 0
+    done = threading.Event()
+    lock = threading.Lock()
+
+    def on_finished(task_id: str, run) -> None:
+        nonlocal failed
+        if task_id not in ids:
+            return
+        with lock:
+            if run.pid is None:
+                failed += 1
+            else:
+                started_at.append(run.started_at)
+            if len(started_at) + failed >= burst:
+                done.set()
+
+    unsubscribe = scheduler.events.subscribe(RUN_FINISHED, on_finished)
+    try:
+        scheduler.add_tasks(tasks)
+        done.wait(timeout=(fire_at - datetime.now()).total_seconds() + timeout)
+    finally:
+        unsubscribe()
+
+    with lock:
+        lags = [when - fire_at.timestamp() for when in started_at]
+        failed_count = failed
+
+    def mean(name: str) -> Optional[float]:
+        count = registry.get(f"{name}_count", scheduler="bench")
+        return round(registry.get(f"{name}_sum", scheduler="bench") / count, 6) if count else None
+
+    return {
+        "burst": burst,
+        "launched": len(lags),
+        "failed": failed_count,
+        "launch_lag_seconds": _percentiles(lags),
+        "fire_lag_mean_seconds": mean("scheduler_fire_lag_seconds"),
+        "popen_latency_mean_seconds": mean("scheduler_popen_latency_seconds"),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=Path(__file__).resolve().parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="PyScheduler 성능 측정")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="작업 수 (여러 개 지정 가능)")
+    parser.add_argument("--backends", nargs="+", choices=["json", "sqlite"], default=["json", "sqlite"],
+                        help="측정할 저장소")
+    parser.add_argument("--ops", type=int, default=200, help="add_task/update_task를 개별 호출할 횟수")
+    parser.add_argument("--burst", type=int, default=500, help="같은 시각에 실행할 작업 수 (작업 수를 넘지 않음)")
+    parser.add_argument("--burst-timeout", type=float, default=60.0, help="폭주 실행 완료를 기다릴 최대 시간(초)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 작업 생성 시드")
+    parser.add_argument("--output", default="benchmark.json", help="결과 JSON 파일 ('-'이면 표준 출력)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    # 실행마다 남는 정보 로그는 측정을 방해하므로 경고 이상만 출력
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "commit": _git_commit(),
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "ops": args.ops,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="pyscheduler-bench-") as temp:
+        workdir = Path(temp)
+        stub = make_stub(workdir)
+        for count in args.scales:
+            result: Dict[str, Any] = {"storage": {}}
+            for backend in args.backends:
+                result["storage"][backend] = bench_storage(backend, count, args.ops, stub, workdir, args.seed)
+                print(f"[{count}] storage {backend}: {result['storage'][backend]}", file=sys.stderr)
+            result["scheduler"] = bench_scheduler(count, min(args.burst, count), stub, workdir, args.seed,
+                                                  args.burst_timeout)
+            print(f"[{count}] scheduler: {result['scheduler']}", file=sys.stderr)
+            report["results"][str(count)] = result
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"결과를 {args.output}에 기록했습니다.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,5 @@
 import sys
 import logging
-from PyQt6.QtWidgets import QApplication
-
-from ui import MainWindow
 
 logger = logging.getLogger(__name__)
 
@@ -11,16 +8,29 @@ def main():
     """
     애플리케이션 메인 함수
     """
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    if "--headless" in sys.argv[1:]:
+        # UI 없이 실행: PyQt를 import하지 않음
+        from scheduler.daemon import main as daemon_main
+        return daemon_main([arg for arg in sys.argv[1:] if arg != "--headless"])
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        filename='scheduler.log'
+    )
     try:
+        # PyQt는 UI를 실행할 때만 import
+        from PyQt6.QtWidgets import QApplication
+        from ui import MainWindow
+
         app = QApplication(sys.argv)
         app.setApplicationName("PyScheduler")
-        
+
         app.setStyle("Fusion")
-        
+
         window = MainWindow()
         window.show()
-        
+
         return app.exec()
     except Exception as e:
         logger.exception("PyScheduler failed to start: %s", e)
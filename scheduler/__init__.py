@@ -1,5 +1,26 @@
-from scheduler.models import Task
-from scheduler.storage import Storage
-from scheduler.scheduler import Scheduler
+import importlib
 
-__all__ = ["Task", "Storage", "Scheduler"] 
\ No newline at end of file
+# 헤드리스 실행 시 시작 시간을 줄이기 위해 실제로 사용하는 모듈만 처음 접근할 때 import
+_EXPORTS = {
+    "Task": "scheduler.models",
+    "Storage": "scheduler.storage",
+    "SQLiteStorage": "scheduler.sqlite_storage",
+    "Scheduler": "scheduler.scheduler",
+    "AsyncScheduler": "scheduler.async_scheduler",
+    "ShardedScheduler": "scheduler.sharding",
+}
+
+__all__ = ["Task", "Storage", "SQLiteStorage", "Scheduler", "AsyncScheduler", "ShardedScheduler"]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,289 @@
+import asyncio
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from scheduler.clock import SYSTEM_CLOCK, Clock
+from scheduler.engine import MAX_WAIT_SECONDS, TimerHandle
+from scheduler.executor import LaunchExecutor
+from scheduler.history import RunHistory, RunRecord
+from scheduler.metrics import Histogram
+from scheduler.models import TaskRecord
+from scheduler.recurrence import Recurrence
+from scheduler.scheduler import Scheduler
+from scheduler.storage import Storage
+
+logger = logging.getLogger("Scheduler")
+
+
+class AsyncTimerEngine:
+    """
+    TimerEngine과 같은 인터페이스로 asyncio 이벤트 루프의 타이머를 사용하는 엔진입니다.
+    루프가 연결되기 전에 등록된 타이머는 연결 시점에 예약됩니다.
+    """
+
+    def __init__(self, fire_lag: Optional[Histogram] = None, clock: Clock = SYSTEM_CLOCK):
+        """
+        fire_lag가 있으면 타이머가 예정 시각보다 얼마나 늦게 실행되었는지(초)를 기록합니다.
+        clock은 타이머 시각을 비교할 현재 시각을 얻는 시계입니다.
+        """
+        self.fire_lag = fire_lag
+        self.clock = clock
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self._pending: List[TimerHandle] = []
+        # 루프에 예약된 타이머 (취소된 핸들은 실행 시점에 제거)
+        self._armed: Set[TimerHandle] = set()
+
+    def call_at(self, when: datetime, callback: Callable[..., Any], *args: Any,
+                every: Optional[timedelta] = None, recurrence: Optional[Recurrence] = None) -> TimerHandle:
+        """
+        지정한 시각에 콜백을 실행하도록 등록합니다.
+        every가 있으면 그 간격으로, recurrence가 있으면 그 반복 규칙의 다음 시각마다 반복합니다.
+        """
+        handle = TimerHandle(when, callback, args, every, recurrence)
+        with self._lock:
+            loop = self.loop
+            if loop is None:
+                self._pending.append(handle)
+                return handle
+            self._armed.add(handle)
+        # 다른 스레드(예: Qt UI)에서 호출될 수 있으므로 루프 스레드로 넘김
+        loop.call_soon_threadsafe(self._arm, handle)
+        return handle
+
+    def call_later(self, delay: timedelta, callback: Callable[..., Any], *args: Any,
+                   every: Optional[timedelta] = None) -> TimerHandle:
+        """
+        지금부터 delay 후에 콜백을 실행하도록 등록합니다.
+        """
+        return self.call_at(self.clock.now() + delay, callback, *args, every=every)
+
+    def __len__(self) -> int:
+        """
+        취소되지 않은 타이머 수를 반환합니다.
+        """
+        with self._lock:
+            return sum(1 for handle in [*self._pending, *self._armed] if not handle.cancelled)
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        이벤트 루프를 연결하고 대기 중인 타이머를 예약합니다. 루프 스레드에서 호출해야 합니다.
+        """
+        with self._lock:
+            self.loop = loop
+            pending, self._pending = self._pending, []
+        for handle in pending:
+            self._arm(handle)
+
+    def detach(self) -> None:
+        """
+        이벤트 루프 연결을 해제합니다.
+        """
+        with self._lock:
+            self.loop = None
+
+    def _arm(self, handle: TimerHandle) -> None:
+        if handle.cancelled or self.loop is None:
+            self._armed.discard(handle)
+            return
+        self._armed.add(handle)
+        delay = handle.deadline - self.clock.time()
+        if delay > MAX_WAIT_SECONDS:
+            # 벽시계 변경을 반영하도록 긴 대기는 나누어 다시 계산
+            self.loop.call_later(MAX_WAIT_SECONDS, self._arm, handle)
+        else:
+            self.loop.call_later(max(delay, 0.0), self._fire, handle)
+
+    def _fire(self, handle: TimerHandle) -> None:
+        if handle.cancelled:
+            self._armed.discard(handle)
+            return
+        now = self.clock.time()
+        if handle.deadline > now:
+            # 루프의 단조 시계와 벽시계가 어긋난 경우 다시 예약
+            self._arm(handle)
+            return
+        if self.fire_lag is not None:
+            self.fire_lag.observe(now - handle.deadline)
+        if handle._advance(now):
+            self._arm(handle)
+        else:
+            self._armed.discard(handle)
+        try:
+            handle.callback(*handle.args)
+        except Exception as e:
+            logger.error(f"타이머 콜백 실행 실패: {e}")
+
+
+class AsyncScheduler(Scheduler):
+    """
+    하나의 asyncio 이벤트 루프에서 타이머와 프로세스 실행을 모두 처리하는 스케줄러입니다.
+    Scheduler와 같은 공개 API를 제공합니다.
+
+    UI에서는 start()/stop()으로 전용 스레드의 루프에서 실행하고,
+    헤드리스 실행기에서는 asyncio.run(scheduler.serve())로 현재 루프에서 실행합니다.
+    """
+
+    def __init__(self, storage: Storage, history: Optional[RunHistory] = None, max_processes: int = 64,
+                 name: str = "default", **options: Any):
+        """
+        options는 Scheduler의 놓친 실행, 시작 시각 분산, 지표 설정과 같습니다.
+        """
+        # 작업별 실행 중인 인스턴스 수와 동시 실행 수 제한으로 대기 중인 실행 수
+        # (지표 게이지가 참조하므로 부모 초기화 전에 만듦)
+        self._instances: Dict[str, int] = {}
+        self._waiting = 0
+        super().__init__(storage, history, max_processes=max_processes, name=name, **options)
+        self.engine = AsyncTimerEngine(fire_lag=self._fire_lag, clock=self.clock)
+        self.max_processes = max_processes
+        self.thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """
+        전용 스레드에서 이벤트 루프를 만들어 스케줄러를 시작합니다.
+        """
+        if self.running:
+            return
+
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            try:
+                asyncio.run(self.serve(ready))
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                ready.set()
+
+        self.thread = threading.Thread(target=run, name=f"{self.name}-loop", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if not self.running:
+            # 시작에 실패하면 루프 스레드가 끝나길 기다려 예외를 호출한 쪽에 전달
+            self.thread.join()
+            if errors:
+                raise errors[0]
+
+    async def serve(self, ready: Optional[threading.Event] = None) -> None:
+        """
+        현재 이벤트 루프에서 stop()이 호출될 때까지 스케줄러를 실행합니다.
+        """
+        if self.running:
+            return
+
+        self.running = True
+        try:
+            self._loop = asyncio.get_running_loop()
+            self._stop_event = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_processes)
+            self.engine.attach(self._loop)
+            self._load_tasks()
+        except BaseException:
+            self.running = False
+            self.engine.detach()
+            self._loop = None
+            raise
+        finally:
+            # 시작에 실패해도 start()가 계속 기다리지 않도록 항상 알림
+            if ready is not None:
+                ready.set()
+        self.logger.info("스케줄러가 시작되었습니다.")
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            self.engine.detach()
+            self._loop = None
+
+    def stop(self) -> None:
+        """
+        스케줄러를 중지합니다.
+        """
+        self.running = False
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._stop_event.set)
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        # 지연 기록 중인 변경 사항을 잃지 않도록 즉시 기록
+        self.storage.flush()
+        self.history.close()
+        self.logger.info("스케줄러가 중지되었습니다.")
+
+    def _create_executor(self, max_workers: int, max_processes: int) -> Optional[LaunchExecutor]:
+        # 프로세스는 이벤트 루프에서 create_subprocess_exec로 직접 실행하므로 실행기를 쓰지 않음
+        return None
+
+    def running_count(self, task_id: Optional[str] = None) -> int:
+        """
+        실행 중인 프로세스 수를 반환합니다.
+        """
+        if task_id is None:
+            return sum(self._instances.values())
+        return self._instances.get(task_id, 0)
+
+    def _pending_launches(self) -> int:
+        """
+        동시 실행 수 제한 때문에 시작을 기다리는 실행 수를 반환합니다.
+        """
+        return self._waiting
+
+    def _submit(self, task: TaskRecord) -> bool:
+        """
+        작업 실행 코루틴을 루프에 등록합니다. 타이머 콜백이므로 루프 스레드에서 호출됩니다.
+        최대 인스턴스 수에 도달했으면 False를 반환합니다.
+        """
+        count = self._instances.get(task.id, 0)
+        if task.max_instances is not None and count >= task.max_instances:
+            return False
+
+        self._instances[task.id] = count + 1
+        asyncio.ensure_future(self._run_process(task, time.time()))
+        return True
+
+    async def _run_process(self, task: TaskRecord, dispatched_at: float) -> None:
+        """
+        작업 프로세스를 실행하고 종료를 기다립니다.
+        """
+        try:
+            self._waiting += 1
+            try:
+                await self._slots.acquire()
+            finally:
+                self._waiting -= 1
+            try:
+                launch_started = time.perf_counter()
+                try:
+                    process = await asyncio.create_subprocess_exec(task.file_path)
+                except Exception as e:
+                    failed_at = time.time()
+                    self.logger.error(f"작업 실행 실패: {task.name} ({task.file_path}) - {str(e)}")
+                    self._on_task_failed(task, RunRecord(task.id, None, dispatched_at, failed_at,
+                                                         launch_latency=failed_at - dispatched_at))
+                    return
+
+                self._popen_latency.observe(time.perf_counter() - launch_started)
+
+                started_at = time.time()
+                run = RunRecord(task.id, process.pid, started_at, launch_latency=started_at - dispatched_at)
+                self._on_task_launched(task, run)
+
+                run.exit_code = await process.wait()
+                run.ended_at = time.time()
+                self._on_task_exited(task, run)
+            finally:
+                self._slots.release()
+        except Exception as e:
+            self.logger.error(f"작업 실행 처리 실패: {task.name} - {e}")
+        finally:
+            count = self._instances.get(task.id, 0) - 1
+            if count > 0:
+                self._instances[task.id] = count
+            else:
+                self._instances.pop(task.id, None)
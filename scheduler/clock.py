@@ -0,0 +1,55 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+class Clock:
+    """
+    스케줄러가 현재 시각을 얻는 시계입니다. 기본 시계는 시스템 시계를 그대로 사용합니다.
+    """
+
+    def now(self) -> datetime:
+        """
+        현재 로컬 시각을 반환합니다.
+        """
+        return datetime.now()
+
+    def time(self) -> float:
+        """
+        현재 시각을 epoch 초로 반환합니다.
+        """
+        return time.time()
+
+
+# 시스템 시계 (시계를 지정하지 않은 스케줄러가 공유)
+SYSTEM_CLOCK = Clock()
+
+
+class VirtualClock(Clock):
+    """
+    직접 앞으로 옮기는 가상 시계입니다. 시뮬레이션에서 기다리지 않고 시간을 건너뛸 때 사용합니다.
+    """
+
+    def __init__(self, start: datetime):
+        self._lock = threading.Lock()
+        self._now = start.timestamp()
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._now)
+
+    def time(self) -> float:
+        return self._now
+
+    def set(self, when: float) -> None:
+        """
+        시계를 epoch 초 when으로 옮깁니다. 과거로는 옮기지 않습니다.
+        """
+        with self._lock:
+            if when > self._now:
+                self._now = when
+
+    def advance(self, delta: timedelta) -> None:
+        """
+        시계를 delta만큼 앞으로 옮깁니다.
+        """
+        self.set(self._now + delta.total_seconds())
@@ -0,0 +1,262 @@
+import argparse
+import os
+import re
+import select
+import signal
+import socket
+import subprocess
+import sys
+import time
+import logging
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger("Scheduler")
+
+# 헤드리스 실행기가 스케줄러를 시작하기 전까지 import에 쓸 수 있는 시간(밀리초)
+IMPORT_BUDGET_MS = 400.0
+
+# 헤드리스 실행에 필요한 모듈 (UI 모듈은 포함하지 않음)
+DAEMON_MODULES = ("scheduler.daemon", "scheduler.storage", "scheduler.scheduler")
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+class SchedulerDaemon:
+    """
+    UI 없이 저장소와 스케줄러만 실행하는 데몬입니다.
+    SIGTERM/SIGINT를 받으면 중지하고, SIGHUP을 받으면 작업 목록을 다시 불러옵니다.
+    SIGUSR1을 받으면 profile_seconds초 동안 프로파일을 수집해 profile_dir에 기록하고,
+    SIGUSR2를 받으면 연산별 시간 측정(scheduler_operation_seconds 지표)을 켜거나 끕니다.
+    metrics_port가 있으면 그 포트에서 Prometheus 형식 지표를 제공합니다.
+    """
+
+    def __init__(self, data_dir: str = "data", use_sqlite: bool = False, flush_interval: float = 0.2,
+                 max_workers: int = 4, max_processes: int = 64, spread_seconds: int = 0,
+                 metrics_port: Optional[int] = None, metrics_host: str = "127.0.0.1",
+                 profile_dir: str = "profiles", profile_seconds: float = 30.0, profile_mode: str = "sample"):
+        if use_sqlite:
+            from scheduler.sqlite_storage import SQLiteStorage
+            self.storage = SQLiteStorage(data_dir)
+        else:
+            from scheduler.storage import Storage
+            self.storage = Storage(data_dir, flush_interval=flush_interval)
+
+        from scheduler.scheduler import Scheduler
+        self.scheduler = Scheduler(self.storage, max_workers=max_workers, max_processes=max_processes,
+                                   name="daemon", spread_seconds=spread_seconds)
+        self.metrics_server = None
+        if metrics_port is not None:
+            from scheduler.metrics import MetricsServer
+            self.metrics_server = MetricsServer(self.scheduler.metrics, host=metrics_host, port=metrics_port)
+        from scheduler.profiling import Profiler
+        self.profiler = Profiler(profile_dir)
+        self.profile_seconds = profile_seconds
+        self.profile_mode = profile_mode
+        self._remove_timing_hook: Optional[Callable[[], None]] = None
+        # 시그널 처리기는 잠금을 잡는 threading.Event 대신 소켓에 1바이트를 써서 메인 루프를 깨움
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._stopping = False
+        self._reloading = False
+        self._profiling = False
+        self._toggling_timing = False
+
+    def request_stop(self, *_) -> None:
+        """
+        데몬 중지를 요청합니다. 시그널 처리기에서 호출할 수 있습니다.
+        """
+        self._stopping = True
+        self._wake()
+
+    def request_reload(self, *_) -> None:
+        """
+        작업 목록 다시 불러오기를 요청합니다. 시그널 처리기에서 호출할 수 있습니다.
+        """
+        self._reloading = True
+        self._wake()
+
+    def request_profile(self, *_) -> None:
+        """
+        프로파일 수집을 요청합니다. 시그널 처리기에서 호출할 수 있습니다.
+        """
+        self._profiling = True
+        self._wake()
+
+    def request_timing_toggle(self, *_) -> None:
+        """
+        연산별 시간 측정을 켜거나 끄도록 요청합니다. 시그널 처리기에서 호출할 수 있습니다.
+        """
+        self._toggling_timing = True
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send(b"\0")
+        except OSError:
+            # 버퍼가 가득 찼으면 이미 깨울 바이트가 남아 있음
+            pass
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def toggle_timing(self) -> bool:
+        """
+        연산별 시간 측정 훅을 켜거나 끕니다. 켜졌으면 True를 반환합니다.
+        """
+        if self._remove_timing_hook is not None:
+            self._remove_timing_hook()
+            self._remove_timing_hook = None
+            logger.info("연산별 시간 측정을 껐습니다.")
+            return False
+        from scheduler.profiling import metrics_hook
+        scheduler = self.scheduler
+        self._remove_timing_hook = scheduler.hooks.add(post=metrics_hook(scheduler.metrics, scheduler.name))
+        logger.info("연산별 시간 측정을 켰습니다. (scheduler_operation_seconds)")
+        return True
+
+    def install_signal_handlers(self) -> None:
+        """
+        메인 스레드에서 시그널 처리기를 등록합니다. SIGHUP, SIGUSR1, SIGUSR2가 없는 플랫폼(Windows)에서는 건너뜁니다.
+        """
+        signal.signal(signal.SIGTERM, self.request_stop)
+        signal.signal(signal.SIGINT, self.request_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.request_reload)
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, self.request_profile)
+            signal.signal(signal.SIGUSR2, self.request_timing_toggle)
+
+    def run(self) -> int:
+        """
+        스케줄러를 시작하고 중지 요청이 올 때까지 대기합니다.
+        """
+        started = time.perf_counter()
+        self.scheduler.start()
+        logger.info(f"헤드리스 스케줄러 시작 (pid {os.getpid()}, 작업 {len(self.scheduler.jobs)}개, "
+                    f"{(time.perf_counter() - started) * 1000:.1f}ms)")
+        if self.metrics_server is not None:
+            self.metrics_server.start()
+            logger.info(f"지표 제공: http://{self.metrics_server.host}:{self.metrics_server.port}/metrics")
+
+        try:
+            while not self._stopping:
+                # 시그널 처리기는 플래그만 설정하고 실제 작업은 메인 루프에서 수행
+                select.select([self._wake_reader], [], [])
+                self._drain_wakeups()
+                if self._reloading and not self._stopping:
+                    self._reloading = False
+                    self.scheduler.reload()
+                if self._profiling and not self._stopping:
+                    self._profiling = False
+                    if self.profiler.start(self.profile_seconds, self.profile_mode) is None:
+                        logger.warning("이미 프로파일을 수집하고 있습니다.")
+                if self._toggling_timing and not self._stopping:
+                    self._toggling_timing = False
+                    self.toggle_timing()
+        finally:
+            # 수집 중이던 프로파일은 중지할 때까지의 내용으로 기록
+            self.profiler.stop()
+            if self.metrics_server is not None:
+                self.metrics_server.stop()
+            self.scheduler.stop()
+            self.storage.close()
+            self._wake_reader.close()
+            self._wake_writer.close()
+        return 0
+
+
+def measure_import_time(modules=DAEMON_MODULES) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    새 인터프리터에서 -X importtime으로 모듈을 import하고
+    전체 시간(밀리초)과 누적 시간이 큰 최상위 모듈 목록을 반환합니다.
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True)
+
+    total_us = 0
+    top_level: List[Tuple[str, float]] = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        # 들여쓰기가 없는 줄이 최상위 import이며, 그 누적 시간의 합이 전체 시간
+        if len(indent) == 1:
+            total_us += cumulative
+            top_level.append((name, cumulative / 1000))
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return total_us / 1000, top_level
+
+
+def check_import_budget(budget_ms: float = IMPORT_BUDGET_MS) -> int:
+    """
+    헤드리스 실행 경로의 import 시간이 예산 안인지, UI 모듈을 import하지 않는지 확인합니다.
+    """
+    total_ms, top_level = measure_import_time()
+    for name, elapsed in top_level[:10]:
+        print(f"{elapsed:9.1f} ms  {name}")
+    print(f"전체 import 시간: {total_ms:.1f} ms (예산 {budget_ms:.0f} ms)")
+
+    code = "import sys; " + "; ".join(f"import {module}" for module in DAEMON_MODULES) + \
+           "; print(any(m == 'ui' or m.startswith(('ui.', 'PyQt6')) for m in sys.modules))"
+    imports_ui = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True).stdout.strip() == "True"
+    if imports_ui:
+        print("헤드리스 실행 경로에서 UI 모듈을 import합니다.")
+        return 1
+    return 0 if total_ms <= budget_ms else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m scheduler", description="PyScheduler 헤드리스 실행기")
+    parser.add_argument("--data-dir", default="data", help="작업 데이터 디렉토리 (기본값: data)")
+    parser.add_argument("--sqlite", action="store_true", help="SQLite 저장소 사용")
+    parser.add_argument("--max-workers", type=int, default=4, help="프로세스 실행 스레드 수")
+    parser.add_argument("--max-processes", type=int, default=64, help="동시에 실행할 최대 프로세스 수")
+    parser.add_argument("--spread-seconds", type=int, default=0,
+                        help="같은 시각 작업의 시작을 작업 ID 해시로 분산할 구간(초)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="이 포트의 /metrics에서 Prometheus 형식 지표 제공 (기본값: 사용 안 함)")
+    parser.add_argument("--metrics-host", default="127.0.0.1", help="지표 HTTP 서버 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--profile-dir", default="profiles", help="SIGUSR1로 수집한 프로파일을 기록할 디렉토리")
+    parser.add_argument("--profile-seconds", type=float, default=30.0, help="SIGUSR1을 받았을 때 프로파일 수집 시간(초)")
+    parser.add_argument("--profile-mode", choices=("sample", "cprofile"), default="sample",
+                        help="프로파일 방식: 모든 스레드의 벽시계 표본 추출(sample, .folded) 또는 cprofile(.prof)")
+    parser.add_argument("--log-file", default="scheduler.log", help="로그 파일 ('-'이면 표준 오류)")
+    parser.add_argument("--log-level", default="INFO", help="로그 수준")
+    parser.add_argument("--check-import-budget", nargs="?", type=float, const=IMPORT_BUDGET_MS,
+                        metavar="MS", help="import 시간 예산을 확인하고 종료")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    헤드리스 실행기 메인 함수
+    """
+    args = build_parser().parse_args(argv)
+    if args.check_import_budget is not None:
+        return check_import_budget(args.check_import_budget)
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        filename=None if args.log_file == "-" else args.log_file
+    )
+    try:
+        daemon = SchedulerDaemon(args.data_dir, use_sqlite=args.sqlite,
+                                 max_workers=args.max_workers, max_processes=args.max_processes,
+                                 spread_seconds=args.spread_seconds,
+                                 metrics_port=args.metrics_port, metrics_host=args.metrics_host,
+                                 profile_dir=args.profile_dir, profile_seconds=args.profile_seconds,
+                                 profile_mode=args.profile_mode)
+        daemon.install_signal_handlers()
+        return daemon.run()
+    except Exception as e:
+        logger.exception("PyScheduler daemon failed to start: %s", e)
+        return 1
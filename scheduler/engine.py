@@ -0,0 +1,212 @@
+import heapq
+import itertools
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+from scheduler.clock import SYSTEM_CLOCK, Clock
+
+if TYPE_CHECKING:
+    from scheduler.metrics import Histogram
+    from scheduler.recurrence import Recurrence
+
+logger = logging.getLogger("Scheduler")
+
+# 벽시계 변경(절전 복귀, 시간 동기화)을 감지하기 위한 최대 대기 시간(초)
+MAX_WAIT_SECONDS = 60.0
+
+
+class TimerHandle:
+    """
+    TimerEngine에 등록된 타이머 항목입니다. cancel()로 취소합니다.
+    """
+    __slots__ = ("when", "deadline", "callback", "args", "every", "recurrence", "cancelled")
+
+    def __init__(self, when: datetime, callback: Callable[..., Any], args: Tuple[Any, ...],
+                 every: Optional[timedelta] = None, recurrence: Optional["Recurrence"] = None):
+        self.when = when
+        self.deadline = when.timestamp()
+        self.callback = callback
+        self.args = args
+        self.every = every
+        self.recurrence = recurrence
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """
+        타이머를 취소합니다. 힙에서는 다음에 꺼낼 때 제거됩니다.
+        """
+        self.cancelled = True
+
+    def _advance(self, now: float) -> bool:
+        """
+        반복 타이머의 다음 실행 시각으로 이동합니다. 반복이 아니면 False를 반환합니다.
+        """
+        if self.recurrence is not None:
+            # 늦게 깨어난 경우 지나간 실행 시각은 건너뜀
+            when = self.recurrence.next_after(max(self.when, datetime.fromtimestamp(now)))
+            if when is None:
+                return False
+            self.when = when
+            self.deadline = when.timestamp()
+            return True
+        if self.every is None:
+            return False
+        # 로컬 시각 기준으로 더해야 일광 절약 시간 전환 후에도 같은 벽시계 시각에 실행됨
+        when = self.when + self.every
+        while when.timestamp() <= now:
+            when += self.every
+        self.when = when
+        self.deadline = when.timestamp()
+        return True
+
+
+class TimerEngine:
+    """
+    다음 실행 시각 기준 최소 힙으로 동작하는 타이머 엔진입니다.
+    가장 빠른 마감 시각까지 대기하고, 새 타이머가 등록되면 즉시 깨어납니다.
+    """
+
+    def __init__(self, name: str = "TimerEngine", fire_lag: Optional["Histogram"] = None,
+                 clock: Clock = SYSTEM_CLOCK):
+        """
+        fire_lag가 있으면 타이머가 예정 시각보다 얼마나 늦게 실행되었는지(초)를 기록합니다.
+        clock은 현재 시각을 얻는 시계입니다. 가상 시계를 쓰면 스레드 대신 run_due()로 타이머를 실행합니다.
+        """
+        self.name = name
+        self.fire_lag = fire_lag
+        self.clock = clock
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def call_at(self, when: datetime, callback: Callable[..., Any], *args: Any,
+                every: Optional[timedelta] = None, recurrence: Optional["Recurrence"] = None) -> TimerHandle:
+        """
+        지정한 시각에 콜백을 실행하도록 등록합니다.
+        every가 있으면 그 간격으로, recurrence가 있으면 그 반복 규칙의 다음 시각마다 반복합니다.
+        """
+        handle = TimerHandle(when, callback, args, every, recurrence)
+        with self._cond:
+            self._push(handle)
+        return handle
+
+    def call_later(self, delay: timedelta, callback: Callable[..., Any], *args: Any,
+                   every: Optional[timedelta] = None) -> TimerHandle:
+        """
+        지금부터 delay 후에 콜백을 실행하도록 등록합니다.
+        """
+        return self.call_at(self.clock.now() + delay, callback, *args, every=every)
+
+    def start(self) -> None:
+        """
+        디스패치 스레드를 시작합니다.
+        """
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        디스패치 스레드를 중지합니다. 등록된 타이머는 유지됩니다.
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def __len__(self) -> int:
+        """
+        취소되지 않은 타이머 수를 반환합니다.
+        """
+        with self._cond:
+            return sum(1 for _, _, handle in self._heap if not handle.cancelled)
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        가장 빠른 타이머의 마감 시각(epoch 초)을 반환합니다. 타이머가 없으면 None을 반환합니다.
+        """
+        with self._cond:
+            heap = self._heap
+            while heap and heap[0][2].cancelled:
+                heapq.heappop(heap)
+            return heap[0][0] if heap else None
+
+    def run_due(self) -> int:
+        """
+        시계의 현재 시각까지 마감된 타이머를 호출한 스레드에서 모두 실행하고, 실행한 수를 반환합니다.
+        디스패치 스레드 없이 가상 시계로 시간을 건너뛰며 실행할 때 사용합니다.
+        """
+        count = 0
+        while True:
+            with self._cond:
+                handle = self._pop_due(self.clock.time())
+            if handle is None:
+                return count
+            self._call(handle)
+            count += 1
+
+    def _push(self, handle: TimerHandle) -> None:
+        heapq.heappush(self._heap, (handle.deadline, next(self._counter), handle))
+        # 새 항목이 가장 빠를 수 있으므로 대기 중인 스레드를 깨움
+        self._cond.notify()
+
+    def _next_due(self) -> Optional[TimerHandle]:
+        """
+        마감 시각이 된 타이머를 꺼냅니다. 중지되면 None을 반환합니다.
+        """
+        with self._cond:
+            while self._running:
+                heap = self._heap
+                while heap and heap[0][2].cancelled:
+                    heapq.heappop(heap)
+                if not heap:
+                    self._cond.wait()
+                    continue
+
+                now = self.clock.time()
+                delay = heap[0][0] - now
+                if delay > 0:
+                    self._cond.wait(min(delay, MAX_WAIT_SECONDS))
+                    continue
+                return self._pop_due(now)
+            return None
+
+    def _pop_due(self, now: float) -> Optional[TimerHandle]:
+        """
+        now까지 마감된 가장 빠른 타이머를 꺼내고, 반복 타이머는 다음 시각으로 다시 넣습니다.
+        """
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if not heap or heap[0][0] > now:
+            return None
+        deadline, _, handle = heapq.heappop(heap)
+        if self.fire_lag is not None:
+            self.fire_lag.observe(now - deadline)
+        if handle._advance(now):
+            self._push(handle)
+        return handle
+
+    def _run(self) -> None:
+        """
+        디스패치 루프
+        """
+        while True:
+            handle = self._next_due()
+            if handle is None:
+                return
+            self._call(handle)
+
+    def _call(self, handle: TimerHandle) -> None:
+        try:
+            handle.callback(*handle.args)
+        except Exception as e:
+            logger.error(f"타이머 콜백 실행 실패: {e}")
@@ -0,0 +1,62 @@
+import threading
+import logging
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger("Scheduler")
+
+# 이벤트 이름과 처리기에 전달되는 인자
+TASK_ADDED = "task_added"              # (task_id)
+TASK_UPDATED = "task_updated"          # (task_id) 작업 정의가 바뀐 경우
+TASK_REMOVED = "task_removed"          # (task_id)
+TASKS_RELOADED = "tasks_reloaded"      # () 작업 목록 전체가 바뀐 경우 (save_tasks, 외부에서 파일 수정)
+RUN_STATE_CHANGED = "run_state_changed"  # (task_id) 마지막/다음 실행 시간 또는 실행 결과가 바뀐 경우
+RUN_FINISHED = "run_finished"          # (task_id, RunRecord) 실행이 끝났거나 시작하지 못한 경우
+
+EVENTS = (TASK_ADDED, TASK_UPDATED, TASK_REMOVED, TASKS_RELOADED, RUN_STATE_CHANGED, RUN_FINISHED)
+
+
+class EventBus:
+    """
+    저장소와 스케줄러의 변경을 구독자에게 알리는 이벤트 버스입니다.
+    처리기는 이벤트를 발생시킨 스레드에서 바로 호출되므로 오래 걸리는 작업은 다른 스레드로 넘겨야 합니다.
+    구독자가 없으면 publish()는 사전 조회 한 번으로 끝납니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers: Dict[str, List[Callable[..., Any]]] = {}
+
+    def subscribe(self, event: str, handler: Callable[..., Any]) -> Callable[[], None]:
+        """
+        이벤트 처리기를 등록합니다. 등록을 해제하는 함수를 반환합니다.
+        """
+        if event not in EVENTS:
+            raise ValueError(f"알 수 없는 이벤트: {event}")
+        with self._lock:
+            # 발행 중인 목록을 바꾸지 않도록 새 목록으로 교체
+            self._handlers[event] = [*self._handlers.get(event, ()), handler]
+        return lambda: self.unsubscribe(event, handler)
+
+    def unsubscribe(self, event: str, handler: Callable[..., Any]) -> None:
+        """
+        이벤트 처리기 등록을 해제합니다.
+        """
+        with self._lock:
+            handlers = [h for h in self._handlers.get(event, ()) if h != handler]
+            if handlers:
+                self._handlers[event] = handlers
+            else:
+                self._handlers.pop(event, None)
+
+    def publish(self, event: str, *args: Any) -> None:
+        """
+        이벤트를 발행합니다. 처리기 예외는 기록만 하고 다음 처리기를 계속 호출합니다.
+        """
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        for handler in handlers:
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.error(f"이벤트 처리기 실행 실패 ({event}): {e}")
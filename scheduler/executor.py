@@ -0,0 +1,246 @@
+import os
+import queue
+import selectors
+import subprocess
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from scheduler.history import RunRecord
+from scheduler.metrics import Histogram
+from scheduler.models import TaskRecord
+
+logger = logging.getLogger("Scheduler")
+
+# pidfd를 쓸 수 없는 플랫폼에서 종료된 프로세스를 확인하는 주기(초)
+POLL_INTERVAL = 0.1
+
+LaunchCallback = Callable[[TaskRecord, RunRecord], None]
+
+
+class ProcessReaper:
+    """
+    실행 중인 하위 프로세스를 한 스레드에서 감시하고 종료되면 회수합니다.
+    Linux에서는 pidfd로 대기하고, 그 밖의 플랫폼에서는 주기적으로 poll()합니다.
+    """
+
+    def __init__(self, on_exit: Callable[[subprocess.Popen, object], None], name: str = "ProcessReaper"):
+        self.name = name
+        self._on_exit = on_exit
+        self._lock = threading.Lock()
+        self._polled: List[Tuple[subprocess.Popen, object]] = []
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup: Optional[Tuple[int, int]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def add(self, process: subprocess.Popen, data: object) -> None:
+        """
+        감시할 프로세스를 등록합니다.
+        """
+        with self._lock:
+            self._stopping = False
+            registered = False
+            if self._selector is None and hasattr(os, "pidfd_open"):
+                self._selector = selectors.DefaultSelector()
+                self._wakeup = os.pipe()
+                self._selector.register(self._wakeup[0], selectors.EVENT_READ, None)
+            if self._selector is not None:
+                try:
+                    pidfd = os.pidfd_open(process.pid)
+                    self._selector.register(pidfd, selectors.EVENT_READ, (process, data))
+                    registered = True
+                except OSError:
+                    # 커널이나 샌드박스가 pidfd를 막으면 poll 방식으로 대체
+                    pass
+            if not registered:
+                self._polled.append((process, data))
+            self._ensure_thread()
+        self._wake()
+
+    def stop(self) -> None:
+        """
+        감시 중인 프로세스가 모두 끝나면 감시 스레드를 종료합니다.
+        """
+        with self._lock:
+            self._stopping = True
+        self._wake()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            os.write(self._wakeup[1], b"\0")
+
+    def _pending(self) -> int:
+        watched = len(self._selector.get_map()) - 1 if self._selector is not None else 0
+        return watched + len(self._polled)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping and self._pending() == 0:
+                    self._thread = None
+                    return
+                timeout = POLL_INTERVAL if self._polled else None
+
+            if self._selector is not None:
+                for key, _ in self._selector.select(timeout):
+                    if key.data is None:
+                        os.read(key.fd, 4096)
+                        continue
+                    process, data = key.data
+                    with self._lock:
+                        self._selector.unregister(key.fd)
+                    os.close(key.fd)
+                    process.wait()
+                    self._notify(process, data)
+            else:
+                time.sleep(POLL_INTERVAL)
+
+            with self._lock:
+                finished = [item for item in self._polled if item[0].poll() is not None]
+                if finished:
+                    self._polled = [item for item in self._polled if item[0].returncode is None]
+            for process, data in finished:
+                self._notify(process, data)
+
+    def _notify(self, process: subprocess.Popen, data: object) -> None:
+        try:
+            self._on_exit(process, data)
+        except Exception as e:
+            logger.error(f"프로세스 종료 처리 실패: {e}")
+
+
+class LaunchExecutor:
+    """
+    디스패치 스레드 대신 작업 프로세스를 실행하는 실행기입니다.
+    전체 동시 프로세스 수와 작업별 최대 인스턴스 수(Task.max_instances)를 제한합니다.
+    """
+
+    def __init__(self, on_launch: LaunchCallback, on_exit: LaunchCallback, on_error: LaunchCallback,
+                 max_workers: int = 4, max_processes: int = 64, name: str = "LaunchExecutor",
+                 popen_latency: Optional[Histogram] = None):
+        """
+        popen_latency가 있으면 Popen 호출에 걸린 시간(초)을 기록합니다.
+        """
+        self.name = name
+        self.popen_latency = popen_latency
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self._on_launch = on_launch
+        self._on_exit = on_exit
+        self._on_error = on_error
+
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple[TaskRecord, float]]]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_processes)
+        self._workers: List[threading.Thread] = []
+        # 작업별 대기 중이거나 실행 중인 인스턴스 수
+        self._instances: Dict[str, int] = {}
+        self._running = 0
+        self._reaper = ProcessReaper(self._finish, name=f"{name}-reaper")
+
+    def submit(self, task: TaskRecord) -> bool:
+        """
+        작업 실행을 요청합니다. 작업별 인스턴스 제한에 걸리면 False를 반환합니다.
+        """
+        with self._lock:
+            count = self._instances.get(task.id, 0)
+            if task.max_instances is not None and count >= task.max_instances:
+                return False
+            self._instances[task.id] = count + 1
+            self._ensure_workers()
+        self._queue.put((task, time.time()))
+        return True
+
+    def running_count(self, task_id: Optional[str] = None) -> int:
+        """
+        실행 중인 프로세스 수를 반환합니다. task_id가 있으면 해당 작업의 대기 중인 요청도 포함합니다.
+        """
+        with self._lock:
+            if task_id is None:
+                return self._running
+            return self._instances.get(task_id, 0)
+
+    def queue_depth(self) -> int:
+        """
+        실행기 스레드가 아직 꺼내지 않은 실행 요청 수를 반환합니다.
+        """
+        return self._queue.qsize()
+
+    def shutdown(self) -> None:
+        """
+        실행기 스레드를 종료합니다. 이미 실행된 프로세스는 끝까지 회수합니다.
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put(None)
+        self._reaper.stop()
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, name=f"{self.name}-worker", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            task, dispatched_at = item
+
+            # 동시 프로세스 수 제한에 걸리면 빈 자리가 날 때까지 대기
+            self._slots.acquire()
+            launch_started = time.perf_counter()
+            try:
+                process = subprocess.Popen(task.file_path)
+            except Exception as e:
+                failed_at = time.time()
+                self._slots.release()
+                self._release_instance(task.id)
+                logger.error(f"작업 실행 실패: {task.name} ({task.file_path}) - {str(e)}")
+                try:
+                    self._on_error(task, RunRecord(task.id, None, dispatched_at, failed_at,
+                                                   launch_latency=failed_at - dispatched_at))
+                except Exception as e:
+                    logger.error(f"작업 실행 실패 처리 실패: {task.name} - {e}")
+                continue
+
+            if self.popen_latency is not None:
+                self.popen_latency.observe(time.perf_counter() - launch_started)
+            started_at = time.time()
+            with self._lock:
+                self._running += 1
+            run = RunRecord(task.id, process.pid, started_at, launch_latency=started_at - dispatched_at)
+            try:
+                self._on_launch(task, run)
+            except Exception as e:
+                logger.error(f"작업 실행 후처리 실패: {task.name} - {e}")
+            # 시작 기록이 종료 기록보다 먼저 남도록 후처리 이후에 감시 등록
+            self._reaper.add(process, (task, run))
+
+    def _finish(self, process: subprocess.Popen, data: object) -> None:
+        task, run = data
+        run.exit_code = process.returncode
+        run.ended_at = time.time()
+        with self._lock:
+            self._running -= 1
+        self._slots.release()
+        self._release_instance(task.id)
+        self._on_exit(task, run)
+
+    def _release_instance(self, task_id: str) -> None:
+        with self._lock:
+            count = self._instances.get(task_id, 0) - 1
+            if count > 0:
+                self._instances[task_id] = count
+            else:
+                self._instances.pop(task_id, None)
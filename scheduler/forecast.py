@@ -0,0 +1,210 @@
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from scheduler.clock import SYSTEM_CLOCK, Clock
+from scheduler.models import Task
+from scheduler.recurrence import TIME_FORMAT, compile_recurrence
+
+Occurrence = Tuple[datetime, str]  # (실행 시각, 작업 ID)
+
+
+def iter_occurrences(task: Task, start: datetime, end: Optional[datetime] = None,
+                     limit: Optional[int] = None, spread_seconds: int = 0) -> List[datetime]:
+    """
+    start 이후(end 미만) 작업의 실행 시각을 최대 limit개 계산합니다.
+    주기적 작업은 저장된 next_run을 기준으로 간격을 더해 나갑니다.
+    spread_seconds는 작업에 분산 구간이 없을 때 사용할 전체 분산 구간(초)입니다.
+    """
+    recurrence = compile_recurrence(task, spread_seconds)
+    if recurrence is None or (end is None and limit is None):
+        return []
+
+    if recurrence.anchored:
+        if not task.next_run:
+            return []
+        current = datetime.strptime(task.next_run, TIME_FORMAT)
+        if current < start:
+            # 기준 시각에서 start 직전까지 간격 단위로 건너뜀
+            steps = (start - current) // recurrence.interval
+            current += recurrence.interval * steps
+            if current < start:
+                current += recurrence.interval
+    else:
+        current = recurrence.next_after(start - timedelta(microseconds=1))
+
+    occurrences: List[datetime] = []
+    while current is not None:
+        if end is not None and current >= end:
+            break
+        if limit is not None and len(occurrences) >= limit:
+            break
+        occurrences.append(current)
+        current = recurrence.next_after(current)
+    return occurrences
+
+
+class ForecastIndex:
+    """
+    활성화된 작업의 앞으로의 실행 시각을 작업별 정렬 목록으로 보관하는 색인입니다.
+    작업이 바뀌면 그 작업의 목록만 바꾸므로 갱신 비용은 전체 실행 시각 수가 아니라 그 작업의 실행 시각 수에
+    비례합니다. 범위 질의는 작업별 목록의 해당 구간만 모아 합치고, 구간별 집계는 그 구간의 항목을 세기만 합니다.
+    색인 범위(horizon)를 벗어난 질의가 오면 범위를 앞으로 밀면서 지난 항목은 버리고 새 구간만 계산합니다.
+    """
+
+    def __init__(self, horizon: timedelta = timedelta(days=1), spread_seconds: int = 0,
+                 clock: Clock = SYSTEM_CLOCK):
+        self.horizon = horizon
+        self.clock = clock
+        self.spread_seconds = spread_seconds
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, Task] = {}
+        self._by_task: Dict[str, List[datetime]] = {}
+        self._count = 0
+        self._start = clock.now()
+        self._end = self._start + horizon
+
+    def __len__(self) -> int:
+        return self._count
+
+    def update(self, task: Task) -> None:
+        """
+        작업의 실행 시각 항목을 다시 계산합니다. 비활성화된 작업은 제거합니다.
+        """
+        with self._lock:
+            self._remove(task.id)
+            if task.enabled:
+                self._tasks[task.id] = task
+                self._add(task)
+
+    def update_many(self, tasks: List[Task]) -> None:
+        """
+        여러 작업의 실행 시각 항목을 한 번에 다시 계산합니다.
+        """
+        with self._lock:
+            for task in tasks:
+                self._remove(task.id)
+                if task.enabled:
+                    self._tasks[task.id] = task
+                    self._add(task)
+
+    def advance(self, task: Task) -> None:
+        """
+        실행된 주기적 작업의 지난 항목을 버립니다. 저장된 next_run이 이미 색인에 있는 시각이면
+        (제시간에 실행된 경우) 다시 계산하지 않고, 늦게 실행되어 기준 시각이 바뀐 경우에만 그 작업을 다시 계산합니다.
+        """
+        with self._lock:
+            times = self._by_task.get(task.id)
+            if times is None or not task.enabled or not task.next_run:
+                self._remove(task.id)
+                if task.enabled:
+                    self._tasks[task.id] = task
+                    self._add(task)
+                return
+            self._tasks[task.id] = task
+            next_run = datetime.strptime(task.next_run, TIME_FORMAT)
+            i = bisect_left(times, next_run)
+            if i < len(times) and times[i] == next_run:
+                del times[:i]
+                self._count -= i
+                return
+            self._remove(task.id)
+            self._add(task)
+
+    def remove_many(self, task_ids: Set[str]) -> None:
+        """
+        여러 작업의 실행 시각 항목을 한 번에 제거합니다.
+        """
+        with self._lock:
+            for task_id in task_ids:
+                self._remove(task_id)
+                self._tasks.pop(task_id, None)
+
+    def remove(self, task_id: str) -> None:
+        """
+        작업의 실행 시각 항목을 제거합니다.
+        """
+        with self._lock:
+            self._remove(task_id)
+            self._tasks.pop(task_id, None)
+
+    def between(self, start: datetime, end: datetime) -> List[Occurrence]:
+        """
+        [start, end) 범위의 모든 실행 시각을 시간순으로 반환합니다.
+        """
+        with self._lock:
+            self._ensure_window(start, end)
+            occurrences: List[Occurrence] = []
+            for task_id, times in self._by_task.items():
+                lo = bisect_left(times, start)
+                hi = bisect_left(times, end, lo)
+                occurrences.extend((when, task_id) for when in times[lo:hi])
+            # 작업별 목록은 이미 정렬되어 있으므로 timsort가 정렬된 구간을 합치기만 함
+            occurrences.sort()
+            return occurrences
+
+    def histogram(self, start: datetime, end: datetime,
+                  bucket: timedelta = timedelta(minutes=1)) -> List[Tuple[datetime, int]]:
+        """
+        [start, end) 범위를 bucket 단위로 나누어 구간별 실행 횟수를 반환합니다.
+        """
+        with self._lock:
+            self._ensure_window(start, end)
+            buckets: List[datetime] = []
+            bucket_start = start
+            while bucket_start < end:
+                buckets.append(bucket_start)
+                bucket_start += bucket
+            counts = [0] * len(buckets)
+            for times in self._by_task.values():
+                lo = bisect_left(times, start)
+                hi = bisect_left(times, end, lo)
+                for when in times[lo:hi]:
+                    counts[(when - start) // bucket] += 1
+            return list(zip(buckets, counts))
+
+    def _ensure_window(self, start: datetime, end: datetime) -> None:
+        """
+        질의 범위가 색인 범위를 벗어나면 색인 범위를 옮깁니다.
+        앞으로만 옮기는 경우(시간이 흐른 경우)에는 지난 항목을 버리고 늘어난 구간만 계산합니다.
+        """
+        if self._start <= start and end <= self._end:
+            return
+        new_start = min(start, self.clock.now())
+        new_end = max(end, new_start + self.horizon)
+        if new_start < self._start or new_start > self._end:
+            # 과거로 옮기거나 건너뛴 구간이 있으면 모두 다시 계산
+            self._start, self._end = new_start, new_end
+            self._by_task.clear()
+            self._count = 0
+            for task in self._tasks.values():
+                self._add(task)
+            return
+
+        old_end = self._end
+        self._start, self._end = new_start, new_end
+        for task_id, task in self._tasks.items():
+            times = self._by_task.get(task_id, [])
+            stale = bisect_left(times, new_start)
+            del times[:stale]
+            self._count -= stale
+            added = iter_occurrences(task, old_end, new_end, spread_seconds=self.spread_seconds)
+            if added:
+                times.extend(added)
+                self._count += len(added)
+            if times:
+                self._by_task[task_id] = times
+            else:
+                self._by_task.pop(task_id, None)
+
+    def _add(self, task: Task) -> None:
+        times = iter_occurrences(task, self._start, self._end, spread_seconds=self.spread_seconds)
+        if times:
+            self._by_task[task.id] = times
+            self._count += len(times)
+
+    def _remove(self, task_id: str) -> None:
+        times = self._by_task.pop(task_id, None)
+        if times:
+            self._count -= len(times)
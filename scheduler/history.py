@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, TextIO
+
+
+@dataclass
+class RunRecord:
+    """
+    작업 한 번의 실행 기록입니다. 시각은 epoch 초 단위입니다.
+    """
+    task_id: str
+    pid: Optional[int]
+    started_at: float
+    ended_at: Optional[float] = None
+    exit_code: Optional[int] = None  # 실행 자체에 실패하면 None
+    launch_latency: float = 0.0  # 디스패치부터 프로세스 생성까지 걸린 시간(초)
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exit_code == 0
+
+    def to_row(self) -> list:
+        return [self.task_id, self.pid, self.started_at, self.ended_at, self.exit_code, self.launch_latency]
+
+    @classmethod
+    def from_row(cls, row: list) -> 'RunRecord':
+        return cls(*row)
+
+
+@dataclass
+class RunStats:
+    """
+    일정 기간의 실행 기록 집계입니다.
+    """
+    count: int = 0
+    failures: int = 0
+    mean_duration: Optional[float] = None
+    max_duration: Optional[float] = None
+    mean_launch_latency: Optional[float] = None
+
+
+class RunHistory:
+    """
+    작업별 링 버퍼와 크기가 제한된 디스크 세그먼트 파일로 실행 기록을 보관합니다.
+    """
+
+    def __init__(self, history_dir: str = "data/history", per_task: int = 100,
+                 segment_bytes: int = 1024 * 1024, max_segments: int = 4):
+        self.history_dir = Path(history_dir)
+        self.per_task = per_task
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+
+        self._lock = threading.Lock()
+        self._runs: Dict[str, Deque[RunRecord]] = {}
+        self._segment: Optional[TextIO] = None
+
+        os.makedirs(self.history_dir, exist_ok=True)
+        self._load()
+
+    def record(self, run: RunRecord) -> None:
+        """
+        실행 기록을 추가합니다.
+        """
+        line = json.dumps(run.to_row(), separators=(",", ":")) + "\n"
+        with self._lock:
+            self._remember(run)
+            segment = self._current_segment()
+            segment.write(line)
+            segment.flush()
+
+    def last_runs(self, task_id: str, n: int = 10) -> List[RunRecord]:
+        """
+        작업의 최근 실행 기록을 최신순으로 최대 n개 반환합니다.
+        """
+        with self._lock:
+            runs = self._runs.get(task_id)
+            if not runs:
+                return []
+            return list(runs)[-n:][::-1]
+
+    def aggregate(self, task_id: Optional[str] = None, since: Optional[datetime] = None,
+                  until: Optional[datetime] = None) -> RunStats:
+        """
+        기간 [since, until) 동안의 실행 기록을 집계합니다. task_id가 없으면 전체 작업을 집계합니다.
+        """
+        start = since.timestamp() if since else float("-inf")
+        end = until.timestamp() if until else float("inf")
+
+        with self._lock:
+            if task_id is None:
+                runs = [run for task_runs in self._runs.values() for run in task_runs]
+            else:
+                runs = list(self._runs.get(task_id, ()))
+
+        stats = RunStats()
+        durations = []
+        latencies = []
+        for run in runs:
+            if not start <= run.started_at < end:
+                continue
+            stats.count += 1
+            if not run.succeeded:
+                stats.failures += 1
+            if run.duration is not None:
+                durations.append(run.duration)
+            latencies.append(run.launch_latency)
+
+        if durations:
+            stats.mean_duration = sum(durations) / len(durations)
+            stats.max_duration = max(durations)
+        if latencies:
+            stats.mean_launch_latency = sum(latencies) / len(latencies)
+        return stats
+
+    def forget(self, task_id: str) -> None:
+        """
+        삭제된 작업의 메모리 기록을 버립니다. 디스크 세그먼트는 순환되며 사라집니다.
+        """
+        with self._lock:
+            self._runs.pop(task_id, None)
+
+    def close(self) -> None:
+        """
+        현재 세그먼트 파일을 닫습니다.
+        """
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    def _remember(self, run: RunRecord) -> None:
+        runs = self._runs.get(run.task_id)
+        if runs is None:
+            runs = self._runs[run.task_id] = deque(maxlen=self.per_task)
+        runs.append(run)
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.history_dir.glob("runs-*.jsonl"))
+
+    def _current_segment(self) -> TextIO:
+        """
+        기록할 세그먼트를 반환합니다. 크기를 넘으면 새 세그먼트로 넘어가고 오래된 것은 지웁니다.
+        """
+        if self._segment is not None and self._segment.tell() < self.segment_bytes:
+            return self._segment
+
+        segments = self._segments()
+        if self._segment is None and segments and segments[-1].stat().st_size < self.segment_bytes:
+            path = segments[-1]
+        else:
+            if self._segment is not None:
+                self._segment.close()
+            number = int(segments[-1].stem.split("-")[1]) + 1 if segments else 0
+            path = self.history_dir / f"runs-{number:08d}.jsonl"
+            segments.append(path)
+            for old in segments[:-self.max_segments]:
+                old.unlink(missing_ok=True)
+
+        self._segment = open(path, "a", encoding="utf-8")
+        if self._segment.tell() and not self._ends_with_newline(path):
+            # 기록 도중 중단되어 잘린 줄 뒤에 이어 쓰지 않도록 줄을 끝냄
+            self._segment.write("\n")
+        return self._segment
+
+    @staticmethod
+    def _ends_with_newline(path: Path) -> bool:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _load(self) -> None:
+        """
+        디스크 세그먼트에서 작업별 링 버퍼를 다시 채웁니다.
+        """
+        for path in self._segments():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._remember(RunRecord.from_row(json.loads(line)))
+                    except (json.JSONDecodeError, TypeError):
+                        # 기록 도중 중단되어 잘린 줄은 무시
+                        continue
@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+
+class RunStateJournal:
+    """
+    작업 실행 상태(last_run, next_run, 결과)를 한 줄씩 덧붙이는 추가 전용 저널입니다.
+    작업 정의 파일(스냅샷)을 다시 쓰면 비워집니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        """
+        마지막 압축 이후 추가된 레코드 수를 반환합니다.
+        """
+        return self._count
+
+    def append(self, task_id: str, last_run: Optional[str], next_run: Optional[str],
+               outcome: Optional[str] = None) -> int:
+        """
+        실행 상태 레코드 하나를 저널 끝에 추가하고, 기록한 문자 수를 반환합니다.
+        """
+        record = {"id": task_id, "last_run": last_run, "next_run": next_run, "outcome": outcome}
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self._count += 1
+        return len(line)
+
+    def append_many(self, records: List[Tuple[str, Optional[str], Optional[str], Optional[str]]]) -> int:
+        """
+        (작업 ID, last_run, next_run, 결과) 레코드들을 한 번에 추가하고, 기록한 문자 수를 반환합니다.
+        """
+        lines = "".join(
+            json.dumps({"id": task_id, "last_run": last_run, "next_run": next_run, "outcome": outcome},
+                       ensure_ascii=False, separators=(",", ":")) + "\n"
+            for task_id, last_run, next_run, outcome in records
+        )
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(lines)
+            self._file.flush()
+            self._count += len(records)
+        return len(lines)
+
+    def replay(self) -> Dict[str, Dict[str, Any]]:
+        """
+        저널을 읽어 작업별 마지막 실행 상태를 반환합니다.
+        """
+        states: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            if not self.path.exists():
+                self._count = 0
+                return states
+            count = 0
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 기록 도중 중단되어 잘린 마지막 줄은 무시
+                        continue
+                    previous = states.get(record["id"])
+                    if record.get("outcome") is None and previous is not None:
+                        # 결과 없이 일정만 갱신한 기록은 이전 실행 결과를 유지
+                        record["outcome"] = previous["outcome"]
+                    states[record["id"]] = record
+                    count += 1
+            self._count = count
+        return states
+
+    def truncate(self) -> None:
+        """
+        스냅샷에 반영된 저널 내용을 비웁니다.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self.path.exists():
+                os.truncate(self.path, 0)
+            self._count = 0
+
+    def close(self) -> None:
+        """
+        저널 파일을 닫습니다.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,275 @@
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# 지연 시간 히스토그램의 기본 구간 경계(초)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 마이크로초 단위 계산 시간용 구간 경계(초)
+FAST_BUCKETS = (0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+                0.001, 0.005, 0.01)
+
+# Prometheus 텍스트 형식의 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Labels, float]
+
+# 실행 경로에서 이벤트당 1µs보다 훨씬 적게 들도록 값 갱신에는 잠금을 쓰지 않습니다.
+# GIL이 있는 CPython에서는 숫자 속성의 += 도중에 스레드가 바뀌지 않으므로 값을 잃지 않습니다.
+
+
+class Counter:
+    """
+    증가만 하는 값입니다. (실행 횟수, 기록한 바이트 수 등)
+    """
+    __slots__ = ("labels", "value")
+
+    def __init__(self, labels: Labels = ()):
+        self.labels = labels
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def samples(self, name: str) -> List[Sample]:
+        return [(name, self.labels, self.value)]
+
+
+class Gauge:
+    """
+    오르내리는 값입니다. set_function()으로 함수를 지정하면 수집할 때만 값을 계산합니다.
+    """
+    __slots__ = ("labels", "value", "function")
+
+    def __init__(self, labels: Labels = ()):
+        self.labels = labels
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set_function(self, function: Optional[Callable[[], float]]) -> None:
+        self.function = function
+
+    def get(self) -> float:
+        function = self.function
+        return float(function()) if function is not None else self.value
+
+    def samples(self, name: str) -> List[Sample]:
+        return [(name, self.labels, self.get())]
+
+
+class Histogram:
+    """
+    관측값을 구간별로 세는 히스토그램입니다. 구간 수, 합계, 개수만 보관합니다.
+    """
+    __slots__ = ("labels", "buckets", "counts", "sum", "count")
+
+    def __init__(self, labels: Labels = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # 마지막 칸은 +Inf 구간
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name: str) -> List[Sample]:
+        counts, total, count = list(self.counts), self.sum, self.count
+        samples: List[Sample] = []
+        cumulative = 0
+        for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+            cumulative += bucket_count
+            samples.append((f"{name}_bucket", self.labels + (("le", _format_value(bound)),), cumulative))
+        samples.append((f"{name}_sum", self.labels, total))
+        samples.append((f"{name}_count", self.labels, count))
+        return samples
+
+
+_TYPES = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+
+class MetricsRegistry:
+    """
+    이름과 레이블로 지표를 등록하고 Prometheus 텍스트 형식으로 내보내는 저장소입니다.
+    지표 객체는 등록할 때 한 번 만들어 두고, 실행 경로에서는 그 객체의 메서드만 호출합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 이름 -> (유형, 설명, 레이블 -> 지표)
+        self._families: Dict[str, Tuple[str, str, Dict[Labels, object]]] = {}
+
+    def counter(self, name: str, help: str = "", **labels: str) -> Counter:
+        """
+        카운터를 반환합니다. 같은 이름과 레이블이면 같은 객체를 반환합니다.
+        """
+        return self._get("counter", name, help, labels)
+
+    def gauge(self, name: str, help: str = "", **labels: str) -> Gauge:
+        """
+        게이지를 반환합니다. 같은 이름과 레이블이면 같은 객체를 반환합니다.
+        """
+        return self._get("gauge", name, help, labels)
+
+    def histogram(self, name: str, help: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+                  **labels: str) -> Histogram:
+        """
+        히스토그램을 반환합니다. 같은 이름과 레이블이면 같은 객체를 반환합니다.
+        """
+        return self._get("histogram", name, help, labels, buckets=buckets)
+
+    def collect(self) -> List[Sample]:
+        """
+        모든 지표의 현재 값을 (이름, 레이블, 값) 목록으로 반환합니다.
+        """
+        samples: List[Sample] = []
+        for name, _, _, metrics in self._snapshot():
+            for metric in metrics:
+                samples.extend(metric.samples(name))
+        return samples
+
+    def get(self, name: str, **labels: str) -> Optional[float]:
+        """
+        표본 하나의 값을 반환합니다. 히스토그램은 name_count, name_sum처럼 표본 이름으로 찾습니다.
+        """
+        key = tuple(sorted(labels.items()))
+        for sample_name, sample_labels, value in self.collect():
+            if sample_name == name and sample_labels == key:
+                return value
+        return None
+
+    def render(self) -> str:
+        """
+        모든 지표를 Prometheus 텍스트 형식으로 반환합니다.
+        """
+        lines: List[str] = []
+        for name, kind, help, metrics in self._snapshot():
+            if help:
+                lines.append(f"# HELP {name} {_escape_help(help)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for metric in metrics:
+                for sample_name, labels, value in metric.samples(name):
+                    lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get(self, kind: str, name: str, help: str, labels: Dict[str, str], **options) -> object:
+        key = tuple(sorted((label, str(value)) for label, value in labels.items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = (kind, help, {})
+                self._families[name] = family
+            elif family[0] != kind:
+                raise ValueError(f"지표 {name}은(는) 이미 {family[0]}(으)로 등록되어 있습니다.")
+            metric = family[2].get(key)
+            if metric is None:
+                metric = _TYPES[kind](key, **options)
+                family[2][key] = metric
+            return metric
+
+    def _snapshot(self) -> List[Tuple[str, str, str, List[object]]]:
+        with self._lock:
+            return [(name, kind, help, list(metrics.values()))
+                    for name, (kind, help, metrics) in sorted(self._families.items())]
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{label}="{_escape_label(value)}"' for label, value in labels) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 프로세스 전체에서 공유하는 기본 지표 저장소
+REGISTRY = MetricsRegistry()
+
+
+class MetricsServer:
+    """
+    지표를 Prometheus 텍스트 형식으로 제공하는 로컬 HTTP 서버입니다. GET /metrics에 응답합니다.
+    port가 0이면 빈 포트를 골라 port 속성에 기록합니다.
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional["ThreadingHTTPServer"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        백그라운드 스레드에서 HTTP 서버를 시작합니다.
+        """
+        if self._server is not None:
+            return
+        # 헤드리스 실행기의 시작 시간을 늘리지 않도록 서버를 켤 때만 import
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                # 수집 요청마다 표준 오류에 기록하지 않음
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        HTTP 서버를 중지합니다.
+        """
+        server, self._server = self._server, None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
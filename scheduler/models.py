@@ -1,9 +1,12 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
 import uuid
 
 ScheduleType = Literal["once", "daily", "weekly", "monthly", "interval"]
+# 놓친 실행 처리 방식: 건너뛰기, 한 번만 실행, 놓친 횟수만큼 실행(상한 있음)
+MisfirePolicy = Literal["skip", "run_once", "run_all"]
 
 class Task(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -17,7 +20,12 @@ class Task(BaseModel):
     enabled: bool = True
     last_run: Optional[str] = None  # 마지막 실행 시간
     next_run: Optional[str] = None  # 다음 실행 예정 시간
+    last_outcome: Optional[str] = None  # 마지막 실행 결과 ("started", "succeeded", "failed")
     interval_minutes: Optional[int] = None  # 주기적 실행 시 분 단위 간격
+    max_instances: Optional[int] = None  # 동시에 실행할 수 있는 최대 인스턴스 수 (None이면 제한 없음)
+    misfire_policy: MisfirePolicy = "skip"  # 실행 시각을 놓쳤을 때(절전, 프로그램 종료) 처리 방식
+    misfire_grace_seconds: Optional[int] = None  # 이 시간(초) 안의 지연은 정상 실행으로 처리 (None이면 스케줄러 기본값)
+    spread_seconds: Optional[int] = None  # 시작 시각을 작업 ID 해시로 이 구간(초) 안에서 늦춤 (None이면 스케줄러 기본값)
 
     def to_dict(self) -> dict:
         """
@@ -30,4 +38,77 @@ class Task(BaseModel):
         """
         사전 형태에서 Task 객체를 생성합니다.
         """
-        return cls(**data) 
\ No newline at end of file
+        return cls(**data) 
+
+
+@dataclass(slots=True, kw_only=True)
+class TaskRecord:
+    """
+    스케줄러와 저장소가 메모리에 보관하는 작업 레코드입니다. Task와 필드가 같지만 __slots__만 써서
+    pydantic 모델보다 작고, 만들거나 속성을 바꿀 때 검증 비용이 없습니다.
+    외부 입력(UI, 가져오기)은 Task로 검증한 뒤 from_task()로 바꾸고, 저장소가 직접 기록한 데이터만
+    from_dict()로 바로 읽습니다.
+    """
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    file_path: str
+    schedule_type: ScheduleType
+    time: Optional[str] = None
+    days: List[int] = field(default_factory=list)
+    date: Optional[int] = None
+    is_last_day_of_month: bool = False
+    enabled: bool = True
+    last_run: Optional[str] = None
+    next_run: Optional[str] = None
+    last_outcome: Optional[str] = None
+    interval_minutes: Optional[int] = None
+    max_instances: Optional[int] = None
+    misfire_policy: MisfirePolicy = "skip"
+    misfire_grace_seconds: Optional[int] = None
+    spread_seconds: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TaskRecord':
+        """
+        저장소가 기록한 사전에서 검증 없이 레코드를 만듭니다. 없는 필드는 기본값을 쓰고, 모르는 필드는 무시합니다.
+        """
+        try:
+            return cls(**data)
+        except TypeError:
+            return cls(**{name: value for name, value in data.items() if name in TASK_FIELDS})
+
+    @classmethod
+    def from_task(cls, task: Task) -> 'TaskRecord':
+        """
+        검증된 Task에서 레코드를 만듭니다.
+        """
+        record = cls(**task.__dict__)
+        record.days = list(record.days)
+        return record
+
+    def to_dict(self) -> dict:
+        """
+        레코드를 Task.to_dict()와 같은 형태의 사전으로 변환합니다.
+        """
+        data = {name: getattr(self, name) for name in TASK_FIELDS}
+        data["days"] = list(self.days)
+        return data
+
+    def copy(self) -> 'TaskRecord':
+        """
+        같은 값을 가진 새 레코드를 반환합니다. days 목록도 복사합니다.
+        """
+        return TaskRecord(**self.to_dict())
+
+
+# Task와 TaskRecord의 필드 이름 (to_dict() 키 순서)
+TASK_FIELDS = tuple(Task.model_fields)
+
+
+def as_record(task) -> TaskRecord:
+    """
+    Task는 레코드로 바꾸고, 이미 레코드면 그대로 반환합니다.
+    """
+    if isinstance(task, TaskRecord):
+        return task
+    return TaskRecord.from_task(task)
@@ -0,0 +1,280 @@
+import sys
+import threading
+import time
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from scheduler.metrics import DEFAULT_BUCKETS, FAST_BUCKETS, Histogram, MetricsRegistry
+
+if TYPE_CHECKING:
+    from cProfile import Profile
+
+logger = logging.getLogger("Scheduler")
+
+# 훅을 거는 스케줄러 메서드와 연산 이름
+SCHEDULER_OPERATIONS = {
+    "_schedule_task": "schedule_task",
+    "_run_task": "run_task",
+    "_update_next_run": "update_next_run",
+}
+# 훅을 거는 저장소 연산 (저장소에 있는 것만)
+STORAGE_OPERATIONS = (
+    "load_tasks", "snapshot", "save_tasks", "add_task", "update_task", "delete_task",
+    "add_tasks", "update_tasks", "delete_tasks", "update_run_state", "update_run_states",
+    "get_task_by_id", "get_enabled_tasks", "get_due_tasks", "compact", "flush",
+)
+
+# 연산 시작 전에 (연산 이름, 인자)로, 끝난 뒤에 (연산 이름, 걸린 시간(초), 예외 또는 None)으로 호출
+PreHook = Callable[[str, Tuple[Any, ...]], None]
+PostHook = Callable[[str, float, Optional[BaseException]], None]
+
+# 기본값인 sample은 모든 스레드의 스택을 표본 추출하므로 대기 중인 시간도 보임
+PROFILE_MODES = ("sample", "cprofile")
+
+
+class TimingHooks:
+    """
+    스케줄러의 실행 경로 메서드와 저장소 연산 앞뒤에 시간 측정 훅을 겁니다.
+    훅이 하나도 없으면 원래 메서드를 그대로 호출하므로 비용이 없습니다.
+    첫 훅을 등록할 때 인스턴스 속성으로 측정용 래퍼를 설치하고, 마지막 훅을 해제하면 제거합니다.
+    실행 중인 스케줄러에서 언제든 등록/해제할 수 있습니다.
+    """
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self._lock = threading.Lock()
+        # 래퍼가 호출할 때마다 읽는 (pre, post) 목록. 바꿀 때는 새 튜플로 교체
+        self._hooks: Tuple[Tuple[Optional[PreHook], Optional[PostHook]], ...] = ()
+        # 래퍼를 설치한 (대상 객체, 속성 이름, 원래 메서드, 래퍼)
+        self._installed: List[Tuple[object, str, Callable[..., Any], Callable[..., Any]]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._hooks)
+
+    def add(self, pre: Optional[PreHook] = None, post: Optional[PostHook] = None) -> Callable[[], None]:
+        """
+        훅을 등록합니다. 등록을 해제하는 함수를 반환합니다.
+        """
+        entry = (pre, post)
+        with self._lock:
+            self._hooks = (*self._hooks, entry)
+            if not self._installed:
+                self._install()
+        return lambda: self.remove(entry)
+
+    def remove(self, entry: Tuple[Optional[PreHook], Optional[PostHook]]) -> None:
+        """
+        add()로 등록한 (pre, post) 훅을 해제합니다.
+        """
+        with self._lock:
+            self._hooks = tuple(hook for hook in self._hooks if hook is not entry)
+            if not self._hooks and self._installed:
+                self._uninstall()
+
+    def _install(self) -> None:
+        scheduler = self.scheduler
+        for attr, operation in SCHEDULER_OPERATIONS.items():
+            self._patch(scheduler, attr, f"scheduler.{operation}")
+        storage = scheduler.storage
+        for attr in STORAGE_OPERATIONS:
+            if hasattr(storage, attr):
+                self._patch(storage, attr, f"storage.{attr}")
+        # 이미 등록된 타이머는 원래 _run_task를 들고 있으므로 콜백을 래퍼로 교체
+        original, wrapper = self._run_task_methods()
+        self._swap_callbacks(original, wrapper)
+
+    def _uninstall(self) -> None:
+        original, wrapper = self._run_task_methods()
+        self._swap_callbacks(wrapper, original)
+        for target, attr, _, _ in self._installed:
+            try:
+                delattr(target, attr)
+            except AttributeError:
+                pass
+        self._installed = []
+
+    def _patch(self, target: object, attr: str, operation: str) -> None:
+        original = getattr(target, attr)
+        wrapper = self._wrap(operation, original)
+        setattr(target, attr, wrapper)
+        self._installed.append((target, attr, original, wrapper))
+
+    def _run_task_methods(self) -> Tuple[Callable[..., Any], Callable[..., Any]]:
+        for target, attr, original, wrapper in self._installed:
+            if target is self.scheduler and attr == "_run_task":
+                return original, wrapper
+        raise RuntimeError("_run_task 래퍼가 설치되지 않았습니다.")
+
+    def _swap_callbacks(self, old: Callable[..., Any], new: Callable[..., Any]) -> None:
+        for handle in self.scheduler.jobs.all_handles():
+            if handle.callback == old:
+                handle.callback = new
+
+    def _wrap(self, operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            hooks = self._hooks
+            for pre, _ in hooks:
+                if pre is not None:
+                    _call_hook(pre, operation, args)
+            started = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                return method(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                for _, post in hooks:
+                    if post is not None:
+                        _call_hook(post, operation, elapsed, error)
+
+        traced.__wrapped__ = method
+        return traced
+
+
+def _call_hook(hook: Callable[..., None], *args: Any) -> None:
+    # 훅 예외로 작업 실행이나 저장이 실패하지 않도록 기록만 함
+    try:
+        hook(*args)
+    except Exception as e:
+        logger.error(f"시간 측정 훅 실행 실패: {e}")
+
+
+def metrics_hook(metrics: MetricsRegistry, name: str) -> PostHook:
+    """
+    연산별 걸린 시간을 scheduler_operation_seconds 히스토그램(operation 레이블)에 기록하는 훅을 만듭니다.
+    """
+    buckets = tuple(sorted(set(FAST_BUCKETS + DEFAULT_BUCKETS)))
+    histograms: Dict[str, Histogram] = {}
+
+    def observe(operation: str, elapsed: float, error: Optional[BaseException]) -> None:
+        histogram = histograms.get(operation)
+        if histogram is None:
+            histogram = metrics.histogram("scheduler_operation_seconds", "실행 경로와 저장소 연산에 걸린 시간",
+                                          buckets, operation=operation, scheduler=name)
+            histograms[operation] = histogram
+        histogram.observe(elapsed)
+
+    return observe
+
+
+class Profiler:
+    """
+    정해진 시간 동안만 프로파일을 수집해 파일로 남깁니다. 한 번에 하나만 수집합니다.
+    sample 모드(기본)는 모든 스레드의 스택을 interval초마다 표본 추출해 flamegraph용 접힌 스택 형식(.folded)으로,
+    cprofile 모드는 cProfile(.prof, pstats로 열기)로 기록합니다. Python 3.12부터 cProfile은 sys.monitoring으로
+    인터프리터의 모든 스레드에서 호출을 받지만, 수집을 시작할 때 이미 실행 중이던 함수(예: 작업자 스레드의
+    대기 루프) 자체는 기록되지 않고 그 안에서 새로 호출한 함수만 기록됩니다.
+    """
+
+    def __init__(self, output_dir: str = "profiles"):
+        self.output_dir = Path(output_dir)
+        self._lock = threading.Lock()
+        self._session: Optional[Tuple[str, Path, object]] = None
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def running(self) -> bool:
+        return self._session is not None
+
+    def start(self, seconds: float = 30.0, mode: str = "sample", interval: float = 0.005) -> Optional[Path]:
+        """
+        seconds초 동안 수집을 시작하고 기록할 파일 경로를 반환합니다. 이미 수집 중이면 None을 반환합니다.
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"알 수 없는 프로파일 방식: {mode} ({', '.join(PROFILE_MODES)})")
+        with self._lock:
+            if self._session is not None:
+                return None
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            suffix = ".prof" if mode == "cprofile" else ".folded"
+            path = self.output_dir / f"{mode}-{datetime.now().strftime('%Y%m%d-%H%M%S')}{suffix}"
+            if mode == "cprofile":
+                # 수집하지 않을 때 import 비용이 들지 않도록 시작할 때만 import
+                import cProfile
+                collector: object = cProfile.Profile()
+                collector.enable()
+            else:
+                collector = _WallClockSampler(interval)
+                collector.start()
+            self._session = (mode, path, collector)
+            self._timer = threading.Timer(seconds, self.stop)
+            self._timer.name = "Profiler"
+            self._timer.daemon = True
+            self._timer.start()
+        logger.info(f"프로파일 수집 시작 ({mode}, {seconds:g}초): {path}")
+        return path
+
+    def stop(self) -> Optional[Path]:
+        """
+        수집을 끝내고 파일을 기록합니다. 기록한 파일 경로를 반환하며, 수집 중이 아니면 None을 반환합니다.
+        """
+        with self._lock:
+            session, self._session = self._session, None
+            timer, self._timer = self._timer, None
+        if session is None:
+            return None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+
+        mode, path, collector = session
+        if mode == "cprofile":
+            profile: "Profile" = collector
+            profile.disable()
+            profile.dump_stats(str(path))
+        else:
+            collector.stop()
+            collector.write(path)
+        logger.info(f"프로파일을 기록했습니다: {path}")
+        return path
+
+
+class _WallClockSampler:
+    """
+    모든 스레드의 현재 스택을 주기적으로 표본 추출합니다. 대기 중인 스레드도 포함하므로 벽시계 기준입니다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="WallClockSampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def write(self, path: Path) -> None:
+        """
+        "스레드;바깥 함수;...;안쪽 함수 표본 수" 형식으로 기록합니다.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self._stacks.items(), key=lambda item: item[1], reverse=True):
+                f.write(f"{stack} {count}\n")
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack: List[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                stack.reverse()
+                key = ";".join(stack)
+                self._stacks[key] = self._stacks.get(key, 0) + 1
+            self.samples += 1
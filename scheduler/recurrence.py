@@ -0,0 +1,264 @@
+import calendar
+import zlib
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+from scheduler.models import Task
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Recurrence(ABC):
+    """
+    작업 일정에서 컴파일된 반복 규칙입니다. next_after(t)는 t 이후 첫 실행 시각을 반환합니다.
+    """
+    # 실행 시각이 이전 실행 시점에 따라 달라지면 True (캐시하지 않음)
+    anchored = False
+
+    @abstractmethod
+    def next_after(self, t: datetime) -> Optional[datetime]:
+        """
+        t 이후 첫 실행 시각을 반환합니다. 더 이상 실행할 시각이 없으면 None을 반환합니다.
+        """
+
+    def matches(self, day: date) -> bool:
+        """
+        주어진 날짜가 실행일인지 확인합니다.
+        """
+        return True
+
+
+class DailyRecurrence(Recurrence):
+    """
+    매일 같은 시각에 실행됩니다. 일회성 작업도 다음 도래 시각 계산에 사용합니다.
+    """
+
+    def __init__(self, at: time):
+        self.at = at
+
+    def next_after(self, t: datetime) -> Optional[datetime]:
+        candidate = datetime.combine(t.date(), self.at)
+        if candidate <= t:
+            candidate += timedelta(days=1)
+        return candidate
+
+
+class WeeklyRecurrence(Recurrence):
+    """
+    지정한 요일들(비트 마스크)의 같은 시각에 실행됩니다.
+    """
+
+    def __init__(self, at: time, weekday_mask: int):
+        self.at = at
+        self.weekday_mask = weekday_mask
+        # 요일별로 다음 실행 요일까지의 일 수 (1-7)
+        self._days_to_next = tuple(
+            next(k for k in range(1, 8) if weekday_mask >> ((weekday + k) % 7) & 1)
+            for weekday in range(7)
+        )
+
+    def matches(self, day: date) -> bool:
+        return bool(self.weekday_mask >> day.weekday() & 1)
+
+    def next_after(self, t: datetime) -> Optional[datetime]:
+        today = t.date()
+        if self.matches(today) and t.time() < self.at:
+            return datetime.combine(today, self.at)
+        return datetime.combine(today + timedelta(days=self._days_to_next[today.weekday()]), self.at)
+
+
+class MonthlyRecurrence(Recurrence):
+    """
+    매월 지정한 날짜 또는 마지막 날의 같은 시각에 실행됩니다.
+    해당 날짜가 없는 달(예: 31일이 없는 달)은 건너뜁니다.
+    """
+
+    def __init__(self, at: time, day: Optional[int], last_day: bool):
+        self.at = at
+        self.day = day
+        self.last_day = last_day
+
+    def _day_in(self, year: int, month: int) -> Optional[int]:
+        days_in_month = calendar.monthrange(year, month)[1]
+        if self.last_day:
+            return days_in_month
+        return self.day if self.day <= days_in_month else None
+
+    def matches(self, day: date) -> bool:
+        return self._day_in(day.year, day.month) == day.day
+
+    def next_after(self, t: datetime) -> Optional[datetime]:
+        year, month = t.year, t.month
+        # 어떤 날짜든 12개월 안에 한 번은 존재하므로 최대 13개월만 확인
+        for _ in range(13):
+            day = self._day_in(year, month)
+            if day is not None:
+                candidate = datetime.combine(date(year, month, day), self.at)
+                if candidate > t:
+                    return candidate
+            month += 1
+            if month > 12:
+                month = 1
+                year += 1
+        return None
+
+
+class IntervalRecurrence(Recurrence):
+    """
+    마지막 실행 시점부터 일정 간격마다 실행됩니다.
+    """
+    anchored = True
+
+    def __init__(self, minutes: int):
+        self.interval = timedelta(minutes=minutes)
+
+    def next_after(self, t: datetime) -> Optional[datetime]:
+        return t + self.interval
+
+
+class SpreadRecurrence(Recurrence):
+    """
+    기본 반복 규칙의 모든 실행 시각을 작업마다 고정된 오프셋만큼 늦춥니다.
+    같은 시각에 몰린 작업들의 시작 시각을 분산하는 데 사용합니다.
+    """
+
+    def __init__(self, base: Recurrence, offset: timedelta):
+        self.base = base
+        self.offset = offset
+
+    def matches(self, day: date) -> bool:
+        return self.base.matches(day)
+
+    def next_after(self, t: datetime) -> Optional[datetime]:
+        candidate = self.base.next_after(t - self.offset)
+        return candidate + self.offset if candidate is not None else None
+
+
+def spread_offset(task_id: str, window_seconds: int) -> int:
+    """
+    작업 ID의 해시로 [0, window_seconds) 범위의 오프셋(초)을 정합니다.
+    프로세스나 재시작과 관계없이 같은 작업은 항상 같은 오프셋을 가집니다.
+    """
+    if window_seconds <= 1:
+        return 0
+    return zlib.crc32(task_id.encode("utf-8")) % window_seconds
+
+
+def _parse_time(value: str) -> time:
+    hours, minutes, seconds = value.split(":")
+    return time(int(hours), int(minutes), int(seconds))
+
+
+def recurrence_key(task: Task) -> Tuple:
+    """
+    반복 규칙을 결정하는 작업 필드들을 반환합니다.
+    """
+    return (task.schedule_type, task.time, tuple(sorted(task.days)), task.date,
+            task.is_last_day_of_month, task.interval_minutes)
+
+
+def task_spread(task: Task, spread_seconds: int = 0) -> int:
+    """
+    작업의 시작 시각 분산 오프셋(초)을 반환합니다.
+    작업에 spread_seconds가 지정되어 있으면 그 값을, 없으면 스케줄러 전체 값을 분산 구간으로 사용합니다.
+    """
+    window = task.spread_seconds if task.spread_seconds is not None else spread_seconds
+    return spread_offset(task.id, window)
+
+
+@lru_cache(maxsize=4096)
+def _compile(key: Tuple) -> Optional[Recurrence]:
+    schedule_type, at, days, day_of_month, last_day, interval_minutes = key
+    if schedule_type == "interval":
+        return IntervalRecurrence(interval_minutes) if interval_minutes else None
+    if not at:
+        return None
+
+    at_time = _parse_time(at)
+    if schedule_type in ("once", "daily"):
+        return DailyRecurrence(at_time)
+    if schedule_type == "weekly":
+        mask = 0
+        for day in days:
+            if 0 <= day < 7:
+                mask |= 1 << day
+        return WeeklyRecurrence(at_time, mask) if mask else None
+    if schedule_type == "monthly":
+        if last_day or day_of_month:
+            return MonthlyRecurrence(at_time, day_of_month, last_day)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _compile_spread(key: Tuple, offset: int) -> Optional[Recurrence]:
+    recurrence = _compile(key)
+    if recurrence is None or offset == 0 or recurrence.anchored:
+        # 주기적 작업은 마지막 실행 시점 기준이므로 분산하지 않음
+        return recurrence
+    return SpreadRecurrence(recurrence, timedelta(seconds=offset))
+
+
+def compile_recurrence(task: Task, spread_seconds: int = 0) -> Optional[Recurrence]:
+    """
+    작업의 반복 규칙을 컴파일합니다. 같은 일정과 같은 분산 오프셋의 작업은 같은 객체를 공유합니다.
+    일정 정보가 부족하면 None을 반환합니다.
+    """
+    return _compile_spread(recurrence_key(task), task_spread(task, spread_seconds))
+
+
+class RecurrenceCache:
+    """
+    작업별로 계산한 다음 실행 시각을 작업 일정이 바뀌거나 그 시각이 지날 때까지 캐시합니다.
+    spread_seconds는 작업에 분산 구간이 없을 때 사용할 전체 분산 구간(초)입니다.
+    """
+
+    def __init__(self, spread_seconds: int = 0):
+        self.spread_seconds = spread_seconds
+        # task_id -> ((반복 규칙 키, 분산 오프셋), 계산 기준 시각, 다음 실행 시각)
+        self._entries: Dict[str, Tuple[Tuple, datetime, Optional[datetime]]] = {}
+
+    def next_run(self, task: Task, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        now 이후 작업의 다음 실행 시각을 반환합니다.
+        """
+        now = now or datetime.now()
+        key = (recurrence_key(task), task_spread(task, self.spread_seconds))
+        entry = self._entries.get(task.id)
+        if entry is not None and entry[0] == key and entry[1] <= now and (entry[2] is None or now < entry[2]):
+            return entry[2]
+
+        recurrence = _compile_spread(*key)
+        next_time = recurrence.next_after(now) if recurrence else None
+        if recurrence is not None and not recurrence.anchored:
+            self._entries[task.id] = (key, now, next_time)
+        return next_time
+
+    def next_runs(self, tasks: Iterable[Task], now: Optional[datetime] = None) -> Dict[str, Optional[datetime]]:
+        """
+        여러 작업의 다음 실행 시각을 한 번에 계산합니다. 같은 일정은 한 번만 계산합니다.
+        """
+        now = now or datetime.now()
+        by_recurrence: Dict[int, Optional[datetime]] = {}
+        result: Dict[str, Optional[datetime]] = {}
+        for task in tasks:
+            key = (recurrence_key(task), task_spread(task, self.spread_seconds))
+            recurrence = _compile_spread(*key)
+            if recurrence is None:
+                result[task.id] = None
+                continue
+            marker = id(recurrence)
+            if marker not in by_recurrence:
+                by_recurrence[marker] = recurrence.next_after(now)
+            next_time = by_recurrence[marker]
+            if not recurrence.anchored:
+                self._entries[task.id] = (key, now, next_time)
+            result[task.id] = next_time
+        return result
+
+    def invalidate(self, task_id: str) -> None:
+        """
+        작업의 캐시를 지웁니다.
+        """
+        self._entries.pop(task_id, None)
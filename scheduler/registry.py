@@ -0,0 +1,71 @@
+import threading
+from typing import Dict, List, Set
+
+from scheduler.engine import TimerHandle
+
+
+class JobRegistry:
+    """
+    작업 ID별로 등록된 타이머 핸들 집합을 보관합니다.
+    취소와 재등록은 해당 작업의 핸들 수에만 비례합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handles: Dict[str, Set[TimerHandle]] = {}
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._handles
+
+    def __len__(self) -> int:
+        """
+        타이머가 등록된 작업 수를 반환합니다.
+        """
+        return len(self._handles)
+
+    def add(self, task_id: str, handle: TimerHandle) -> None:
+        """
+        작업의 타이머 핸들을 등록합니다.
+        """
+        with self._lock:
+            self._handles.setdefault(task_id, set()).add(handle)
+
+    def cancel(self, task_id: str) -> int:
+        """
+        작업의 모든 타이머를 취소합니다. 취소한 핸들 수를 반환합니다.
+        """
+        with self._lock:
+            handles = self._handles.pop(task_id, ())
+        for handle in handles:
+            handle.cancel()
+        return len(handles)
+
+    def task_ids(self) -> List[str]:
+        """
+        타이머가 등록된 작업 ID 목록을 반환합니다.
+        """
+        with self._lock:
+            return list(self._handles)
+
+    def handles(self, task_id: str) -> Set[TimerHandle]:
+        """
+        작업에 등록된 타이머 핸들 집합의 복사본을 반환합니다.
+        """
+        with self._lock:
+            return set(self._handles.get(task_id, ()))
+
+    def all_handles(self) -> List[TimerHandle]:
+        """
+        등록된 모든 타이머 핸들 목록을 반환합니다.
+        """
+        with self._lock:
+            return [handle for handles in self._handles.values() for handle in handles]
+
+    def job_count(self) -> int:
+        """
+        등록된 전체 타이머 핸들 수를 반환합니다. 취소된 핸들은 제외합니다.
+        """
+        with self._lock:
+            return sum(
+                1 for handles in self._handles.values() for handle in handles if not handle.cancelled
+            )
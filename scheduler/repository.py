@@ -0,0 +1,140 @@
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from scheduler.models import TaskRecord
+
+# 색인 키: (enabled, schedule_type, next_run)
+IndexKey = Tuple[bool, str, Optional[str]]
+
+
+class TaskRepository:
+    """
+    작업을 ID 기준 사전으로 보관하는 메모리 저장소입니다.
+    enabled, schedule_type, next_run에 대한 보조 색인을 유지합니다.
+    보관한 레코드는 밖으로 내보내지 않습니다. 넣을 때와 꺼낼 때 모두 복사하므로 호출한 쪽이 레코드를
+    고쳐도 색인이 어긋나지 않으며, 저장된 값은 put()과 set_run_state()로만 바뀝니다.
+    """
+
+    def __init__(self, tasks: Iterable[TaskRecord] = ()):
+        self._tasks: Dict[str, TaskRecord] = {}
+        self._keys: Dict[str, IndexKey] = {}
+        self._by_enabled: Dict[bool, Set[str]] = {True: set(), False: set()}
+        self._by_type: Dict[str, Set[str]] = {}
+        # (next_run, id) 정렬 목록. next_run 문자열은 사전순이 시간순과 같음
+        self._by_next_run: List[Tuple[str, str]] = []
+        self.replace_all(tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+
+    def replace_all(self, tasks: Iterable[TaskRecord], owned: bool = False) -> None:
+        """
+        저장소 내용을 주어진 작업 목록으로 교체합니다.
+        owned가 True면 호출한 쪽이 더 이상 쓰지 않는 레코드이므로 복사하지 않고 그대로 보관합니다.
+        """
+        self._tasks.clear()
+        self._keys.clear()
+        self._by_enabled = {True: set(), False: set()}
+        self._by_type.clear()
+        self._by_next_run.clear()
+        for task in tasks:
+            self._store(task if owned else task.copy())
+
+    def get(self, task_id: str) -> Optional[TaskRecord]:
+        """
+        ID로 작업을 찾아 복사본을 반환합니다.
+        """
+        task = self._tasks.get(task_id)
+        return task.copy() if task is not None else None
+
+    def all(self) -> List[TaskRecord]:
+        """
+        저장된 순서대로 모든 작업의 복사본을 반환합니다.
+        """
+        return [task.copy() for task in self._tasks.values()]
+
+    def to_dicts(self) -> List[dict]:
+        """
+        저장된 순서대로 모든 작업을 사전으로 반환합니다. (파일 기록용)
+        """
+        return [task.to_dict() for task in self._tasks.values()]
+
+    def put(self, task: TaskRecord) -> None:
+        """
+        작업의 복사본을 추가하거나 교체하고 색인을 갱신합니다.
+        """
+        self._store(task.copy())
+
+    def set_run_state(self, task_id: str, last_run: Optional[str], next_run: Optional[str],
+                      outcome: Optional[str] = None) -> bool:
+        """
+        저장된 작업의 실행 상태를 바꾸고 색인을 갱신합니다. outcome이 None이면 마지막 실행 결과는 유지합니다.
+        작업이 없으면 False를 반환합니다.
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            return False
+        self._unindex(task_id)
+        task.last_run = last_run
+        task.next_run = next_run
+        if outcome is not None:
+            task.last_outcome = outcome
+        self._index(task)
+        return True
+
+    def remove(self, task_id: str) -> bool:
+        """
+        작업을 제거합니다. 성공 시 True, 없으면 False를 반환합니다.
+        """
+        if task_id not in self._tasks:
+            return False
+        self._unindex(task_id)
+        del self._tasks[task_id]
+        return True
+
+    def enabled(self, enabled: bool = True) -> List[TaskRecord]:
+        """
+        활성화 상태가 일치하는 작업의 복사본을 반환합니다.
+        """
+        return [self._tasks[task_id].copy() for task_id in self._by_enabled[enabled]]
+
+    def by_schedule_type(self, schedule_type: str) -> List[TaskRecord]:
+        """
+        일정 유형이 일치하는 작업의 복사본을 반환합니다.
+        """
+        return [self._tasks[task_id].copy() for task_id in self._by_type.get(schedule_type, ())]
+
+    def due_before(self, next_run: str) -> List[TaskRecord]:
+        """
+        다음 실행 시간이 주어진 시각("%Y-%m-%d %H:%M:%S")보다 이른 작업의 복사본을 시간순으로 반환합니다.
+        """
+        end = bisect_left(self._by_next_run, (next_run, ""))
+        return [self._tasks[task_id].copy() for _, task_id in self._by_next_run[:end]]
+
+    def _store(self, task: TaskRecord) -> None:
+        self._unindex(task.id)
+        self._tasks[task.id] = task
+        self._index(task)
+
+    def _index(self, task: TaskRecord) -> None:
+        key = (task.enabled, task.schedule_type, task.next_run)
+        self._keys[task.id] = key
+        self._by_enabled[task.enabled].add(task.id)
+        self._by_type.setdefault(task.schedule_type, set()).add(task.id)
+        if task.next_run:
+            insort(self._by_next_run, (task.next_run, task.id))
+
+    def _unindex(self, task_id: str) -> None:
+        key = self._keys.pop(task_id, None)
+        if key is None:
+            return
+        enabled, schedule_type, next_run = key
+        self._by_enabled[enabled].discard(task_id)
+        self._by_type[schedule_type].discard(task_id)
+        if next_run:
+            i = bisect_left(self._by_next_run, (next_run, task_id))
+            if i < len(self._by_next_run) and self._by_next_run[i] == (next_run, task_id):
+                del self._by_next_run[i]
@@ -1,28 +1,107 @@
-import schedule
-import time
-import threading
-import subprocess
 import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple
 
-from scheduler.models import Task
+from scheduler.clock import SYSTEM_CLOCK, Clock
+from scheduler.engine import TimerEngine, TimerHandle
+from scheduler.events import RUN_FINISHED
+from scheduler.executor import LaunchExecutor
+from scheduler.forecast import ForecastIndex, iter_occurrences
+from scheduler.history import RunHistory, RunRecord
+from scheduler.metrics import FAST_BUCKETS, REGISTRY, MetricsRegistry
+from scheduler.models import Task, TaskRecord, as_record
+from scheduler.profiling import TimingHooks
+from scheduler.recurrence import TIME_FORMAT, RecurrenceCache, compile_recurrence
+from scheduler.registry import JobRegistry
 from scheduler.storage import Storage
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='scheduler.log'
-)
+# 로그 설정은 실행 진입점(main.py, python -m scheduler)에서 합니다
 logger = logging.getLogger("Scheduler")
 
+# 타이머가 이보다 적게 늦게 실행되면 놓친 실행으로 보지 않음(초)
+MISFIRE_THRESHOLD_SECONDS = 1.0
+
 class Scheduler:
-    def __init__(self, storage: Storage):
+    def __init__(self, storage: Storage, history: Optional[RunHistory] = None,
+                 max_workers: int = 4, max_processes: int = 64, name: str = "default",
+                 misfire_grace_seconds: float = 0.0, max_catchup_runs: int = 10, catchup_rate: float = 2.0,
+                 spread_seconds: int = 0, metrics: Optional[MetricsRegistry] = None, clock: Clock = SYSTEM_CLOCK):
+        """
+        name은 한 프로세스에서 여러 스케줄러를 실행할 때 로그와 스레드 이름을 구분하는 데 사용합니다.
+        타이머, 작업 목록, 실행기는 모두 인스턴스마다 따로 가집니다.
+
+        misfire_grace_seconds는 작업에 지정하지 않았을 때의 놓친 실행 허용 시간(초),
+        max_catchup_runs는 run_all 정책에서 한 번에 따라잡을 최대 실행 횟수,
+        catchup_rate는 따라잡기 실행을 초당 몇 개까지 시작할지입니다.
+        spread_seconds는 작업에 지정하지 않았을 때 시작 시각을 분산할 구간(초)입니다.
+        metrics를 지정하지 않으면 프로세스 기본 지표 저장소(metrics.REGISTRY)에 scheduler=name 레이블로 기록합니다.
+        clock은 현재 시각을 얻는 시계입니다. 시뮬레이션에서는 가상 시계(clock.VirtualClock)를 지정합니다.
+        """
+        self.name = name
+        self.clock = clock
+        self.logger = logger.getChild(name)
         self.storage = storage
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self._init_metrics()
+        # 저장소의 이벤트 버스를 함께 사용해 작업 변경과 실행 완료를 한 곳에서 구독
+        self.events = storage.events
+        self.history = history if history is not None else RunHistory(str(Path(storage.data_dir) / "history"))
+        # 프로세스 실행은 디스패치 스레드가 아닌 실행기 스레드에서 처리
+        self.executor = self._create_executor(max_workers, max_processes)
         self.running = False
-        self.thread = None
-        self.jobs: Dict[str, schedule.Job] = {}
+        self.engine = TimerEngine(name=f"{name}-timer", fire_lag=self._fire_lag, clock=clock)
+        self.jobs = JobRegistry()
+        self.spread_seconds = spread_seconds
+        self.recurrences = RecurrenceCache(spread_seconds)
+        self.forecast = ForecastIndex(spread_seconds=spread_seconds, clock=clock)
+        
+        self.misfire_grace_seconds = misfire_grace_seconds
+        self.max_catchup_runs = max_catchup_runs
+        self.catchup_rate = catchup_rate
+        # 실행 경로와 저장소 연산의 시간 측정 훅 (등록하지 않으면 비용 없음)
+        self.hooks = TimingHooks(self)
+        # 놓친 실행을 따라잡기 위해 대기 중인 작업과, 이를 일정 속도로 꺼내는 타이머
+        self._catchup: Deque[TaskRecord] = deque()
+        self._catchup_lock = threading.Lock()
+        self._catchup_timer: Optional[TimerHandle] = None
+    
+    def _create_executor(self, max_workers: int, max_processes: int) -> Optional[LaunchExecutor]:
+        """
+        프로세스 실행기를 만듭니다. 프로세스를 직접 실행하는 하위 클래스는 None을 반환합니다.
+        """
+        return LaunchExecutor(
+            self._on_task_launched, self._on_task_exited, self._on_task_failed,
+            max_workers=max_workers, max_processes=max_processes, name=f"{self.name}-launcher",
+            popen_latency=self._popen_latency
+        )
     
+    def _init_metrics(self) -> None:
+        """
+        실행 경로에서 쓸 지표 객체를 미리 만들어 둡니다. 게이지는 수집할 때만 값을 계산합니다.
+        """
+        metrics, name = self.metrics, self.name
+        self._fire_lag = metrics.histogram(
+            "scheduler_fire_lag_seconds", "타이머가 예정 시각보다 늦게 실행된 시간", scheduler=name)
+        self._popen_latency = metrics.histogram(
+            "scheduler_popen_latency_seconds", "작업 프로세스 생성(Popen)에 걸린 시간", scheduler=name)
+        self._next_run_seconds = metrics.histogram(
+            "scheduler_update_next_run_seconds", "다음 실행 시각 계산에 걸린 시간", FAST_BUCKETS, scheduler=name)
+        self._launches = metrics.counter("scheduler_launches_total", "시작한 작업 프로세스 수", scheduler=name)
+        self._launch_failures = metrics.counter(
+            "scheduler_launch_failures_total", "시작하지 못한 작업 실행 수", scheduler=name)
+        self._skipped_runs = metrics.counter(
+            "scheduler_skipped_runs_total", "놓친 실행 정책이나 최대 인스턴스 수 때문에 건너뛴 실행 수", scheduler=name)
+        metrics.gauge("scheduler_running_processes", "실행 중인 작업 프로세스 수",
+                      scheduler=name).set_function(self.running_count)
+        metrics.gauge("scheduler_pending_launches", "시작을 기다리는 실행 요청 수",
+                      scheduler=name).set_function(self._pending_launches)
+        metrics.gauge("scheduler_scheduled_tasks", "타이머에 등록된 작업 수",
+                      scheduler=name).set_function(lambda: len(self.jobs))
+
     def start(self) -> None:
         """
         스케줄러를 시작합니다.
@@ -33,63 +112,78 @@ class Scheduler:
         self.running = True
         self._load_tasks()
         
-        # 백그라운드 스레드에서 스케줄러 실행
-        self.thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        self.thread.start()
-        logger.info("스케줄러가 시작되었습니다.")
+        # 백그라운드 스레드에서 타이머 엔진 실행
+        self.engine.start()
+        self.logger.info("스케줄러가 시작되었습니다.")
     
     def stop(self) -> None:
         """
         스케줄러를 중지합니다.
         """
         self.running = False
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=1.0)
-        logger.info("스케줄러가 중지되었습니다.")
+        self.engine.stop(timeout=1.0)
+        self.executor.shutdown()
+        # 지연 기록 중인 변경 사항을 잃지 않도록 즉시 기록
+        self.storage.flush()
+        self.history.close()
+        self.logger.info("스케줄러가 중지되었습니다.")
     
-    def _run_scheduler(self) -> None:
+    def reload(self) -> None:
         """
-        스케줄러 실행 루프
+        저장소를 다시 읽어 모든 작업을 다시 스케줄링합니다. (외부에서 작업 파일을 수정한 경우)
         """
-        while self.running:
-            schedule.run_pending()
-            time.sleep(1)
+        self._unschedule_tasks(self.jobs.task_ids())
+        self._load_tasks()
+        self.logger.info(f"작업 목록을 다시 불러왔습니다. (작업 {len(self.jobs)}개)")
     
     def _load_tasks(self) -> None:
         """
         저장소에서 작업을 로드하고 스케줄링합니다.
         """
-        tasks = self.storage.load_tasks()
-        for task in tasks:
-            if task.enabled:
-                self._schedule_task(task)
-                # 업데이트된 다음 실행 시간을 저장소에 저장
-                self.storage.update_task(task)
+        self._restore_tasks(self.storage.get_enabled_tasks())
+    
+    def _restore_tasks(self, tasks: List[TaskRecord]) -> None:
+        """
+        저장된 작업을 스케줄링합니다. 꺼져 있던 동안 놓친 실행은 작업의 놓친 실행 정책에 따라 따라잡습니다.
+        """
+        now = self.clock.now()
+        # 꺼져 있던 동안 놓친 실행은 저장된 next_run을 기준으로 계산하므로 스케줄링 전에 구함
+        catchup = [(task, self._misfire_runs(task, now)[1]) for task in tasks]
+        self._schedule_tasks(tasks)
+        # 업데이트된 다음 실행 시간을 실행 상태 저널에 한 번에 기록
+        self.storage.update_run_states(tasks)
+        for task, runs in catchup:
+            if runs:
+                self._queue_catchup(task, runs)
     
     def add_task(self, task: Task) -> None:
         """
-        새 작업을 추가하고 스케줄링합니다.
+        새 작업을 추가하고 스케줄링합니다. 스케줄러와 저장소는 작업을 TaskRecord로 바꿔 보관합니다.
         """
-        self.storage.add_task(task)
+        task = as_record(task)
+        # 다음 실행 시간을 먼저 계산해 한 번에 저장
         if task.enabled:
             self._schedule_task(task)
-            # 업데이트된 다음 실행 시간을 저장소에 저장
-            self.storage.update_task(task)
+        self.storage.add_task(task)
     
     def update_task(self, task: Task) -> bool:
         """
         작업을 업데이트하고 스케줄을 재조정합니다.
         """
-        # 이전 작업의 스케줄 취소
-        self._unschedule_task(task.id)
-        
-        # 작업 업데이트
-        success = self.storage.update_task(task)
+        task = as_record(task)
+        if self.storage.get_task_by_id(task.id) is None:
+            return False
         
-        # 업데이트된 작업 다시 스케줄링
-        if success and task.enabled:
+        # add_task와 같이 다음 실행 시간을 먼저 계산한 뒤 저장 (저장소의 next_run과 색인이 최신이 되도록)
+        if task.enabled:
             self._schedule_task(task)
-            
+        else:
+            self._unschedule_task(task.id)
+        
+        success = self.storage.update_task(task)
+        if not success:
+            # 확인한 뒤 다른 곳에서 삭제됨
+            self._unschedule_task(task.id)
         return success
     
     def delete_task(self, task_id: str) -> bool:
@@ -97,6 +191,7 @@ class Scheduler:
         작업을 삭제하고 스케줄을 취소합니다.
         """
         self._unschedule_task(task_id)
+        self.history.forget(task_id)
         return self.storage.delete_task(task_id)
     
     def toggle_task(self, task_id: str, enabled: bool) -> bool:
@@ -116,292 +211,404 @@ class Scheduler:
             
         return self.storage.update_task(task)
     
-    def _schedule_task(self, task: Task) -> None:
+    def add_tasks(self, tasks: List[Task]) -> None:
         """
-        작업을 스케줄링합니다.
+        여러 작업을 추가합니다. 먼저 모두 검사하고, 한 번에 스케줄링한 뒤 저장소에는 한 번만 기록합니다.
         """
-        # 이미 스케줄된 작업이면 취소
-        self._unschedule_task(task.id)
+        tasks = [as_record(task) for task in tasks]
+        self._validate_tasks(tasks, existing=False)
+        self._schedule_tasks([task for task in tasks if task.enabled])
+        self.storage.add_tasks(tasks)
+        self.logger.info(f"작업 {len(tasks)}개를 추가했습니다.")
+    
+    def update_tasks(self, tasks: List[Task]) -> None:
+        """
+        여러 작업을 업데이트합니다. 먼저 모두 검사하고, 한 번에 다시 스케줄링한 뒤 저장소에는 한 번만 기록합니다.
+        """
+        tasks = [as_record(task) for task in tasks]
+        self._validate_tasks(tasks, existing=True)
+        self._unschedule_tasks([task.id for task in tasks])
+        self._schedule_tasks([task for task in tasks if task.enabled])
+        self.storage.update_tasks(tasks)
+        self.logger.info(f"작업 {len(tasks)}개를 업데이트했습니다.")
+    
+    def upsert_tasks(self, tasks: List[Task]) -> Tuple[int, int]:
+        """
+        여러 작업을 추가하거나 업데이트합니다. 이미 있는 ID는 업데이트하고 나머지는 추가합니다.
+        먼저 모두 검사하고, 한 번에 스케줄링한 뒤 저장소에는 한 번만 기록합니다. (추가한 수, 업데이트한 수)를 반환합니다.
+        """
+        tasks = [as_record(task) for task in tasks]
+        self._validate_tasks(tasks, existing=None)
+        self._unschedule_tasks([task.id for task in tasks])
+        self._schedule_tasks([task for task in tasks if task.enabled])
+        added, updated = self.storage.upsert_tasks(tasks)
+        self.logger.info(f"작업 {added}개를 추가하고 {updated}개를 업데이트했습니다.")
+        return added, updated
+    
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """
+        여러 작업을 삭제합니다. 삭제한 작업 수를 반환합니다.
+        """
+        self._unschedule_tasks(task_ids)
+        for task_id in task_ids:
+            self.history.forget(task_id)
+        deleted = self.storage.delete_tasks(task_ids)
+        self.logger.info(f"작업 {deleted}개를 삭제했습니다.")
+        return deleted
+    
+    def set_enabled(self, task_ids: List[str], enabled: bool) -> None:
+        """
+        여러 작업의 활성화 상태를 한 번에 바꿉니다. 하나라도 올바르지 않으면 아무것도 바꾸지 않고 ValueError를 발생시킵니다.
+        """
+        tasks = {task.id: task for task in self.storage.snapshot()}
+        missing = [task_id for task_id in task_ids if task_id not in tasks]
+        if missing:
+            raise ValueError(f"없는 작업 {len(missing)}개: {', '.join(missing[:10])}")
         
-        job = None
+        # 저장소가 돌려준 복사본을 바꿔 모두 검사한 뒤에만 스케줄링하고 저장
+        selected = [tasks[task_id] for task_id in task_ids]
+        for task in selected:
+            task.enabled = enabled
+        if enabled:
+            self._validate_tasks(selected, existing=True)
+            self._schedule_tasks(selected)
+        else:
+            self._unschedule_tasks(task_ids)
+        self.storage.update_tasks(selected)
+    
+    def next_occurrences(self, task_id: str, n: int = 10) -> List[datetime]:
+        """
+        작업의 앞으로의 실행 시각을 최대 n개 반환합니다.
+        """
+        task = self.storage.get_task_by_id(task_id)
+        if not task or not task.enabled:
+            return []
+        return iter_occurrences(task, self.clock.now(), limit=n, spread_seconds=self.spread_seconds)
+    
+    def occurrences_between(self, start: datetime, end: datetime) -> List[Tuple[datetime, str]]:
+        """
+        [start, end) 범위에 실행될 모든 (실행 시각, 작업 ID)를 시간순으로 반환합니다.
+        """
+        return self.forecast.between(start, end)
+    
+    def launch_histogram(self, start: datetime, end: datetime,
+                         bucket: timedelta = timedelta(minutes=1)) -> List[Tuple[datetime, int]]:
+        """
+        [start, end) 범위의 구간별(기본 1분) 실행 예정 횟수를 반환합니다.
+        """
+        return self.forecast.histogram(start, end, bucket)
+    
+    def job_counts(self) -> Dict[str, int]:
+        """
+        등록된 작업 수, 타이머 핸들 수, 엔진에 살아 있는 타이머 수를 반환합니다.
+        핸들 수와 엔진 타이머 수가 다르면 취소되지 않은 핸들이 새고 있는 것입니다.
+        """
+        return {
+            "tasks": len(self.jobs),
+            "handles": self.jobs.job_count(),
+            "timers": len(self.engine),
+        }
+    
+    def _schedule_task(self, task: TaskRecord, forecast: bool = True,
+                       first_run: Optional[datetime] = None) -> None:
+        """
+        작업을 스케줄링합니다. forecast가 False면 실행 예정 색인은 호출한 쪽에서 한 번에 갱신합니다.
+        first_run은 호출한 쪽에서 이미 계산한 다음 실행 시각입니다. 없으면 여기서 계산합니다.
+        """
+        # 이미 스케줄된 작업이면 타이머만 취소 (다음 실행 시각 캐시는 일정이 같을 때만 쓰이므로 유지)
+        self.jobs.cancel(task.id)
+        if forecast:
+            self.forecast.remove(task.id)
         
-        if task.schedule_type == "interval" and task.interval_minutes:
-            # 주기적 실행 작업 (분 단위)
-            interval_minutes = task.interval_minutes
-            job = schedule.every(interval_minutes).minutes.do(self._run_task, task)
-            self.jobs[task.id] = job
-            
-            # 다음 실행 시간 업데이트
-            self._update_next_run(task)
+        recurrence = compile_recurrence(task, self.spread_seconds)
+        if recurrence is None:
+            self.logger.error(f"작업의 실행 일정이 올바르지 않습니다: {task.name}")
             return
         
-        # 다른 일정 유형들은 time 필드가 필요함
-        if not task.time:
-            logger.error(f"작업에 실행 시간이 지정되지 않았습니다: {task.name}")
+        # 작업마다 타이머 하나만 등록하고, 실제 실행일에만 깨어나도록 반복 규칙으로 다음 시각을 계산
+        if first_run is None:
+            first_run = self.recurrences.next_run(task, self.clock.now())
+        if first_run is None:
+            task.next_run = None
+            self.logger.warning(f"다음 실행 시간을 계산할 수 없습니다: {task.name}")
             return
-            
-        hours, minutes, seconds = task.time.split(":")
-        time_str = f"{hours.zfill(2)}:{minutes.zfill(2)}:{seconds.zfill(2)}"
-        
         if task.schedule_type == "once":
-            # 일회성 작업
-            target_time = datetime.strptime(f"{datetime.now().date()} {time_str}", "%Y-%m-%d %H:%M:%S")
-            if target_time < datetime.now():
-                # 이미 지난 시간이면 다음 날로 설정
-                target_time += timedelta(days=1)
-            
-            # 스케줄 라이브러리는 일회성 작업을 직접 지원하지 않으므로
-            # 매일 실행으로 설정하고 실행 후 비활성화
-            job = schedule.every().day.at(time_str).do(self._run_and_disable, task)
-            
-        elif task.schedule_type == "daily":
-            # 매일 실행
-            job = schedule.every().day.at(time_str).do(self._run_task, task)
-            
-        elif task.schedule_type == "weekly":
-            # 매주 특정 요일에 실행
-            for day in task.days:
-                weekday = self._get_weekday_name(day)
-                weekday_job = getattr(schedule.every(), weekday).at(time_str).do(self._run_task, task)
-                self.jobs[f"{task.id}_{day}"] = weekday_job
-            
-        elif task.schedule_type == "monthly":
-            # 매월 특정 날짜에 실행
-            if task.date:
-                # schedule 라이브러리는 월간 작업을 직접 지원하지 않으므로
-                # 매일 검사하여 날짜가 맞으면 실행
-                job = schedule.every().day.at(time_str).do(self._check_and_run_monthly, task)
-        
-        if job and task.schedule_type != "weekly":
-            self.jobs[task.id] = job
+            # 일회성 작업은 실행 후 비활성화
+            self.jobs.add(task.id, self.engine.call_at(first_run, self._run_and_disable, task))
+        else:
+            self.jobs.add(task.id, self.engine.call_at(first_run, self._run_task, task, recurrence=recurrence))
             
-        # 다음 실행 시간 업데이트
-        self._update_next_run(task)
+        # 타이머 시각이 곧 다음 실행 시간
+        task.next_run = first_run.strftime(TIME_FORMAT)
+        if forecast:
+            self.forecast.update(task)
+    
+    def _schedule_tasks(self, tasks: List[TaskRecord]) -> None:
+        """
+        여러 작업을 스케줄링합니다. 같은 일정의 다음 실행 시각은 한 번만 계산하고,
+        실행 예정 색인은 모든 작업을 모아 한 번에 정렬합니다.
+        """
+        first_runs = self.recurrences.next_runs(tasks, self.clock.now())
+        for task in tasks:
+            self._schedule_task(task, forecast=False, first_run=first_runs.get(task.id))
+        self.forecast.update_many(tasks)
+    
+    def _validate_tasks(self, tasks: List[TaskRecord], existing: Optional[bool]) -> None:
+        """
+        일괄 변경 전에 모든 작업을 검사합니다. 문제가 있으면 아무것도 바꾸지 않고 ValueError를 발생시킵니다.
+        existing이 True면 저장소에 있어야 하고, False면 없어야 하며, None이면 확인하지 않습니다.
+        """
+        stored = {task.id for task in self.storage.snapshot()}
+        seen = set()
+        errors: List[str] = []
+        for task in tasks:
+            if task.id in seen:
+                errors.append(f"중복된 작업 ID: {task.id}")
+            seen.add(task.id)
+            if existing and task.id not in stored:
+                errors.append(f"없는 작업: {task.id}")
+            elif existing is False and task.id in stored:
+                errors.append(f"이미 있는 작업: {task.id}")
+            if task.enabled and compile_recurrence(task, self.spread_seconds) is None:
+                errors.append(f"실행 일정이 올바르지 않습니다: {task.name}")
+        if errors:
+            raise ValueError(f"작업 {len(errors)}건이 올바르지 않습니다: " + "; ".join(errors[:10]))
     
     def _unschedule_task(self, task_id: str) -> None:
         """
-        작업의 스케줄을 취소합니다.
+        작업의 스케줄을 취소하고 다음 실행 시각 캐시를 지웁니다.
+        """
+        self.forecast.remove(task_id)
+        self.jobs.cancel(task_id)
+        self.recurrences.invalidate(task_id)
+    
+    def _unschedule_tasks(self, task_ids: List[str]) -> None:
+        """
+        여러 작업의 스케줄을 취소합니다. 실행 예정 색인에서는 한 번에 제거합니다.
         """
-        # 기본 작업 ID로 스케줄 취소
-        if task_id in self.jobs:
-            schedule.cancel_job(self.jobs[task_id])
-            del self.jobs[task_id]
+        self.forecast.remove_many(set(task_ids))
+        for task_id in task_ids:
+            self.jobs.cancel(task_id)
+            self.recurrences.invalidate(task_id)
+    
+    def _run_task(self, task: TaskRecord) -> None:
+        """
+        타이머 콜백. 절전 등으로 늦게 깨어났으면 놓친 실행 정책에 따라 실행 횟수를 정합니다.
+        """
+        missed, runs = self._misfire_runs(task, self.clock.now())
+        if missed and runs == 0:
+            self._skipped_runs.inc()
+            self.logger.warning(f"놓친 실행 건너뜀 ({task.misfire_policy}): {task.name}")
+            self._update_next_run(task)
+            self.storage.update_run_state(task.id, task.last_run, task.next_run)
+            return
         
-        # 주간 작업의 경우 요일별 작업 ID 확인
-        for key in list(self.jobs.keys()):
-            if key.startswith(f"{task_id}_"):
-                schedule.cancel_job(self.jobs[key])
-                del self.jobs[key]
+        self._launch(task)
+        if runs > 1:
+            self._queue_catchup(task, runs - 1)
     
-    def _run_task(self, task: Task) -> None:
+    def _launch(self, task: TaskRecord) -> None:
         """
-        작업을 실행합니다.
+        작업 실행을 요청합니다. 최대 인스턴스 수에 도달했으면 이번 실행은 건너뜁니다.
         """
-        try:
-            # 하위 프로세스로 실행 파일 실행
-            subprocess.Popen(task.file_path)
-            
-            # 마지막 실행 시간 업데이트
-            task.last_run = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if not self._submit(task):
+            # 이전 실행이 아직 끝나지 않아 최대 인스턴스 수에 도달함
+            self._skipped_runs.inc()
             self._update_next_run(task)
-            self.storage.update_task(task)
-            
-            logger.info(f"작업 실행 성공: {task.name} ({task.file_path})")
-        except Exception as e:
-            logger.error(f"작업 실행 실패: {task.name} ({task.file_path}) - {str(e)}")
+            self.storage.update_run_state(task.id, task.last_run, task.next_run)
+            self.logger.warning(f"작업 실행 건너뜀 (최대 인스턴스 {task.max_instances}개 실행 중): {task.name}")
     
-    def _run_and_disable(self, task: Task) -> None:
+    def _submit(self, task: TaskRecord) -> bool:
         """
-        작업을 실행하고 비활성화합니다 (일회성 작업용).
+        작업 실행을 실행기에 요청합니다. 실행하지 않았으면 False를 반환합니다.
         """
-        self._run_task(task)
+        return self.executor.submit(task)
+    
+    def _pending_launches(self) -> int:
+        """
+        실행기가 아직 시작하지 않은 실행 요청 수를 반환합니다.
+        """
+        return self.executor.queue_depth()
+    
+    def running_count(self, task_id: Optional[str] = None) -> int:
+        """
+        실행 중인 프로세스 수를 반환합니다. task_id가 있으면 해당 작업의 대기 중인 요청도 포함합니다.
+        """
+        return self.executor.running_count(task_id)
+    
+    def _missed_runs(self, task: TaskRecord, now: datetime) -> Tuple[int, Optional[datetime]]:
+        """
+        저장된 next_run부터 now까지 지나간 실행 시각 수와 그중 마지막 시각을 반환합니다.
+        """
+        if not task.next_run:
+            return 0, None
+        # 실행할 때마다 호출되므로 strptime보다 훨씬 빠른 fromisoformat 사용 (TIME_FORMAT은 ISO 형식)
+        first = datetime.fromisoformat(task.next_run)
+        if first > now:
+            return 0, None
+        if task.schedule_type == "once":
+            return 1, first
         
-        # 일회성 작업은 실행 후 비활성화
-        task.enabled = False
-        self.storage.update_task(task)
-        self._unschedule_task(task.id)
+        recurrence = compile_recurrence(task, self.spread_seconds)
+        if recurrence is None:
+            return 0, None
+        if recurrence.anchored:
+            # 주기적 작업은 간격으로 바로 계산
+            count = (now - first) // recurrence.interval + 1
+            return count, first + recurrence.interval * (count - 1)
+        
+        count, last = 1, first
+        while True:
+            current = recurrence.next_after(last)
+            if current is None or current > now:
+                return count, last
+            count, last = count + 1, current
     
-    def _check_and_run_monthly(self, task: Task) -> None:
+    def _misfire_runs(self, task: TaskRecord, now: datetime) -> Tuple[int, int]:
         """
-        월간 작업인지 확인하고 실행합니다.
+        (지나간 실행 시각 수, 놓친 실행 정책에 따라 지금 실행할 횟수)를 반환합니다.
+        허용 시간 안의 지연은 놓친 실행이 아니라 늦은 정상 실행으로 보고 한 번 실행합니다.
         """
-        today = datetime.now()
+        count, last = self._missed_runs(task, now)
+        if count == 0:
+            return 0, 0
         
-        if task.is_last_day_of_month:
-            # 매월 마지막 날 실행 옵션이 선택된 경우
-            # 현재 달의 마지막 날인지 확인
-            next_month = today.month + 1 if today.month < 12 else 1
-            next_month_year = today.year if today.month < 12 else today.year + 1
-            last_day_of_month = (datetime(year=next_month_year, month=next_month, day=1) - timedelta(days=1)).day
-            
-            if today.day == last_day_of_month:
-                self._run_task(task)
-        # 특정 날짜가 지정된 경우
-        elif today.day == task.date:
-            self._run_task(task)
+        grace = task.misfire_grace_seconds
+        if grace is None:
+            grace = self.misfire_grace_seconds
+        on_time = (now - last).total_seconds() <= max(grace, MISFIRE_THRESHOLD_SECONDS)
+        
+        if task.misfire_policy == "run_all":
+            return count, min(count, self.max_catchup_runs)
+        if task.misfire_policy == "run_once" or on_time:
+            return count, 1
+        return count, 0
+    
+    def _queue_catchup(self, task: TaskRecord, runs: int) -> None:
+        """
+        따라잡기 실행을 대기열에 넣습니다. 재시작 직후 한꺼번에 시작되지 않도록 catchup_rate 속도로 실행합니다.
+        """
+        self.logger.info(f"놓친 실행 {runs}회 따라잡기 예약: {task.name}")
+        with self._catchup_lock:
+            self._catchup.extend([task] * runs)
+            if self._catchup_timer is None:
+                interval = timedelta(seconds=1 / self.catchup_rate)
+                self._catchup_timer = self.engine.call_later(timedelta(0), self._run_catchup, every=interval)
     
-    def _update_next_run(self, task: Task) -> None:
+    def _run_catchup(self) -> None:
+        """
+        대기열에서 따라잡기 실행 하나를 꺼내 실행합니다.
+        """
+        with self._catchup_lock:
+            if not self._catchup:
+                self._catchup_timer.cancel()
+                self._catchup_timer = None
+                return
+            task = self._catchup.popleft()
+        
+        if task.id not in self.jobs:
+            # 대기 중에 삭제되었거나 비활성화됨
+            return
+        self._launch(task)
+        if task.schedule_type == "once":
+            self._disable_once(task)
+    
+    def _on_task_launched(self, task: TaskRecord, run: RunRecord) -> None:
+        """
+        프로세스가 시작되면 마지막 실행 시간과 다음 실행 시간을 기록합니다.
+        """
+        self._launches.inc()
+        self._record_attempt(task, run, "started")
+        self.logger.info(f"작업 실행 성공: {task.name} ({task.file_path})")
+    
+    def _on_task_exited(self, task: TaskRecord, run: RunRecord) -> None:
+        """
+        회수된 프로세스의 실행 기록을 남깁니다.
+        """
+        self.history.record(run)
+        
+        outcome = "succeeded" if run.succeeded else "failed"
+        if self._is_scheduled(task):
+            self.storage.update_run_state(task.id, task.last_run, task.next_run, outcome)
+        else:
+            self._record_detached(task, outcome)
+        self.events.publish(RUN_FINISHED, task.id, run)
+        if not run.succeeded:
+            self.logger.warning(f"작업 비정상 종료: {task.name} (종료 코드 {run.exit_code})")
+    
+    def _on_task_failed(self, task: TaskRecord, run: RunRecord) -> None:
+        """
+        프로세스를 시작하지 못한 실행을 기록합니다. 실패한 실행도 이번 실행 시각은 지난 것으로 보고
+        next_run을 앞으로 옮깁니다. (그러지 않으면 재시작할 때 놓친 실행으로 다시 따라잡음)
+        """
+        self._launch_failures.inc()
+        self._record_attempt(task, run, "failed")
+        self.history.record(run)
+        self.events.publish(RUN_FINISHED, task.id, run)
+    
+    def _record_attempt(self, task: TaskRecord, run: RunRecord, outcome: str) -> None:
+        """
+        실행을 시도한 시각을 마지막 실행 시간으로 기록하고 다음 실행 시간을 계산해 저장합니다.
+        """
+        task.last_run = datetime.fromtimestamp(run.started_at).strftime(TIME_FORMAT)
+        if not self._is_scheduled(task):
+            self._record_detached(task, outcome)
+            return
+        self._update_next_run(task)
+        if task.schedule_type == "interval" and task.enabled:
+            # 주기적 작업은 실행 시점을 기준으로 이후 실행 시각이 정해짐 (제시간 실행이면 지난 항목만 버림)
+            self.forecast.advance(task)
+        self.storage.update_run_state(task.id, task.last_run, task.next_run, outcome)
+    
+    def _is_scheduled(self, task: TaskRecord) -> bool:
+        """
+        task가 지금 등록된 타이머가 실행하는 레코드인지 확인합니다.
+        실행 중에 작업이 편집되면 새 레코드로 다시 등록되므로, 이전 레코드는 더 이상 일정을 정하지 않습니다.
+        """
+        return any(handle.args and handle.args[0] is task for handle in self.jobs.handles(task.id))
+    
+    def _record_detached(self, task: TaskRecord, outcome: str) -> None:
+        """
+        실행 중에 편집, 비활성화 또는 삭제된 작업의 실행 결과를 기록합니다.
+        다음 실행 시간은 편집으로 저장된 값을 유지하고, 삭제된 작업은 기록하지 않습니다.
+        """
+        stored = self.storage.get_task_by_id(task.id)
+        if stored is None:
+            return
+        last_run = max(task.last_run or "", stored.last_run or "") or None
+        self.storage.update_run_state(task.id, last_run, stored.next_run, outcome)
+    
+    def _run_and_disable(self, task: TaskRecord) -> None:
+        """
+        작업을 실행하고 비활성화합니다 (일회성 작업용).
+        """
+        self._run_task(task)
+        self._disable_once(task)
+    
+    def _disable_once(self, task: TaskRecord) -> None:
+        """
+        실행한 일회성 작업을 비활성화합니다.
+        """
+        task.enabled = False
+        task.next_run = None
+        self.storage.update_task(task)
+        self._unschedule_task(task.id)
+    
+    def _update_next_run(self, task: TaskRecord) -> None:
         """
         작업의 다음 실행 시간을 업데이트합니다.
         """
+        started = time.perf_counter()
         try:
             if task.schedule_type == "once" and not task.enabled:
                 task.next_run = None
-            else:
-                # 현재 시간 기준으로 다음 실행 시간 계산
-                next_run = None
-                
-                # 주기적 실행인 경우
-                if task.schedule_type == "interval" and task.interval_minutes:
-                    interval_minutes = task.interval_minutes
-                    next_datetime = datetime.now() + timedelta(minutes=interval_minutes)
-                    next_run = next_datetime.strftime("%Y-%m-%d %H:%M:%S")
-                # 일간 실행인 경우
-                elif task.schedule_type == "daily" and task.time:
-                    hours, minutes, seconds = task.time.split(":")
-                    next_datetime = datetime.now().replace(
-                        hour=int(hours), 
-                        minute=int(minutes), 
-                        second=int(seconds)
-                    )
-                    
-                    if next_datetime <= datetime.now():
-                        next_datetime += timedelta(days=1)
-                    
-                    next_run = next_datetime.strftime("%Y-%m-%d %H:%M:%S")
-                # 주간 실행인 경우
-                elif task.schedule_type == "weekly" and task.time and task.days:
-                    hours, minutes, seconds = task.time.split(":")
-                    today = datetime.now()
-                    today_weekday = today.weekday()  # 0-6 (월-일)
-                    
-                    # 지정된 요일 정렬 (오늘 이후로 가장 가까운 요일 찾기)
-                    days_sorted = sorted(task.days)
-                    
-                    # 이번 주에 남은 요일 찾기
-                    next_days = [day for day in days_sorted if day > today_weekday]
-                    
-                    if next_days:
-                        # 이번 주에 실행할 요일이 남아있음
-                        days_until_next = next_days[0] - today_weekday
-                    else:
-                        # 이번 주에 실행할 요일이 없음, 다음 주 첫 요일
-                        days_until_next = 7 - today_weekday + days_sorted[0]
-                    
-                    next_datetime = today.replace(
-                        hour=int(hours),
-                        minute=int(minutes),
-                        second=int(seconds)
-                    ) + timedelta(days=days_until_next)
-                    
-                    # 오늘이고 이미 시간이 지났으면 다음 주기로
-                    if days_until_next == 0 and next_datetime <= today:
-                        next_days = [day for day in days_sorted if day > today_weekday + 1]
-                        if next_days:
-                            days_until_next = next_days[0] - today_weekday
-                        else:
-                            days_until_next = 7 - today_weekday + days_sorted[0]
-                        next_datetime = today.replace(
-                            hour=int(hours),
-                            minute=int(minutes),
-                            second=int(seconds)
-                        ) + timedelta(days=days_until_next)
-                    
-                    next_run = next_datetime.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # 월간 실행인 경우
-                elif task.schedule_type == "monthly" and task.time and (task.date or task.is_last_day_of_month):
-                    hours, minutes, seconds = task.time.split(":")
-                    today = datetime.now()
-                    
-                    # 이번 달에 대한 계산
-                    current_month = today.month
-                    current_year = today.year
-                    
-                    if task.is_last_day_of_month:
-                        # 매월 마지막 날 실행 옵션이 선택된 경우
-                        
-                        # 현재 달의 마지막 날 계산
-                        next_month = current_month + 1 if current_month < 12 else 1
-                        next_year = current_year if current_month < 12 else current_year + 1
-                        last_day = (datetime(year=next_year, month=next_month, day=1) - timedelta(days=1)).day
-                        
-                        try:
-                            next_datetime = today.replace(
-                                day=last_day,
-                                hour=int(hours),
-                                minute=int(minutes),
-                                second=int(seconds)
-                            )
-                            
-                            # 이미 지난 시간이면 다음 달로 설정
-                            if next_datetime <= today:
-                                next_month = current_month + 1
-                                next_year = current_year
-                                if next_month > 12:
-                                    next_month = 1
-                                    next_year += 1
-                                    
-                                # 다음 달의 마지막 날 계산
-                                month_after_next = next_month + 1 if next_month < 12 else 1
-                                year_after_next = next_year if next_month < 12 else next_year + 1
-                                last_day_next_month = (datetime(year=year_after_next, month=month_after_next, day=1) - timedelta(days=1)).day
-                                
-                                next_datetime = datetime(
-                                    year=next_year,
-                                    month=next_month,
-                                    day=last_day_next_month,
-                                    hour=int(hours),
-                                    minute=int(minutes),
-                                    second=int(seconds)
-                                )
-                        except ValueError:
-                            logger.error(f"월간 작업 마지막 날 계산 오류: {task.name}")
-                            next_datetime = None
-                    else:
-                        # 특정 날짜 선택된 경우
-                        target_day = task.date
-                        
-                        # 현재 월부터 시작해서 12개월 전진하며 유효한 날짜 찾기
-                        next_datetime = None
-                        for i in range(13):  # 현재 달 포함 최대 13개월 확인 (1년 + 현재 달)
-                            check_month = (current_month + i) % 12
-                            check_month = 12 if check_month == 0 else check_month
-                            check_year = current_year + (current_month + i - 1) // 12
-                            
-                            try:
-                                check_date = datetime(
-                                    year=check_year,
-                                    month=check_month,
-                                    day=target_day,
-                                    hour=int(hours),
-                                    minute=int(minutes),
-                                    second=int(seconds)
-                                )
-                                
-                                # 현재 시간 이후의 첫 번째 유효한 날짜 사용
-                                if check_date > today or (i == 0 and check_date > today):
-                                    next_datetime = check_date
-                                    break
-                            except ValueError:
-                                # 해당 월에 그 날짜가 없으면 다음 달 확인
-                                continue
-                        
-                        if not next_datetime:
-                            logger.warning(f"유효한 월간 날짜를 찾을 수 없습니다: {target_day}일, 작업: {task.name}")
-                    
-                    if next_datetime:
-                        next_run = next_datetime.strftime("%Y-%m-%d %H:%M:%S")
-                
-                task.next_run = next_run
+                return
+            
+            next_time = self.recurrences.next_run(task, self.clock.now())
+            task.next_run = next_time.strftime(TIME_FORMAT) if next_time else None
+            if next_time is None:
+                self.logger.warning(f"다음 실행 시간을 계산할 수 없습니다: {task.name}")
         except Exception as e:
-            logger.error(f"다음 실행 시간 업데이트 실패: {task.name} - {str(e)}")
-    
-    def _get_weekday_name(self, day: int) -> str:
-        """
-        요일 번호를 요일 이름으로 변환합니다.
-        """
-        weekday_names = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        if 0 <= day < len(weekday_names):
-            return weekday_names[day]
-        return "monday"  # 기본값 
\ No newline at end of file
+            self.logger.error(f"다음 실행 시간 업데이트 실패: {task.name} - {str(e)}")
+        finally:
+            self._next_run_seconds.observe(time.perf_counter() - started)
\ No newline at end of file
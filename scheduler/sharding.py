@@ -0,0 +1,498 @@
+import hashlib
+import threading
+import logging
+import multiprocessing
+from bisect import bisect
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from scheduler.events import RUN_FINISHED, EventBus
+from scheduler.history import RunHistory, RunRecord
+from scheduler.models import Task, TaskRecord
+from scheduler.recurrence import TIME_FORMAT, RecurrenceCache, compile_recurrence
+from scheduler.repository import TaskRepository
+from scheduler.storage import Storage
+
+logger = logging.getLogger("Scheduler")
+
+
+class HashRing:
+    """
+    작업 ID를 샤드 번호에 대응시키는 일관된 해시 링입니다.
+    샤드 수가 바뀌어도 대부분의 작업은 같은 샤드에 남습니다.
+    """
+
+    def __init__(self, shards: int, replicas: int = 64):
+        self.shards = shards
+        points = sorted(
+            (self._hash(f"{shard}:{replica}"), shard)
+            for shard in range(shards) for replica in range(replicas)
+        )
+        self._keys = [key for key, _ in points]
+        self._owners = [shard for _, shard in points]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        # 프로세스마다 달라지는 hash() 대신 고정된 해시를 사용
+        return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+    def shard_of(self, task_id: str) -> int:
+        """
+        작업을 담당하는 샤드 번호를 반환합니다.
+        """
+        i = bisect(self._keys, self._hash(task_id)) % len(self._keys)
+        return self._owners[i]
+
+
+class _ShardStorage:
+    """
+    작업자 프로세스 안에서 쓰는 메모리 저장소입니다. 실행 상태 변경은 조정자에게 보고합니다.
+    """
+
+    def __init__(self, conn: Connection, send_lock: threading.Lock):
+        self._conn = conn
+        self._send_lock = send_lock
+        self._lock = threading.RLock()
+        self._repository = TaskRepository()
+        self.events = EventBus()
+
+    def load_tasks(self) -> List[TaskRecord]:
+        with self._lock:
+            return self._repository.all()
+
+    snapshot = load_tasks
+
+    def add_task(self, task: TaskRecord) -> None:
+        with self._lock:
+            self._repository.put(task)
+
+    def put_many(self, tasks: List[TaskRecord]) -> None:
+        """
+        조정자가 보낸 작업들을 보고 없이 반영합니다.
+        """
+        with self._lock:
+            for task in tasks:
+                self._repository.put(task)
+
+    def update_task(self, task: TaskRecord) -> bool:
+        # 작업자 안에서 바뀐 작업(예: 실행 후 비활성화된 일회성 작업)은 조정자에게도 알림
+        with self._lock:
+            if task.id not in self._repository:
+                return False
+            self._repository.put(task)
+        with self._send_lock:
+            self._conn.send(("task", task.to_dict()))
+        return True
+
+    def delete_task(self, task_id: str) -> bool:
+        with self._lock:
+            return self._repository.remove(task_id)
+
+    def get_task_by_id(self, task_id: str) -> Optional[TaskRecord]:
+        with self._lock:
+            return self._repository.get(task_id)
+
+    def get_enabled_tasks(self) -> List[TaskRecord]:
+        with self._lock:
+            return self._repository.enabled(True)
+
+    def get_due_tasks(self, before: str) -> List[TaskRecord]:
+        with self._lock:
+            return self._repository.due_before(before)
+
+    def update_run_state(self, task_id: str, last_run: Optional[str], next_run: Optional[str],
+                         outcome: Optional[str] = None) -> bool:
+        with self._lock:
+            if not self._repository.set_run_state(task_id, last_run, next_run, outcome):
+                return False
+        with self._send_lock:
+            self._conn.send(("state", task_id, last_run, next_run, outcome))
+        return True
+
+    def update_run_states(self, tasks: List[TaskRecord]) -> int:
+        # 조정자가 저장소에 한 번에 기록하도록 메시지 하나로 보고
+        with self._lock:
+            updated = [task for task in tasks
+                       if self._repository.set_run_state(task.id, task.last_run, task.next_run)]
+        if updated:
+            with self._send_lock:
+                self._conn.send(("states", [task.to_dict() for task in updated]))
+        return len(updated)
+
+    def flush(self) -> None:
+        pass
+
+
+class _PipeHistory:
+    """
+    작업자 프로세스의 실행 기록을 조정자에게 보내는 RunHistory 대용 객체입니다.
+    """
+
+    def __init__(self, conn: Connection, send_lock: threading.Lock):
+        self._conn = conn
+        self._send_lock = send_lock
+
+    def record(self, run: RunRecord) -> None:
+        with self._send_lock:
+            self._conn.send(("run", run.to_row()))
+
+    def forget(self, task_id: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _worker_main(shard: int, conn: Connection, max_workers: int, max_processes: int, spread_seconds: int) -> None:
+    """
+    작업자 프로세스 진입점. 자기 샤드의 작업만 스케줄링하고 실행합니다.
+    """
+    from scheduler.scheduler import Scheduler
+
+    send_lock = threading.Lock()
+    storage = _ShardStorage(conn, send_lock)
+    scheduler = Scheduler(
+        storage, history=_PipeHistory(conn, send_lock),
+        max_workers=max_workers, max_processes=max_processes, name=f"shard-{shard}",
+        spread_seconds=spread_seconds
+    )
+    scheduler.start()
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            command = message[0]
+            if command == "put_many":
+                # 조정자가 보낸 작업은 이미 검증되었으므로 검증 없이 레코드로 읽음
+                tasks = [TaskRecord.from_dict(data) for data in message[1]]
+                storage.put_many(tasks)
+                # 시작/재시작 때 받은 작업은 저장된 next_run이 지났을 수 있으므로
+                # Scheduler.start()와 같이 놓친 실행 정책에 따라 따라잡은 뒤 한 번에 스케줄링
+                scheduler._restore_tasks(tasks)
+            elif command == "remove_many":
+                scheduler._unschedule_tasks(message[1])
+                for task_id in message[1]:
+                    storage.delete_task(task_id)
+            elif command == "stop":
+                break
+    finally:
+        scheduler.stop()
+
+
+class ShardedScheduler:
+    """
+    작업을 Task.id의 일관된 해시로 나누어 여러 작업자 프로세스에서 실행하는 스케줄러입니다.
+    각 작업자는 자신의 디스패치 루프를 돌리고, 실행 결과는 파이프로 조정자에게 보고합니다.
+    Scheduler와 같은 공개 API를 제공합니다.
+    """
+
+    def __init__(self, storage: Storage, workers: Optional[int] = None, history: Optional[RunHistory] = None,
+                 max_workers: int = 4, max_processes: int = 64, spread_seconds: int = 0):
+        self.storage = storage
+        self.history = history if history is not None else RunHistory(str(Path(storage.data_dir) / "history"))
+        self.workers = workers or multiprocessing.cpu_count()
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+        self.running = False
+        self.ring = HashRing(self.workers)
+        self.spread_seconds = spread_seconds
+        self.recurrences = RecurrenceCache(spread_seconds)
+
+        # spawn 방식은 Windows와 같고, 스레드가 있는 부모 프로세스를 fork하지 않음
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.RLock()
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._conns: Dict[int, Connection] = {}
+        self._listener: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        작업자 프로세스를 시작하고 활성화된 작업을 샤드별로 나누어 보냅니다.
+        """
+        if self.running:
+            return
+
+        self.running = True
+        with self._lock:
+            for shard in range(self.workers):
+                self._spawn(shard)
+            self._dispatch_many(self.storage.get_enabled_tasks())
+
+        self._listener = threading.Thread(target=self._listen, name="ShardListener", daemon=True)
+        self._listener.start()
+        logger.info(f"샤드 스케줄러가 시작되었습니다. (작업자 {self.workers}개)")
+
+    def stop(self) -> None:
+        """
+        모든 작업자 프로세스를 중지합니다.
+        """
+        self.running = False
+        with self._lock:
+            for shard in list(self._conns):
+                self._send(shard, ("stop",))
+            for process in self._processes.values():
+                process.join(timeout=2.0)
+                if process.is_alive():
+                    process.terminate()
+            self._processes.clear()
+            self._conns.clear()
+        if self._listener and self._listener.is_alive():
+            self._listener.join(timeout=1.0)
+        self.storage.flush()
+        self.history.close()
+        logger.info("샤드 스케줄러가 중지되었습니다.")
+
+    def shard_of(self, task_id: str) -> int:
+        """
+        작업을 담당하는 샤드 번호를 반환합니다.
+        """
+        return self.ring.shard_of(task_id)
+
+    def add_task(self, task: Task) -> None:
+        """
+        새 작업을 추가하고 담당 샤드에 보냅니다.
+        """
+        self._update_next_run(task)
+        self.storage.add_task(task)
+        if task.enabled:
+            self._dispatch(task)
+
+    def update_task(self, task: Task) -> bool:
+        """
+        작업을 업데이트하고 담당 샤드의 스케줄을 재조정합니다.
+        """
+        self._update_next_run(task)
+        success = self.storage.update_task(task)
+        if success:
+            if task.enabled:
+                self._dispatch(task)
+            else:
+                self._dispatch_remove(task.id)
+        return success
+
+    def delete_task(self, task_id: str) -> bool:
+        """
+        작업을 삭제하고 담당 샤드에서 제거합니다.
+        """
+        self._dispatch_remove(task_id)
+        self.history.forget(task_id)
+        return self.storage.delete_task(task_id)
+
+    def toggle_task(self, task_id: str, enabled: bool) -> bool:
+        """
+        작업 활성화 상태를 토글합니다.
+        """
+        task = self.storage.get_task_by_id(task_id)
+        if not task:
+            return False
+        task.enabled = enabled
+        return self.update_task(task)
+
+    def add_tasks(self, tasks: List[Task]) -> None:
+        """
+        여러 작업을 한 번에 저장하고 담당 샤드에 보냅니다.
+        """
+        self._validate_tasks(tasks, existing=False)
+        for task in tasks:
+            self._update_next_run(task)
+        self.storage.add_tasks(tasks)
+        self._dispatch_many([task for task in tasks if task.enabled])
+
+    def update_tasks(self, tasks: List[Task]) -> None:
+        """
+        여러 작업을 한 번에 저장하고 담당 샤드의 스케줄을 재조정합니다.
+        """
+        self._validate_tasks(tasks, existing=True)
+        for task in tasks:
+            self._update_next_run(task)
+        self.storage.update_tasks(tasks)
+        self._dispatch_many(tasks)
+
+    def upsert_tasks(self, tasks: List[Task]) -> Tuple[int, int]:
+        """
+        여러 작업을 한 번에 추가하거나 업데이트하고 담당 샤드에 보냅니다. (추가한 수, 업데이트한 수)를 반환합니다.
+        """
+        self._validate_tasks(tasks, existing=None)
+        for task in tasks:
+            self._update_next_run(task)
+        counts = self.storage.upsert_tasks(tasks)
+        self._dispatch_many(tasks)
+        return counts
+
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """
+        여러 작업을 한 번에 삭제합니다. 삭제한 작업 수를 반환합니다.
+        """
+        self._dispatch_remove_many(task_ids)
+        for task_id in task_ids:
+            self.history.forget(task_id)
+        return self.storage.delete_tasks(task_ids)
+
+    def set_enabled(self, task_ids: List[str], enabled: bool) -> None:
+        """
+        여러 작업의 활성화 상태를 한 번에 바꿉니다.
+        """
+        tasks = {task.id: task for task in self.storage.snapshot()}
+        missing = [task_id for task_id in task_ids if task_id not in tasks]
+        if missing:
+            raise ValueError(f"없는 작업 {len(missing)}개: {', '.join(missing[:10])}")
+        selected = [tasks[task_id] for task_id in task_ids]
+        for task in selected:
+            task.enabled = enabled
+        self.update_tasks(selected)
+
+    def resize(self, workers: int) -> None:
+        """
+        작업자 수를 바꿉니다. 담당 샤드가 바뀐 작업만 새 샤드로 옮깁니다.
+        """
+        with self._lock:
+            old_ring, self.ring = self.ring, HashRing(workers)
+            old_workers, self.workers = self.workers, workers
+            if not self.running:
+                return
+
+            for shard in range(old_workers, workers):
+                self._spawn(shard)
+            removes: Dict[int, List[str]] = {}
+            puts: Dict[int, List[dict]] = {}
+            for task in self.storage.get_enabled_tasks():
+                old_shard, new_shard = old_ring.shard_of(task.id), self.ring.shard_of(task.id)
+                if old_shard != new_shard:
+                    if old_shard < workers:
+                        removes.setdefault(old_shard, []).append(task.id)
+                    puts.setdefault(new_shard, []).append(task.to_dict())
+            for shard, task_ids in removes.items():
+                self._send(shard, ("remove_many", task_ids))
+            for shard, tasks_data in puts.items():
+                self._send(shard, ("put_many", tasks_data))
+            for shard in range(workers, old_workers):
+                self._send(shard, ("stop",))
+                self._processes.pop(shard).join(timeout=2.0)
+                self._conns.pop(shard, None)
+
+    def _validate_tasks(self, tasks: List[Task], existing: Optional[bool]) -> None:
+        """
+        일괄 변경 전에 모든 작업을 검사합니다. 문제가 있으면 아무것도 바꾸지 않고 ValueError를 발생시킵니다.
+        existing이 True면 저장소에 있어야 하고, False면 없어야 하며, None이면 확인하지 않습니다.
+        """
+        stored = {task.id for task in self.storage.snapshot()}
+        seen = set()
+        errors: List[str] = []
+        for task in tasks:
+            if task.id in seen:
+                errors.append(f"중복된 작업 ID: {task.id}")
+            seen.add(task.id)
+            if existing and task.id not in stored:
+                errors.append(f"없는 작업: {task.id}")
+            elif existing is False and task.id in stored:
+                errors.append(f"이미 있는 작업: {task.id}")
+            if task.enabled and compile_recurrence(task, self.spread_seconds) is None:
+                errors.append(f"실행 일정이 올바르지 않습니다: {task.name}")
+        if errors:
+            raise ValueError(f"작업 {len(errors)}건이 올바르지 않습니다: " + "; ".join(errors[:10]))
+
+    def _update_next_run(self, task: Task) -> None:
+        # 작업자가 실제 값을 보고하기 전까지 화면에 보여 줄 다음 실행 시간
+        next_time = self.recurrences.next_run(task) if task.enabled else None
+        task.next_run = next_time.strftime(TIME_FORMAT) if next_time else None
+
+    def _dispatch(self, task: Task) -> None:
+        self._dispatch_many([task])
+
+    def _dispatch_remove(self, task_id: str) -> None:
+        self._dispatch_remove_many([task_id])
+
+    def _dispatch_many(self, tasks: List[Task]) -> None:
+        """
+        작업들을 샤드별로 모아 샤드마다 메시지 하나로 보냅니다. 비활성화된 작업은 샤드에서 제거합니다.
+        """
+        if not self.running:
+            return
+        with self._lock:
+            puts: Dict[int, List[dict]] = {}
+            removes: Dict[int, List[str]] = {}
+            for task in tasks:
+                shard = self.ring.shard_of(task.id)
+                if task.enabled:
+                    puts.setdefault(shard, []).append(task.to_dict())
+                else:
+                    removes.setdefault(shard, []).append(task.id)
+            for shard, task_ids in removes.items():
+                self._send(shard, ("remove_many", task_ids))
+            for shard, tasks_data in puts.items():
+                self._send(shard, ("put_many", tasks_data))
+
+    def _dispatch_remove_many(self, task_ids: List[str]) -> None:
+        if not self.running:
+            return
+        with self._lock:
+            removes: Dict[int, List[str]] = {}
+            for task_id in task_ids:
+                removes.setdefault(self.ring.shard_of(task_id), []).append(task_id)
+            for shard, shard_task_ids in removes.items():
+                self._send(shard, ("remove_many", shard_task_ids))
+
+    def _spawn(self, shard: int) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(shard, child_conn, self.max_workers, self.max_processes, self.spread_seconds),
+            name=f"shard-{shard}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self._processes[shard] = process
+        self._conns[shard] = parent_conn
+
+    def _send(self, shard: int, message: Tuple) -> None:
+        conn = self._conns.get(shard)
+        if conn is None:
+            return
+        try:
+            conn.send(message)
+        except (BrokenPipeError, OSError) as e:
+            logger.error(f"샤드 {shard}에 메시지 전송 실패: {e}")
+
+    def _respawn(self, shard: int) -> None:
+        """
+        비정상 종료된 작업자를 다시 시작하고 담당 작업을 다시 보냅니다.
+        """
+        logger.warning(f"샤드 {shard} 작업자가 종료되어 다시 시작합니다.")
+        self._processes.pop(shard, None)
+        self._spawn(shard)
+        tasks = [task.to_dict() for task in self.storage.get_enabled_tasks() if self.ring.shard_of(task.id) == shard]
+        if tasks:
+            self._send(shard, ("put_many", tasks))
+
+    def _listen(self) -> None:
+        """
+        작업자들이 보고하는 실행 상태와 실행 기록을 저장합니다.
+        """
+        while self.running:
+            with self._lock:
+                conns = {conn: shard for shard, conn in self._conns.items()}
+            for conn in wait(list(conns), timeout=0.5):
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    with self._lock:
+                        shard = conns[conn]
+                        if self.running and self._conns.get(shard) is conn:
+                            self._respawn(shard)
+                    continue
+
+                if message[0] == "state":
+                    _, task_id, last_run, next_run, outcome = message
+                    self.storage.update_run_state(task_id, last_run, next_run, outcome)
+                elif message[0] == "states":
+                    # 시작할 때 보고된 모든 작업의 다음 실행 시간을 저널에 한 번에 기록
+                    self.storage.update_run_states([TaskRecord.from_dict(data) for data in message[1]])
+                elif message[0] == "task":
+                    self.storage.update_task(TaskRecord.from_dict(message[1]))
+                elif message[0] == "run":
+                    run = RunRecord.from_row(message[1])
+                    self.history.record(run)
+                    self.storage.events.publish(RUN_FINISHED, run.task_id, run)
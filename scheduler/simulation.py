@@ -0,0 +1,376 @@
+import argparse
+import heapq
+import json
+import sys
+import time
+import logging
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Deque, Dict, List, Optional, TextIO, Tuple
+
+from scheduler.clock import VirtualClock
+from scheduler.engine import TimerEngine
+from scheduler.events import EventBus
+from scheduler.forecast import ForecastIndex
+from scheduler.history import RunRecord
+from scheduler.metrics import MetricsRegistry
+from scheduler.models import Task, TaskRecord
+from scheduler.recurrence import TIME_FORMAT
+from scheduler.repository import TaskRepository
+from scheduler.scheduler import Scheduler
+
+logger = logging.getLogger("Scheduler")
+
+LaunchCallback = Callable[[TaskRecord, RunRecord], None]
+
+
+class _MemoryStorage:
+    """
+    시뮬레이션에서 쓰는 메모리 저장소입니다. 파일에는 아무것도 기록하지 않습니다.
+    """
+
+    def __init__(self, tasks: List[TaskRecord]):
+        self._repository = TaskRepository(tasks)
+        self.events = EventBus()
+
+    def load_tasks(self) -> List[TaskRecord]:
+        return self._repository.all()
+
+    snapshot = load_tasks
+
+    def add_task(self, task: TaskRecord) -> None:
+        self._repository.put(task)
+
+    def add_tasks(self, tasks: List[TaskRecord]) -> None:
+        for task in tasks:
+            self._repository.put(task)
+
+    def update_task(self, task: TaskRecord) -> bool:
+        if task.id not in self._repository:
+            return False
+        self._repository.put(task)
+        return True
+
+    def update_tasks(self, tasks: List[TaskRecord]) -> int:
+        return sum(self.update_task(task) for task in tasks)
+
+    def upsert_tasks(self, tasks: List[TaskRecord]) -> Tuple[int, int]:
+        updated = sum(task.id in self._repository for task in tasks)
+        for task in tasks:
+            self._repository.put(task)
+        return len(tasks) - updated, updated
+
+    def delete_task(self, task_id: str) -> bool:
+        return self._repository.remove(task_id)
+
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        return sum(self.delete_task(task_id) for task_id in task_ids)
+
+    def get_task_by_id(self, task_id: str) -> Optional[TaskRecord]:
+        return self._repository.get(task_id)
+
+    def get_enabled_tasks(self) -> List[TaskRecord]:
+        return self._repository.enabled(True)
+
+    def update_run_state(self, task_id: str, last_run: Optional[str], next_run: Optional[str],
+                         outcome: Optional[str] = None) -> bool:
+        return self._repository.set_run_state(task_id, last_run, next_run, outcome)
+
+    def update_run_states(self, tasks: List[TaskRecord]) -> int:
+        return sum(self.update_run_state(task.id, task.last_run, task.next_run) for task in tasks)
+
+    def flush(self) -> None:
+        pass
+
+
+class _NullHistory:
+    """
+    실행 기록을 남기지 않는 RunHistory 대용 객체입니다.
+    """
+
+    def record(self, run: RunRecord) -> None:
+        pass
+
+    def forget(self, task_id: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class DryRunExecutor:
+    """
+    프로세스를 만들지 않고 실행을 기록만 하는 실행기입니다. LaunchExecutor와 같은 인터페이스를 가집니다.
+    각 실행은 duration초 동안 실행 중인 것으로 보고, 종료는 가상 시계의 타이머로 처리합니다.
+    전체 동시 실행 수가 max_processes에 이르면 빈 자리가 날 때까지 요청을 대기열에 둡니다.
+    """
+
+    def __init__(self, on_launch: LaunchCallback, on_exit: LaunchCallback, clock: VirtualClock,
+                 engine: TimerEngine, duration: float = 1.0, max_processes: int = 64,
+                 launch_log: Optional[TextIO] = None):
+        """
+        launch_log가 있으면 실행마다 "시각,작업 ID" 한 줄을 기록합니다.
+        """
+        self.clock = clock
+        self.engine = engine
+        self.duration = duration
+        self.max_processes = max_processes
+        self.launch_log = launch_log
+        self._on_launch = on_launch
+        self._on_exit = on_exit
+
+        self._waiting: Deque[Tuple[TaskRecord, float]] = deque()
+        # 작업별 대기 중이거나 실행 중인 인스턴스 수
+        self._instances: Dict[str, int] = {}
+        self._running = 0
+
+        # 집계: 분(epoch 분) -> 실행 수, 작업 ID -> 실행 수, 최대 동시 실행 수와 그 시각
+        self.per_minute: Dict[int, int] = {}
+        self.per_task: Dict[str, int] = {}
+        self.launches = 0
+        self.peak_concurrency = 0
+        self.peak_at: Optional[float] = None
+        self.max_queue_depth = 0
+
+    def submit(self, task: TaskRecord) -> bool:
+        """
+        작업 실행을 요청합니다. 작업별 인스턴스 제한에 걸리면 False를 반환합니다.
+        """
+        count = self._instances.get(task.id, 0)
+        if task.max_instances is not None and count >= task.max_instances:
+            return False
+        self._instances[task.id] = count + 1
+        now = self.clock.time()
+        if self._running >= self.max_processes:
+            self._waiting.append((task, now))
+            self.max_queue_depth = max(self.max_queue_depth, len(self._waiting))
+        else:
+            self._start(task, now)
+        return True
+
+    def running_count(self, task_id: Optional[str] = None) -> int:
+        if task_id is None:
+            return self._running
+        return self._instances.get(task_id, 0)
+
+    def queue_depth(self) -> int:
+        return len(self._waiting)
+
+    def shutdown(self) -> None:
+        pass
+
+    def _start(self, task: TaskRecord, dispatched_at: float) -> None:
+        now = self.clock.time()
+        self._running += 1
+        self.launches += 1
+        minute = int(now // 60)
+        self.per_minute[minute] = self.per_minute.get(minute, 0) + 1
+        self.per_task[task.id] = self.per_task.get(task.id, 0) + 1
+        if self._running > self.peak_concurrency:
+            self.peak_concurrency = self._running
+            self.peak_at = now
+        if self.launch_log is not None:
+            self.launch_log.write(f"{datetime.fromtimestamp(now).strftime(TIME_FORMAT)},{task.id}\n")
+
+        run = RunRecord(task.id, None, now, launch_latency=now - dispatched_at)
+        try:
+            self._on_launch(task, run)
+        except Exception as e:
+            logger.error(f"작업 실행 후처리 실패: {task.name} - {e}")
+        if self.duration > 0:
+            self.engine.call_at(datetime.fromtimestamp(now + self.duration), self._finish, task, run)
+        else:
+            self._finish(task, run)
+
+    def _finish(self, task: TaskRecord, run: RunRecord) -> None:
+        run.exit_code = 0
+        run.ended_at = self.clock.time()
+        self._running -= 1
+        count = self._instances.get(task.id, 0) - 1
+        if count > 0:
+            self._instances[task.id] = count
+        else:
+            self._instances.pop(task.id, None)
+        self._on_exit(task, run)
+        if self._waiting:
+            self._start(*self._waiting.popleft())
+
+
+class SimulatedScheduler(Scheduler):
+    """
+    가상 시계와 DryRunExecutor로 동작하는 스케줄러입니다. 디스패치 스레드 없이 advance()로 시간을 건너뜁니다.
+    작업의 실행 상태(last_run, next_run)는 비우고 시작 시각부터 새로 계산합니다.
+    """
+
+    def __init__(self, tasks: List[Task], start: datetime, duration: float = 1.0,
+                 max_processes: int = 64, spread_seconds: int = 0, launch_log: Optional[TextIO] = None,
+                 **options):
+        records = [TaskRecord.from_dict(task.to_dict()) for task in tasks]
+        for record in records:
+            record.last_run = record.next_run = record.last_outcome = None
+        clock = VirtualClock(start)
+        super().__init__(_MemoryStorage(records), history=_NullHistory(), max_processes=max_processes,
+                         name="simulation", spread_seconds=spread_seconds, metrics=MetricsRegistry(),
+                         clock=clock, **options)
+        self.executor = DryRunExecutor(
+            self._on_task_launched, self._on_task_exited, clock, self.engine,
+            duration=duration, max_processes=max_processes, launch_log=launch_log
+        )
+        # 실행할 때마다 하루치 실행 예정 색인을 다시 계산하지 않도록 색인 범위를 비워 둠
+        self.forecast = ForecastIndex(horizon=timedelta(0), spread_seconds=spread_seconds, clock=clock)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        self._load_tasks()
+
+    def stop(self) -> None:
+        self.running = False
+
+    def advance(self, until: datetime) -> int:
+        """
+        until 직전까지 마감되는 타이머를 시간순으로 모두 실행하고 시계를 until로 옮깁니다.
+        실행한 타이머 수를 반환합니다.
+        """
+        end = until.timestamp()
+        fired = 0
+        while True:
+            deadline = self.engine.next_deadline()
+            if deadline is None or deadline >= end:
+                break
+            self.clock.set(deadline)
+            fired += self.engine.run_due()
+        self.clock.set(end)
+        return fired
+
+
+@dataclass
+class SimulationReport:
+    """
+    시뮬레이션 결과입니다. 시각은 "%Y-%m-%d %H:%M:%S" 문자열입니다.
+    """
+    start: str
+    end: str
+    tasks: int
+    launches: int
+    skipped: int
+    timers_fired: int
+    peak_concurrency: int
+    peak_at: Optional[str]
+    max_queue_depth: int
+    # 실행이 한 번이라도 있었던 분 기준 평균과, 실행 수가 가장 많은 분 목록
+    active_minutes: int
+    mean_launches_per_minute: float
+    max_launches_per_minute: int
+    busiest_minutes: List[Tuple[str, int]] = field(default_factory=list)
+    per_task: Dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def simulate(tasks: List[Task], start: datetime, end: datetime, duration: float = 1.0,
+             max_processes: int = 64, spread_seconds: int = 0, top: int = 10,
+             launch_log: Optional[TextIO] = None, **options) -> SimulationReport:
+    """
+    [start, end) 구간을 가상 시계로 건너뛰며 작업을 실행해 보고, 분당 실행 수와 최대 동시 실행 수를 보고합니다.
+    실제 프로세스는 만들지 않으며 각 실행은 duration초 걸린다고 가정합니다.
+    options는 Scheduler에 그대로 전달합니다. (misfire_grace_seconds 등)
+    """
+    started = time.perf_counter()
+    scheduler = SimulatedScheduler(tasks, start, duration=duration, max_processes=max_processes,
+                                   spread_seconds=spread_seconds, launch_log=launch_log, **options)
+    scheduler.start()
+    fired = scheduler.advance(end)
+    scheduler.stop()
+    elapsed = time.perf_counter() - started
+
+    executor = scheduler.executor
+    per_minute = executor.per_minute
+    busiest = heapq.nlargest(top, per_minute.items(), key=lambda item: (item[1], -item[0]))
+    return SimulationReport(
+        start=start.strftime(TIME_FORMAT),
+        end=end.strftime(TIME_FORMAT),
+        tasks=len(tasks),
+        launches=executor.launches,
+        skipped=int(scheduler._skipped_runs.value),
+        timers_fired=fired,
+        peak_concurrency=executor.peak_concurrency,
+        peak_at=_format_time(executor.peak_at),
+        max_queue_depth=executor.max_queue_depth,
+        active_minutes=len(per_minute),
+        mean_launches_per_minute=round(executor.launches / len(per_minute), 3) if per_minute else 0.0,
+        max_launches_per_minute=max(per_minute.values(), default=0),
+        busiest_minutes=[(_format_time(minute * 60), count) for minute, count in busiest],
+        per_task=dict(executor.per_task),
+        elapsed_seconds=round(elapsed, 3),
+    )
+
+
+def _format_time(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).strftime(TIME_FORMAT)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m scheduler.simulation",
+                                     description="가상 시계로 작업 일정을 빠르게 실행해 보는 시뮬레이터")
+    parser.add_argument("tasks", help="작업 파일 (JSON 또는 CSV)")
+    parser.add_argument("--start", default=None,
+                        help='시작 시각 ("%%Y-%%m-%%d %%H:%%M:%%S", 기본값: 현재 시각)')
+    parser.add_argument("--days", type=float, default=1.0, help="시뮬레이션할 기간(일) (기본값: 1)")
+    parser.add_argument("--duration", type=float, default=1.0, help="실행 한 번이 걸린다고 가정할 시간(초)")
+    parser.add_argument("--max-processes", type=int, default=64, help="동시에 실행할 최대 프로세스 수")
+    parser.add_argument("--spread-seconds", type=int, default=0,
+                        help="같은 시각 작업의 시작을 작업 ID 해시로 분산할 구간(초)")
+    parser.add_argument("--top", type=int, default=10, help="보고할 가장 바쁜 분의 수")
+    parser.add_argument("--launch-log", default=None, help="실행마다 \"시각,작업 ID\"를 기록할 CSV 파일")
+    parser.add_argument("--output", default=None, help="결과를 JSON으로 저장할 파일")
+    parser.add_argument("--per-task", action="store_true", help="작업별 실행 수를 결과에 포함")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    시뮬레이터 메인 함수
+    """
+    from scheduler.transfer import read_tasks
+
+    args = build_parser().parse_args(argv)
+    # 건너뛴 실행은 결과에 집계되므로 실행마다 남는 경고는 출력하지 않음
+    logging.basicConfig(level=logging.ERROR, format='%(levelname)s - %(message)s')
+
+    start = datetime.strptime(args.start, TIME_FORMAT) if args.start else datetime.now().replace(microsecond=0)
+    end = start + timedelta(days=args.days)
+    tasks = read_tasks(args.tasks)
+
+    launch_log = open(args.launch_log, "w", encoding="utf-8") if args.launch_log else None
+    try:
+        report = simulate(tasks, start, end, duration=args.duration, max_processes=args.max_processes,
+                          spread_seconds=args.spread_seconds, top=args.top, launch_log=launch_log)
+    finally:
+        if launch_log is not None:
+            launch_log.close()
+
+    result = report.to_dict()
+    if not args.per_task:
+        del result["per_task"]
+    print(f"기간: {report.start} ~ {report.end} (작업 {report.tasks}개)")
+    print(f"실행 {report.launches}회, 건너뜀 {report.skipped}회, 소요 {report.elapsed_seconds}초")
+    print(f"분당 실행 수: 평균 {report.mean_launches_per_minute} (실행이 있는 {report.active_minutes}분 기준), "
+          f"최대 {report.max_launches_per_minute}")
+    print(f"최대 동시 실행 수: {report.peak_concurrency} ({report.peak_at}), 최대 대기 {report.max_queue_depth}")
+    for minute, count in report.busiest_minutes:
+        print(f"  {minute}  {count}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+from pathlib import Path
+
+from scheduler.events import (RUN_STATE_CHANGED, TASK_ADDED, TASK_REMOVED, TASK_UPDATED, TASKS_RELOADED,
+                              EventBus)
+from scheduler.metrics import REGISTRY, MetricsRegistry
+from scheduler.models import Task, TaskRecord
+from scheduler.storage import storage_metrics
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    enabled INTEGER NOT NULL,
+    schedule_type TEXT NOT NULL,
+    next_run TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_enabled ON tasks (enabled);
+CREATE INDEX IF NOT EXISTS idx_tasks_next_run ON tasks (next_run);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteStorage:
+    """
+    SQLite(WAL 모드) 기반 작업 저장소입니다. Storage와 같은 인터페이스를 제공하며
+    각 작업 연산은 한 행만 읽거나 씁니다.
+    """
+
+    def __init__(self, data_dir: str = "data", db_name: str = "tasks.db", migrate_json: bool = True,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        읽기/쓰기 횟수와 바이트 수(작업 데이터 기준)는 metrics(기본값 metrics.REGISTRY)에
+        backend="sqlite" 레이블로 기록합니다.
+        """
+        self.data_dir = Path(data_dir)
+        self.db_file = self.data_dir / db_name
+
+        # 데이터 디렉토리가 없으면 생성
+        os.makedirs(self.data_dir, exist_ok=True)
+
+        # 스케줄러 스레드와 UI 스레드가 같은 연결을 공유하므로 잠금으로 직렬화
+        self._lock = threading.RLock()
+        # 작업 추가/변경/삭제와 실행 상태 변경을 알리는 이벤트 버스
+        self.events = EventBus()
+        self._reads, self._read_bytes, self._writes, self._write_bytes = storage_metrics(
+            metrics if metrics is not None else REGISTRY, "sqlite")
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        json_file = self.data_dir / "tasks.json"
+        if migrate_json and json_file.exists():
+            self.migrate_from_json(json_file)
+
+    def close(self) -> None:
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def migrate_from_json(self, json_file: Path) -> int:
+        """
+        기존 tasks.json의 작업을 한 번만 가져옵니다. 가져온 작업 수를 반환합니다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'migrated_from_json'"
+            ).fetchone()
+            if row is not None:
+                return 0
+
+            try:
+                with open(json_file, "r", encoding="utf-8") as f:
+                    tasks = [Task.from_dict(task_data) for task_data in json.load(f)]
+            except json.JSONDecodeError:
+                # 파일이 비어있거나 잘못된 형식인 경우
+                tasks = []
+
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._insert_many(tasks, replace=True)
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                    (str(json_file),)
+                )
+            return len(tasks)
+
+    def save_tasks(self, tasks: List[Task]) -> None:
+        """
+        저장된 작업 목록을 주어진 목록으로 교체합니다.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM tasks")
+            self._insert_many(tasks, replace=True)
+        self._writes.inc()
+        self.events.publish(TASKS_RELOADED)
+
+    def load_tasks(self) -> List[TaskRecord]:
+        """
+        모든 작업을 추가된 순서대로 불러옵니다.
+        """
+        return self._select("SELECT data FROM tasks ORDER BY rowid")
+
+    def snapshot(self) -> List[TaskRecord]:
+        """
+        모든 작업을 불러옵니다. (Storage와의 호환용)
+        """
+        return self.load_tasks()
+
+    def add_task(self, task: Task) -> None:
+        """
+        새 작업을 추가합니다.
+        """
+        with self._lock:
+            self._insert_many([task], replace=False)
+        self._writes.inc()
+        self.events.publish(TASK_ADDED, task.id)
+
+    def update_task(self, task: Task) -> bool:
+        """
+        작업을 업데이트합니다. 성공 시 True, 실패 시 False를 반환합니다.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET enabled = ?, schedule_type = ?, next_run = ?, data = ? WHERE id = ?",
+                (int(task.enabled), task.schedule_type, task.next_run, self._encode(task), task.id)
+            )
+        self._writes.inc()
+        if cursor.rowcount == 0:
+            return False
+        self.events.publish(TASK_UPDATED, task.id)
+        return True
+
+    def add_tasks(self, tasks: List[Task]) -> None:
+        """
+        여러 작업을 한 트랜잭션으로 추가합니다.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._insert_many(tasks, replace=False)
+        self._writes.inc()
+        for task in tasks:
+            self.events.publish(TASK_ADDED, task.id)
+
+    def update_tasks(self, tasks: List[Task]) -> int:
+        """
+        여러 작업을 한 트랜잭션으로 업데이트하고, 업데이트한 작업 수를 반환합니다.
+        저장소에 없는 작업은 건너뜁니다.
+        """
+        updated: List[Task] = []
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            for task in tasks:
+                cursor = self._conn.execute(
+                    "UPDATE tasks SET enabled = ?, schedule_type = ?, next_run = ?, data = ? WHERE id = ?",
+                    (int(task.enabled), task.schedule_type, task.next_run, self._encode(task), task.id)
+                )
+                if cursor.rowcount:
+                    updated.append(task)
+        self._writes.inc()
+        for task in updated:
+            self.events.publish(TASK_UPDATED, task.id)
+        return len(updated)
+
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """
+        여러 작업을 한 트랜잭션으로 삭제하고, 삭제한 작업 수를 반환합니다.
+        """
+        deleted: List[str] = []
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            for task_id in task_ids:
+                if self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount:
+                    deleted.append(task_id)
+        self._writes.inc()
+        for task_id in deleted:
+            self.events.publish(TASK_REMOVED, task_id)
+        return len(deleted)
+
+    def update_run_state(self, task_id: str, last_run: Optional[str], next_run: Optional[str],
+                         outcome: Optional[str] = None) -> bool:
+        """
+        작업의 실행 상태만 변경합니다. outcome이 None이면 마지막 실행 결과는 유지합니다.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tasks SET next_run = ?, data = json_set(data, '$.last_run', ?, '$.next_run', ?, "
+                "'$.last_outcome', coalesce(?, json_extract(data, '$.last_outcome'))) WHERE id = ?",
+                (next_run, last_run, next_run, outcome, task_id)
+            )
+        self._writes.inc()
+        self._write_bytes.inc(sum(len(value) for value in (last_run, next_run, outcome) if value))
+        if cursor.rowcount == 0:
+            return False
+        self.events.publish(RUN_STATE_CHANGED, task_id)
+        return True
+
+    def update_run_states(self, tasks: List[TaskRecord]) -> int:
+        """
+        여러 작업의 다음/마지막 실행 시간을 한 트랜잭션으로 기록하고, 기록한 작업 수를 반환합니다.
+        """
+        updated: List[str] = []
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            for task in tasks:
+                cursor = self._conn.execute(
+                    "UPDATE tasks SET next_run = ?, data = json_set(data, '$.last_run', ?, '$.next_run', ?) "
+                    "WHERE id = ?",
+                    (task.next_run, task.last_run, task.next_run, task.id)
+                )
+                if cursor.rowcount:
+                    updated.append(task.id)
+        self._writes.inc()
+        self._write_bytes.inc(sum(len(task.next_run or "") + len(task.last_run or "") for task in tasks))
+        for task_id in updated:
+            self.events.publish(RUN_STATE_CHANGED, task_id)
+        return len(updated)
+
+    def upsert_tasks(self, tasks: List[Task]) -> Tuple[int, int]:
+        """
+        여러 작업을 한 트랜잭션으로 추가하거나 업데이트하고, (추가한 수, 업데이트한 수)를 반환합니다.
+        이미 있는 작업은 추가된 순서(rowid)를 유지합니다.
+        """
+        added: List[Task] = []
+        updated: List[Task] = []
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            for task in tasks:
+                row = (int(task.enabled), task.schedule_type, task.next_run, self._encode(task), task.id)
+                cursor = self._conn.execute(
+                    "UPDATE tasks SET enabled = ?, schedule_type = ?, next_run = ?, data = ? WHERE id = ?", row
+                )
+                if cursor.rowcount:
+                    updated.append(task)
+                else:
+                    self._conn.execute(
+                        "INSERT INTO tasks (enabled, schedule_type, next_run, data, id) VALUES (?, ?, ?, ?, ?)", row
+                    )
+                    added.append(task)
+        self._writes.inc()
+        for task in added:
+            self.events.publish(TASK_ADDED, task.id)
+        for task in updated:
+            self.events.publish(TASK_UPDATED, task.id)
+        return len(added), len(updated)
+
+    def delete_task(self, task_id: str) -> bool:
+        """
+        작업을 삭제합니다. 성공 시 True, 실패 시 False를 반환합니다.
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self._writes.inc()
+        if cursor.rowcount == 0:
+            return False
+        self.events.publish(TASK_REMOVED, task_id)
+        return True
+
+    def get_task_by_id(self, task_id: str) -> Optional[TaskRecord]:
+        """
+        ID로 작업을 찾습니다.
+        """
+        tasks = self._select("SELECT data FROM tasks WHERE id = ?", (task_id,))
+        return tasks[0] if tasks else None
+
+    def get_enabled_tasks(self) -> List[TaskRecord]:
+        """
+        활성화된 작업을 반환합니다.
+        """
+        return self._select("SELECT data FROM tasks WHERE enabled = 1 ORDER BY rowid")
+
+    def get_due_tasks(self, before: str) -> List[TaskRecord]:
+        """
+        다음 실행 시간이 before("%Y-%m-%d %H:%M:%S")보다 이른 작업을 시간순으로 반환합니다.
+        """
+        return self._select(
+            "SELECT data FROM tasks WHERE next_run IS NOT NULL AND next_run < ? ORDER BY next_run",
+            (before,)
+        )
+
+    def flush(self) -> None:
+        """
+        모든 변경은 즉시 커밋되므로 할 일이 없습니다. (Storage와의 호환용)
+        """
+
+    def _select(self, sql: str, params: tuple = ()) -> List[TaskRecord]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        self._reads.inc()
+        self._read_bytes.inc(sum(len(data) for (data,) in rows))
+        # 저장소가 기록한 행이므로 pydantic 검증 없이 레코드로 읽음
+        return [TaskRecord.from_dict(json.loads(data)) for (data,) in rows]
+
+    def _insert_many(self, tasks: Iterable[Task], replace: bool) -> None:
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        self._conn.executemany(
+            f"{verb} INTO tasks (id, enabled, schedule_type, next_run, data) VALUES (?, ?, ?, ?, ?)",
+            [
+                (task.id, int(task.enabled), task.schedule_type, task.next_run, self._encode(task))
+                for task in tasks
+            ]
+        )
+
+    def _encode(self, task: Task) -> str:
+        data = json.dumps(task.to_dict(), ensure_ascii=False)
+        self._write_bytes.inc(len(data))
+        return data
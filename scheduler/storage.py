@@ -1,85 +1,373 @@
 import json
 import os
-from typing import List, Dict, Any
+import threading
+from typing import List, Optional, Tuple
 from pathlib import Path
 
-from scheduler.models import Task
+from scheduler.events import (RUN_STATE_CHANGED, TASK_ADDED, TASK_REMOVED, TASK_UPDATED, TASKS_RELOADED,
+                              EventBus)
+from scheduler.journal import RunStateJournal
+from scheduler.metrics import REGISTRY, MetricsRegistry
+from scheduler.models import Task, TaskRecord, as_record
+from scheduler.repository import TaskRepository
+
+def storage_metrics(metrics: MetricsRegistry, backend: str):
+    """
+    저장소 읽기/쓰기 횟수와 바이트 수 카운터를 반환합니다. (읽기, 읽은 바이트, 쓰기, 쓴 바이트)
+    """
+    return (
+        metrics.counter("storage_reads_total", "저장소 읽기 횟수", backend=backend),
+        metrics.counter("storage_read_bytes_total", "저장소에서 읽은 바이트 수", backend=backend),
+        metrics.counter("storage_writes_total", "저장소 쓰기 횟수", backend=backend),
+        metrics.counter("storage_write_bytes_total", "저장소에 쓴 바이트 수", backend=backend),
+    )
+
 
 class Storage:
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", flush_interval: float = 0.0, max_pending: int = 100,
+                 compact_threshold: int = 1000, metrics: Optional[MetricsRegistry] = None):
+        """
+        flush_interval이 0보다 크면 변경 사항을 모아 두었다가 그 시간(초) 후에 한 번에 기록합니다.
+        모인 변경이 max_pending개에 이르면 즉시 기록합니다.
+        실행 상태 저널이 compact_threshold개 레코드를 넘으면 tasks.json으로 압축합니다.
+        파일 읽기/쓰기 횟수와 바이트 수는 metrics(기본값 metrics.REGISTRY)에 backend="json" 레이블로 기록합니다.
+        """
         self.data_dir = Path(data_dir)
         self.tasks_file = self.data_dir / "tasks.json"
-        
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.compact_threshold = compact_threshold
+        self.journal = RunStateJournal(self.data_dir / "run_state.jsonl")
+        # 작업 추가/변경/삭제와 실행 상태 변경을 알리는 이벤트 버스
+        self.events = EventBus()
+        self._reads, self._read_bytes, self._writes, self._write_bytes = storage_metrics(
+            metrics if metrics is not None else REGISTRY, "json")
+
+        # 파일 내용을 캐시하는 색인 저장소와 캐시 시점의 파일 상태 (mtime, 크기)
+        self._lock = threading.RLock()
+        self._repository = TaskRepository()
+        self._file_signature: Optional[Tuple[int, int]] = None
+
+        # 아직 파일에 기록되지 않은 변경 수와 지연 기록 타이머
+        self._pending = 0
+        self._flush_timer: Optional[threading.Timer] = None
+
         # 데이터 디렉토리가 없으면 생성
         os.makedirs(self.data_dir, exist_ok=True)
-        
+
         # 작업 파일이 없으면 빈 파일 생성
         if not self.tasks_file.exists():
             with open(self.tasks_file, "w", encoding="utf-8") as f:
                 json.dump([], f)
-    
+
     def save_tasks(self, tasks: List[Task]) -> None:
         """
         작업 목록을 파일에 저장합니다.
         """
-        tasks_data = [task.to_dict() for task in tasks]
-        with open(self.tasks_file, "w", encoding="utf-8") as f:
-            json.dump(tasks_data, f, ensure_ascii=False, indent=2)
-    
-    def load_tasks(self) -> List[Task]:
+        with self._lock:
+            self._repository.replace_all(as_record(task) for task in tasks)
+            self._mark_dirty()
+        self.events.publish(TASKS_RELOADED)
+
+    def load_tasks(self) -> List[TaskRecord]:
+        """
+        작업 목록을 불러옵니다. 파일이 바뀐 경우에만 다시 읽습니다.
         """
-        작업 목록을 파일에서 불러옵니다.
+        with self._lock:
+            self._refresh()
+            return self._repository.all()
+
+    def snapshot(self) -> List[TaskRecord]:
         """
-        if not self.tasks_file.exists():
-            return []
-        
-        with open(self.tasks_file, "r", encoding="utf-8") as f:
-            try:
-                tasks_data = json.load(f)
-                return [Task.from_dict(task_data) for task_data in tasks_data]
-            except json.JSONDecodeError:
-                # 파일이 비어있거나 잘못된 형식인 경우
-                return []
-            
+        파일을 확인하지 않고 캐시된 작업 목록의 복사본을 반환합니다.
+        """
+        with self._lock:
+            if self._file_signature is None:
+                self._refresh()
+            return self._repository.all()
+
+    def is_stale(self) -> bool:
+        """
+        마지막으로 읽은 뒤 다른 프로세스가 작업 파일을 수정했는지 확인합니다. (파일을 읽지 않고 stat만 확인)
+        """
+        with self._lock:
+            if self._pending or self._file_signature is None:
+                return False
+            return self._stat_signature() != self._file_signature
+
     def add_task(self, task: Task) -> None:
         """
-        새 작업을 추가합니다.
+        새 작업을 추가합니다. Task는 레코드로 바꿔 보관합니다.
         """
-        tasks = self.load_tasks()
-        tasks.append(task)
-        self.save_tasks(tasks)
-    
+        task = as_record(task)
+        with self._lock:
+            self._refresh()
+            self._repository.put(task)
+            self._mark_dirty()
+        self.events.publish(TASK_ADDED, task.id)
+
     def update_task(self, task: Task) -> bool:
         """
         작업을 업데이트합니다. 성공 시 True, 실패 시 False를 반환합니다.
         """
-        tasks = self.load_tasks()
-        for i, t in enumerate(tasks):
-            if t.id == task.id:
-                tasks[i] = task
-                self.save_tasks(tasks)
-                return True
-        return False
-    
+        task = as_record(task)
+        with self._lock:
+            self._refresh()
+            if task.id not in self._repository:
+                return False
+            self._repository.put(task)
+            self._mark_dirty()
+        self.events.publish(TASK_UPDATED, task.id)
+        return True
+
     def delete_task(self, task_id: str) -> bool:
         """
         작업을 삭제합니다. 성공 시 True, 실패 시 False를 반환합니다.
         """
-        tasks = self.load_tasks()
-        initial_count = len(tasks)
-        tasks = [t for t in tasks if t.id != task_id]
-        
-        if len(tasks) < initial_count:
-            self.save_tasks(tasks)
-            return True
-        return False
-    
-    def get_task_by_id(self, task_id: str) -> Task:
+        with self._lock:
+            self._refresh()
+            if not self._repository.remove(task_id):
+                return False
+            self._mark_dirty()
+        self.events.publish(TASK_REMOVED, task_id)
+        return True
+
+    def add_tasks(self, tasks: List[Task]) -> None:
         """
-        ID로 작업을 찾습니다.
+        여러 작업을 추가합니다. 파일은 한 번만 기록합니다.
+        """
+        tasks = [as_record(task) for task in tasks]
+        with self._lock:
+            self._refresh()
+            for task in tasks:
+                self._repository.put(task)
+            self._mark_dirty()
+        for task in tasks:
+            self.events.publish(TASK_ADDED, task.id)
+
+    def update_tasks(self, tasks: List[Task]) -> int:
         """
-        tasks = self.load_tasks()
+        여러 작업을 업데이트합니다. 파일은 한 번만 기록하고, 업데이트한 작업 수를 반환합니다.
+        저장소에 없는 작업은 건너뜁니다.
+        """
+        with self._lock:
+            self._refresh()
+            updated = [as_record(task) for task in tasks if task.id in self._repository]
+            for task in updated:
+                self._repository.put(task)
+            if updated:
+                self._mark_dirty()
+        for task in updated:
+            self.events.publish(TASK_UPDATED, task.id)
+        return len(updated)
+
+    def upsert_tasks(self, tasks: List[Task]) -> Tuple[int, int]:
+        """
+        여러 작업을 추가하거나 업데이트합니다. 파일은 한 번만 기록하고, (추가한 수, 업데이트한 수)를 반환합니다.
+        """
+        tasks = [as_record(task) for task in tasks]
+        with self._lock:
+            self._refresh()
+            existing = {task.id for task in tasks if task.id in self._repository}
+            for task in tasks:
+                self._repository.put(task)
+            if tasks:
+                self._mark_dirty()
         for task in tasks:
-            if task.id == task_id:
-                return task
-        return None 
\ No newline at end of file
+            self.events.publish(TASK_UPDATED if task.id in existing else TASK_ADDED, task.id)
+        return len(tasks) - len(existing), len(existing)
+
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """
+        여러 작업을 삭제합니다. 파일은 한 번만 기록하고, 삭제한 작업 수를 반환합니다.
+        """
+        with self._lock:
+            self._refresh()
+            deleted = [task_id for task_id in task_ids if self._repository.remove(task_id)]
+            if deleted:
+                self._mark_dirty()
+        for task_id in deleted:
+            self.events.publish(TASK_REMOVED, task_id)
+        return len(deleted)
+
+    def update_run_state(self, task_id: str, last_run: Optional[str], next_run: Optional[str],
+                         outcome: Optional[str] = None) -> bool:
+        """
+        작업의 실행 상태만 변경합니다. tasks.json을 다시 쓰지 않고 저널에 한 줄을 추가합니다.
+        outcome이 None이면 마지막 실행 결과는 유지합니다.
+        """
+        with self._lock:
+            self._refresh()
+            if not self._repository.set_run_state(task_id, last_run, next_run, outcome):
+                return False
+            self._writes.inc()
+            self._write_bytes.inc(self.journal.append(task_id, last_run, next_run, outcome))
+
+            # 저널이 충분히 길어지면 스냅샷으로 압축
+            if len(self.journal) >= self.compact_threshold:
+                self._mark_dirty()
+        self.events.publish(RUN_STATE_CHANGED, task_id)
+        return True
+
+    def update_run_states(self, tasks: List[TaskRecord]) -> int:
+        """
+        여러 작업의 다음/마지막 실행 시간을 저널에 한 번에 기록하고, 기록한 작업 수를 반환합니다.
+        저널이 길어져도 압축은 한 번만 합니다. (시작할 때 모든 작업의 next_run을 갱신하는 용도)
+        """
+        with self._lock:
+            self._refresh()
+            records = []
+            for task in tasks:
+                if not self._repository.set_run_state(task.id, task.last_run, task.next_run):
+                    continue
+                records.append((task.id, task.last_run, task.next_run, None))
+            if records:
+                self._writes.inc()
+                self._write_bytes.inc(self.journal.append_many(records))
+                if len(self.journal) >= self.compact_threshold:
+                    self._mark_dirty()
+        for task_id, _, _, _ in records:
+            self.events.publish(RUN_STATE_CHANGED, task_id)
+        return len(records)
+
+    def compact(self) -> None:
+        """
+        실행 상태 저널을 tasks.json 스냅샷에 반영하고 저널을 비웁니다.
+        """
+        with self._lock:
+            self._refresh()
+            self._write_tasks()
+
+    def flush(self) -> None:
+        """
+        기록 대기 중인 변경 사항을 즉시 파일에 기록합니다.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._pending:
+                self._write_tasks()
+
+    def close(self) -> None:
+        """
+        기록 대기 중인 변경 사항을 기록하고 실행 상태 저널 파일을 닫습니다.
+        닫은 뒤에 실행 상태를 기록하면 저널 파일을 다시 엽니다.
+        """
+        self.flush()
+        self.journal.close()
+
+    def get_task_by_id(self, task_id: str) -> Optional[TaskRecord]:
+        """
+        ID로 작업을 찾습니다.
+        """
+        with self._lock:
+            self._refresh()
+            return self._repository.get(task_id)
+
+    def get_enabled_tasks(self) -> List[TaskRecord]:
+        """
+        활성화된 작업을 반환합니다.
+        """
+        with self._lock:
+            self._refresh()
+            return self._repository.enabled(True)
+
+    def get_due_tasks(self, before: str) -> List[TaskRecord]:
+        """
+        다음 실행 시간이 before("%Y-%m-%d %H:%M:%S")보다 이른 작업을 시간순으로 반환합니다.
+        """
+        with self._lock:
+            self._refresh()
+            return self._repository.due_before(before)
+
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.tasks_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        """
+        파일의 mtime이나 크기가 바뀌었으면 캐시를 다시 채웁니다.
+        """
+        if self._pending:
+            # 기록되지 않은 변경이 있으면 메모리 상태가 최신임
+            return
+
+        signature = self._stat_signature()
+        if signature is not None and signature == self._file_signature:
+            return
+
+        tasks: List[TaskRecord] = []
+        if signature is not None:
+            self._reads.inc()
+            self._read_bytes.inc(signature[1])
+            with open(self.tasks_file, "r", encoding="utf-8") as f:
+                try:
+                    tasks_data = json.load(f)
+                    # 저장소가 기록한 파일이므로 pydantic 검증 없이 레코드로 읽음
+                    tasks = [TaskRecord.from_dict(task_data) for task_data in tasks_data]
+                except json.JSONDecodeError:
+                    # 파일이 비어있거나 잘못된 형식인 경우
+                    tasks = []
+
+        # 방금 읽은 레코드이므로 복사하지 않고 보관
+        self._repository.replace_all(tasks, owned=True)
+
+        # 스냅샷 이후 저널에 기록된 실행 상태를 덮어씀
+        for task_id, state in self.journal.replay().items():
+            self._repository.set_run_state(task_id, state["last_run"], state["next_run"], state["outcome"])
+
+        reloaded = self._file_signature is not None
+        self._file_signature = signature
+        if reloaded:
+            # 다른 프로세스가 파일을 수정함 (첫 로드는 알리지 않음)
+            self.events.publish(TASKS_RELOADED)
+
+    def _mark_dirty(self) -> None:
+        """
+        변경을 기록 대기 상태로 표시하고 기록 시점을 정합니다.
+        """
+        self._pending += 1
+        if self.flush_interval <= 0 or self._pending >= self.max_pending:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _write_tasks(self) -> None:
+        """
+        캐시된 작업 목록을 임시 파일에 쓰고 fsync 후 원자적으로 교체합니다.
+        """
+        tasks_data = self._repository.to_dicts()
+        temp_file = self.tasks_file.with_name(self.tasks_file.name + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            # 한 번에 직렬화해서 쓰는 편이 json.dump로 조각조각 쓰는 것보다 빠름
+            f.write(json.dumps(tasks_data, ensure_ascii=False, indent=2))
+            f.flush()
+            self._writes.inc()
+            self._write_bytes.inc(f.tell())
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.tasks_file)
+        self._fsync_data_dir()
+
+        # 스냅샷에 모든 실행 상태가 포함되었으므로 저널을 비움
+        self.journal.truncate()
+
+        self._pending = 0
+        self._file_signature = self._stat_signature()
+
+    def _fsync_data_dir(self) -> None:
+        """
+        이름 변경이 디스크에 반영되도록 디렉토리를 fsync합니다 (POSIX 전용).
+        """
+        if os.name != "posix":
+            return
+        fd = os.open(self.data_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,99 @@
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from scheduler.models import Task
+
+# CSV 열 순서 (Task 필드 순서와 같음)
+CSV_FIELDS = list(Task.model_fields)
+
+
+def _to_csv_row(task: Task) -> Dict[str, str]:
+    row: Dict[str, str] = {}
+    for field, value in task.to_dict().items():
+        if value is None:
+            row[field] = ""
+        elif isinstance(value, bool):
+            row[field] = "true" if value else "false"
+        elif isinstance(value, list):
+            # 요일 목록은 세미콜론으로 구분
+            row[field] = ";".join(str(item) for item in value)
+        else:
+            row[field] = str(value)
+    return row
+
+
+def _from_csv_row(row: Dict[str, str]) -> Task:
+    data: Dict[str, Any] = {}
+    for field, value in row.items():
+        if field not in Task.model_fields or value is None or value == "":
+            # 빈 칸은 기본값 사용
+            continue
+        if field == "days":
+            data[field] = [int(day) for day in value.split(";") if day.strip()]
+        else:
+            data[field] = value
+    return Task.model_validate(data)
+
+
+def read_tasks(path: str) -> List[Task]:
+    """
+    JSON 또는 CSV 파일(확장자로 구분)에서 작업 목록을 읽습니다.
+    형식이 잘못된 행이 있으면 행 번호와 함께 ValueError를 발생시킵니다.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        parse = _from_csv_row
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        parse = Task.from_dict
+
+    tasks: List[Task] = []
+    errors: List[str] = []
+    for number, row in enumerate(rows, start=1):
+        try:
+            tasks.append(parse(row))
+        except (ValueError, TypeError) as e:
+            errors.append(f"{number}번째 항목: {e}")
+    if errors:
+        raise ValueError(f"작업 {len(errors)}건을 읽지 못했습니다: " + "; ".join(errors[:10]))
+    return tasks
+
+
+def write_tasks(path: str, tasks: List[Task]) -> None:
+    """
+    작업 목록을 JSON 또는 CSV 파일(확장자로 구분)로 씁니다.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(_to_csv_row(task) for task in tasks)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([task.to_dict() for task in tasks], f, ensure_ascii=False, indent=2)
+
+
+def import_tasks(scheduler, path: str) -> Tuple[int, int]:
+    """
+    파일의 작업을 스케줄러에 가져옵니다. 이미 있는 ID는 업데이트하고 나머지는 추가합니다.
+    올바르지 않은 작업이 하나라도 있으면 아무것도 가져오지 않고 ValueError를 발생시킵니다.
+    (추가한 수, 업데이트한 수)를 반환합니다.
+    """
+    tasks = read_tasks(path)
+    # 스케줄러가 파일 전체를 먼저 검사하고, 추가와 업데이트를 저장소에 한 번에 기록
+    return scheduler.upsert_tasks(tasks)
+
+
+def export_tasks(storage, path: str) -> int:
+    """
+    저장소의 모든 작업을 파일로 내보냅니다. 내보낸 작업 수를 반환합니다.
+    """
+    tasks = storage.snapshot()
+    write_tasks(path, tasks)
+    return len(tasks)
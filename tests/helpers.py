@@ -0,0 +1,69 @@
+import tempfile
+import unittest
+from typing import List, Optional
+
+from scheduler.metrics import MetricsRegistry
+from scheduler.scheduler import Scheduler
+from scheduler.sqlite_storage import SQLiteStorage
+from scheduler.storage import Storage
+
+
+def open_storage(backend: str, data_dir: str, metrics: Optional[MetricsRegistry] = None):
+    """
+    테스트용 저장소를 엽니다. JSON 저장소는 변경을 모으지 않고 바로 기록합니다.
+    """
+    metrics = metrics if metrics is not None else MetricsRegistry()
+    if backend == "sqlite":
+        return SQLiteStorage(data_dir, metrics=metrics)
+    return Storage(data_dir, flush_interval=0, metrics=metrics)
+
+
+class StorageTestCase(unittest.TestCase):
+    """
+    임시 데이터 디렉토리에 저장소를 엽니다. 테스트가 끝나면 만든 스케줄러를 중지하고 저장소를 닫습니다.
+    backend를 "sqlite"로 바꾼 하위 클래스는 같은 테스트를 SQLite 저장소로 실행합니다.
+    """
+    backend = "json"
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.data_dir = self._dir.name
+        # 저장소 지표 (기록 횟수 확인용)
+        self.metrics = MetricsRegistry()
+        self._storages: List = []
+        self._schedulers: List = []
+        self.storage = self.open_storage(self.metrics)
+
+    def tearDown(self):
+        for scheduler in self._schedulers:
+            scheduler.stop()
+        for storage in self._storages:
+            storage.close()
+        self._dir.cleanup()
+
+    def open_storage(self, metrics: Optional[MetricsRegistry] = None):
+        """
+        같은 데이터 디렉토리를 새 저장소 인스턴스로 엽니다.
+        """
+        storage = open_storage(self.backend, self.data_dir, metrics)
+        self._storages.append(storage)
+        return storage
+
+    def make_scheduler(self, scheduler_class=Scheduler, **kwargs):
+        """
+        self.storage를 쓰는 스케줄러를 만듭니다. 인자는 스케줄러 생성자에 그대로 넘깁니다.
+        """
+        kwargs.setdefault("metrics", MetricsRegistry())
+        scheduler = scheduler_class(self.storage, **kwargs)
+        self._schedulers.append(scheduler)
+        return scheduler
+
+
+class SchedulerTestCase(StorageTestCase):
+    """
+    StorageTestCase에 기본 설정의 Scheduler를 더합니다.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.scheduler = self.make_scheduler()
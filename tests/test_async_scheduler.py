@@ -0,0 +1,53 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from scheduler.async_scheduler import AsyncScheduler
+from scheduler.events import RUN_FINISHED
+from scheduler.models import Task
+from tests.helpers import StorageTestCase
+
+
+class AsyncSchedulerTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = self.make_scheduler(AsyncScheduler)
+
+    def test_start_failure_is_raised(self):
+        def broken():
+            raise OSError("저장소를 읽을 수 없음")
+        self.storage.get_enabled_tasks = broken
+
+        outcome = []
+        caller = threading.Thread(target=lambda: outcome.append(self._start()))
+        caller.start()
+        caller.join(5)
+        self.assertFalse(caller.is_alive(), "start()가 반환되지 않음")
+        self.assertIsInstance(outcome[0], OSError)
+        self.assertFalse(self.scheduler.running)
+
+    def _start(self):
+        try:
+            self.scheduler.start()
+        except Exception as e:
+            return e
+        return None
+
+    def test_runs_task_on_loop(self):
+        self.assertIsNone(self.scheduler.executor)
+        finished = threading.Event()
+        runs = []
+        self.storage.events.subscribe(RUN_FINISHED, lambda task_id, run: (runs.append(run), finished.set()))
+        self.scheduler.start()
+        self.assertTrue(self.scheduler.running)
+
+        at = (datetime.now() + timedelta(seconds=1)).strftime("%H:%M:%S")
+        task = Task(name="soon", file_path="/bin/true", schedule_type="daily", time=at)
+        self.scheduler.add_task(task)
+        self.assertTrue(finished.wait(10))
+        self.assertEqual(runs[0].exit_code, 0)
+        self.assertIsNotNone(self.storage.get_task_by_id(task.id).last_run)
+
+
+if __name__ == "__main__":
+    unittest.main()
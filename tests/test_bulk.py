@@ -0,0 +1,118 @@
+import json
+import unittest
+from pathlib import Path
+
+from scheduler.models import Task, TaskRecord
+from scheduler.transfer import import_tasks, write_tasks
+from tests.helpers import SchedulerTestCase
+
+
+def daily(name: str, enabled: bool = True) -> Task:
+    return Task(name=name, file_path="/bin/true", schedule_type="daily", time="03:00:00", enabled=enabled)
+
+
+def broken(name: str, enabled: bool = False) -> TaskRecord:
+    # 시각이 없는 매일 작업은 반복 규칙을 만들 수 없음 (검증 없는 레코드로만 만들 수 있음)
+    return TaskRecord(name=name, file_path="/bin/true", schedule_type="daily", enabled=enabled)
+
+
+class BulkTestCase(SchedulerTestCase):
+    def writes(self) -> float:
+        return self.metrics.get("storage_writes_total", backend=self.backend) or 0.0
+
+    def stored(self):
+        return {task.id: task for task in self.open_storage().load_tasks()}
+
+
+class SetEnabledTest(BulkTestCase):
+    def test_rejected_batch_changes_nothing(self):
+        good, bad = daily("good", enabled=False), broken("bad")
+        self.scheduler.add_tasks([good, bad])
+        with self.assertRaises(ValueError):
+            self.scheduler.set_enabled([good.id, bad.id], True)
+
+        self.assertEqual(len(self.scheduler.jobs), 0)
+        self.storage.flush()
+        stored = self.stored()
+        self.assertFalse(stored[good.id].enabled)
+        self.assertFalse(stored[bad.id].enabled)
+        self.assertEqual(self.storage.get_enabled_tasks(), [])
+
+    def test_enable_and_disable(self):
+        tasks = [daily("a", enabled=False), daily("b", enabled=False)]
+        self.scheduler.add_tasks(tasks)
+        self.scheduler.set_enabled([task.id for task in tasks], True)
+        self.assertEqual(len(self.scheduler.jobs), 2)
+        self.assertTrue(all(task.enabled and task.next_run for task in self.stored().values()))
+        self.scheduler.set_enabled([tasks[0].id], False)
+        self.assertEqual(self.scheduler.jobs.task_ids(), [tasks[1].id])
+
+    def test_unknown_id_raises(self):
+        with self.assertRaises(ValueError):
+            self.scheduler.set_enabled(["missing"], True)
+
+
+class BulkValidationTest(BulkTestCase):
+    def test_duplicate_ids_reject_whole_batch(self):
+        task = daily("a")
+        with self.assertRaises(ValueError):
+            self.scheduler.add_tasks([task, task])
+        self.assertEqual(self.stored(), {})
+        self.assertEqual(len(self.scheduler.jobs), 0)
+
+    def test_update_of_missing_task_rejects_whole_batch(self):
+        task = daily("a")
+        self.scheduler.add_tasks([task])
+        edited = self.storage.get_task_by_id(task.id)
+        edited.time = "05:00:00"
+        with self.assertRaises(ValueError):
+            self.scheduler.update_tasks([edited, daily("missing")])
+        self.assertEqual(self.stored()[task.id].time, "03:00:00")
+
+
+class ImportTest(BulkTestCase):
+    def setUp(self):
+        super().setUp()
+        self.existing = daily("existing")
+        self.scheduler.add_tasks([self.existing])
+        self.path = str(Path(self.data_dir) / "import.json")
+
+    def test_import_writes_once(self):
+        edited = self.storage.get_task_by_id(self.existing.id)
+        edited.time = "06:00:00"
+        write_tasks(self.path, [edited, daily("new")])
+
+        before = self.writes()
+        self.assertEqual(import_tasks(self.scheduler, self.path), (1, 1))
+        self.assertEqual(self.writes() - before, 1)
+
+        stored = self.stored()
+        self.assertEqual(len(stored), 2)
+        self.assertEqual(stored[self.existing.id].time, "06:00:00")
+        self.assertEqual(list(stored)[0], self.existing.id)
+        self.assertTrue(all(task.next_run for task in stored.values()))
+        self.assertEqual(len(self.scheduler.jobs), 2)
+
+    def test_invalid_import_changes_nothing(self):
+        data = [daily("new").to_dict(), broken("bad", enabled=True).to_dict()]
+        Path(self.path).write_text(json.dumps(data), encoding="utf-8")
+        with self.assertRaises(ValueError):
+            import_tasks(self.scheduler, self.path)
+        self.assertEqual(list(self.stored()), [self.existing.id])
+        self.assertEqual(self.scheduler.jobs.task_ids(), [self.existing.id])
+
+
+class SQLiteSetEnabledTest(SetEnabledTest):
+    backend = "sqlite"
+
+
+class SQLiteBulkValidationTest(BulkValidationTest):
+    backend = "sqlite"
+
+
+class SQLiteImportTest(ImportTest):
+    backend = "sqlite"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from scheduler.daemon import SchedulerDaemon
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class SchedulerDaemonTest(unittest.TestCase):
+    def test_requests_from_other_thread_wake_main_loop(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            daemon = SchedulerDaemon(data_dir, flush_interval=0)
+            reloads = []
+            daemon.scheduler.reload = lambda: reloads.append(True)
+            runner = threading.Thread(target=daemon.run)
+            runner.start()
+            daemon.request_reload()
+            deadline = time.monotonic() + 5
+            while not reloads and time.monotonic() < deadline:
+                time.sleep(0.01)
+            daemon.request_stop()
+            runner.join(5)
+            self.assertFalse(runner.is_alive())
+            self.assertEqual(reloads, [True])
+
+    @unittest.skipUnless(hasattr(signal, "SIGHUP"), "POSIX 시그널 필요")
+    def test_signal_burst_does_not_deadlock(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "scheduler", "--data-dir", data_dir, "--log-file", "-",
+                 "--log-level", "ERROR"],
+                cwd=ROOT, stderr=subprocess.PIPE, text=True)
+            try:
+                time.sleep(1.0)
+                for _ in range(300):
+                    os.kill(process.pid, signal.SIGHUP)
+                os.kill(process.pid, signal.SIGTERM)
+                self.assertEqual(process.wait(timeout=20), 0)
+            finally:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stderr.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from scheduler.clock import VirtualClock
+from scheduler.engine import TimerEngine
+from scheduler.recurrence import DailyRecurrence
+
+START = datetime(2026, 1, 5, 9, 0, 0)
+
+
+class VirtualTimerEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(START)
+        self.engine = TimerEngine(clock=self.clock)
+        self.fired = []
+
+    def test_fires_in_deadline_order(self):
+        # 등록 순서와 관계없이 마감 시각 순으로, 같은 시각이면 등록 순으로 실행
+        for name, minutes in (("c", 3), ("a", 1), ("b", 2), ("b2", 2)):
+            self.engine.call_at(START + timedelta(minutes=minutes), self.fired.append, name)
+
+        self.clock.advance(timedelta(minutes=1, seconds=30))
+        self.assertEqual(self.engine.run_due(), 1)
+        self.clock.advance(timedelta(minutes=5))
+        self.assertEqual(self.engine.run_due(), 3)
+        self.assertEqual(self.fired, ["a", "b", "b2", "c"])
+        self.assertIsNone(self.engine.next_deadline())
+
+    def test_cancelled_timer_does_not_fire(self):
+        handle = self.engine.call_at(START + timedelta(minutes=1), self.fired.append, "cancelled")
+        self.engine.call_at(START + timedelta(minutes=2), self.fired.append, "kept")
+        handle.cancel()
+        self.assertEqual(len(self.engine), 1)
+        self.assertEqual(self.engine.next_deadline(), (START + timedelta(minutes=2)).timestamp())
+
+        self.clock.advance(timedelta(minutes=3))
+        self.engine.run_due()
+        self.assertEqual(self.fired, ["kept"])
+
+    def test_every_skips_missed_intervals(self):
+        self.engine.call_at(START + timedelta(minutes=1), self.fired.append, "tick", every=timedelta(minutes=10))
+        # 35분 늦게 깨어나도 한 번만 실행하고 다음 간격으로 이동
+        self.clock.advance(timedelta(minutes=36))
+        self.assertEqual(self.engine.run_due(), 1)
+        self.assertEqual(self.engine.next_deadline(), (START + timedelta(minutes=41)).timestamp())
+
+    def test_recurrence_reschedules(self):
+        self.engine.call_at(START + timedelta(minutes=30), self.fired.append, "daily",
+                            recurrence=DailyRecurrence(datetime(2026, 1, 1, 9, 30).time()))
+        self.clock.advance(timedelta(minutes=31))
+        self.assertEqual(self.engine.run_due(), 1)
+        self.assertEqual(self.engine.next_deadline(), datetime(2026, 1, 6, 9, 30).timestamp())
+        self.assertEqual(len(self.engine), 1)
+
+    def test_callback_error_does_not_stop_dispatch(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        self.engine.call_at(START, fail)
+        self.engine.call_at(START, self.fired.append, "after")
+        with self.assertLogs("Scheduler", level="ERROR"):
+            self.assertEqual(self.engine.run_due(), 2)
+        self.assertEqual(self.fired, ["after"])
+
+
+class ThreadedTimerEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = TimerEngine()
+        self.engine.start()
+
+    def tearDown(self):
+        self.engine.stop()
+
+    def test_earlier_timer_wakes_dispatch_thread(self):
+        fired = threading.Event()
+        # 스레드가 먼 타이머를 기다리는 중에 더 빠른 타이머를 등록
+        self.engine.call_later(timedelta(hours=1), fired.set)
+        time.sleep(0.05)
+        started = time.monotonic()
+        self.engine.call_later(timedelta(milliseconds=20), fired.set)
+        self.assertTrue(fired.wait(2.0))
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_stop_keeps_pending_timers(self):
+        self.engine.call_later(timedelta(hours=1), lambda: None)
+        self.engine.stop()
+        self.assertEqual(len(self.engine), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtWidgets import QApplication
+except ImportError:
+    QApplication = None
+
+from scheduler.events import RUN_FINISHED, TASK_REMOVED, TASK_UPDATED, TASKS_RELOADED, EventBus
+from scheduler.history import RunRecord
+
+if QApplication is not None:
+    from ui.event_bridge import EventBridge
+
+
+def setUpModule():
+    if QApplication is not None and QApplication.instance() is None:
+        # 테스트가 끝날 때까지 참조를 유지
+        global _app
+        _app = QApplication([])
+
+
+@unittest.skipIf(QApplication is None, "PyQt6가 설치되어 있지 않음")
+class EventBridgeTest(unittest.TestCase):
+    def setUp(self):
+        self.events = EventBus()
+        self.bridge = EventBridge(self.events)
+        self.changes = []
+        self.runs = []
+        self.bridge.tasks_changed.connect(
+            lambda changed, removed, reload: self.changes.append((changed, removed, reload, threading.get_ident())))
+        self.bridge.runs_finished.connect(self.runs.append)
+
+    def tearDown(self):
+        self.bridge.close()
+        self.bridge.deleteLater()
+
+    def publish_from_worker(self, publish) -> None:
+        worker = threading.Thread(target=publish)
+        worker.start()
+        worker.join()
+
+    def wait_for_changes(self, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while len(self.changes) < count and time.monotonic() < deadline:
+            QTest.qWait(5)
+        # 추가로 전달되는 것이 없는지 몇 프레임 더 기다림
+        QTest.qWait(80)
+
+    def test_burst_from_worker_is_coalesced(self):
+        def publish():
+            for i in range(500):
+                self.events.publish(TASK_UPDATED, f"task-{i}")
+            self.events.publish(TASK_REMOVED, "task-0")
+            self.events.publish(RUN_FINISHED, "task-1", RunRecord("task-1", 100, 0.0, 1.0, 0, 0.0))
+
+        self.publish_from_worker(publish)
+        # 대기열로 넘어가므로 이벤트 루프를 돌리기 전에는 전달되지 않음
+        self.assertEqual(self.changes, [])
+
+        self.wait_for_changes(1)
+        self.assertEqual(len(self.changes), 1)
+        changed, removed, reload, thread = self.changes[0]
+        self.assertEqual(changed, {f"task-{i}" for i in range(1, 500)})
+        self.assertEqual(removed, {"task-0"})
+        self.assertFalse(reload)
+        self.assertEqual(thread, threading.get_ident())
+        self.assertEqual([[run.task_id for run in runs] for runs in self.runs], [["task-1"]])
+
+    def test_next_burst_is_delivered_separately(self):
+        self.publish_from_worker(lambda: self.events.publish(TASK_UPDATED, "a"))
+        self.wait_for_changes(1)
+        self.publish_from_worker(lambda: self.events.publish(TASKS_RELOADED))
+        self.wait_for_changes(2)
+        self.assertEqual([(changed, reload) for changed, _, reload, _ in self.changes],
+                         [({"a"}, False), (set(), True)])
+
+    def test_close_unsubscribes(self):
+        self.bridge.close()
+        self.publish_from_worker(lambda: self.events.publish(TASK_UPDATED, "a"))
+        QTest.qWait(50)
+        self.assertEqual(self.changes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
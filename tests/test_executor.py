@@ -0,0 +1,107 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from scheduler.executor import LaunchExecutor
+from scheduler.models import TaskRecord
+
+# 실행 중인 프로세스 수를 확인할 수 있도록 잠시 머무는 스크립트
+SLEEP_SCRIPT = "#!/bin/sh\nsleep 0.3\n"
+
+
+@unittest.skipUnless(os.name == "posix", "셸 스크립트로 실행할 작업을 만듦")
+class LaunchExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.script = Path(self._dir.name) / "sleep.sh"
+        self.script.write_text(SLEEP_SCRIPT)
+        self.script.chmod(0o755)
+
+        self.lock = threading.Lock()
+        self.launched = []
+        self.finished = []
+        self.errors = []
+        self.peak = 0
+        self.done = threading.Semaphore(0)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self._dir.cleanup()
+
+    def open_executor(self, **kwargs) -> LaunchExecutor:
+        self.executor = LaunchExecutor(self._on_launch, self._on_exit, self._on_error, **kwargs)
+        return self.executor
+
+    def task(self, name: str, **fields) -> TaskRecord:
+        return TaskRecord(name=name, file_path=str(self.script), schedule_type="daily", time="03:00:00", **fields)
+
+    def wait_done(self, count: int) -> None:
+        for _ in range(count):
+            self.assertTrue(self.done.acquire(timeout=10))
+
+    def _on_launch(self, task, run):
+        with self.lock:
+            self.launched.append(run)
+            self.peak = max(self.peak, self.executor.running_count())
+
+    def _on_exit(self, task, run):
+        with self.lock:
+            self.finished.append(run)
+        self.done.release()
+
+    def _on_error(self, task, run):
+        with self.lock:
+            self.errors.append(run)
+        self.done.release()
+
+    def test_max_processes_caps_concurrency(self):
+        executor = self.open_executor(max_workers=4, max_processes=2)
+        for i in range(4):
+            self.assertTrue(executor.submit(self.task(f"task-{i}")))
+        self.wait_done(4)
+
+        self.assertEqual(len(self.finished), 4)
+        self.assertEqual(self.peak, 2)
+        # 세 번째 프로세스는 앞선 프로세스 하나가 끝난 뒤에야 시작
+        first_exit = min(run.ended_at for run in self.finished)
+        third_start = sorted(run.started_at for run in self.launched)[2]
+        self.assertGreaterEqual(third_start, first_exit)
+        self.assertTrue(all(run.exit_code == 0 for run in self.finished))
+        self.assertEqual(executor.running_count(), 0)
+
+    def test_max_instances_rejects_overlap(self):
+        executor = self.open_executor(max_workers=2)
+        task = self.task("single", max_instances=1)
+        self.assertTrue(executor.submit(task))
+        self.assertFalse(executor.submit(task))
+        # 다른 작업은 제한을 받지 않음
+        self.assertTrue(executor.submit(self.task("other")))
+        self.assertEqual(executor.running_count(task.id), 1)
+
+        self.wait_done(2)
+        self.assertEqual(executor.running_count(task.id), 0)
+        self.assertTrue(executor.submit(task))
+        self.wait_done(1)
+        self.assertEqual(len(self.finished), 3)
+
+    def test_launch_error_releases_slot_and_instance(self):
+        executor = self.open_executor(max_workers=1, max_processes=1)
+        missing = self.task("missing", max_instances=1)
+        missing.file_path = str(Path(self._dir.name) / "missing.sh")
+        with self.assertLogs("Scheduler", level="ERROR"):
+            self.assertTrue(executor.submit(missing))
+            self.wait_done(1)
+        self.assertEqual(len(self.errors), 1)
+        self.assertIsNone(self.errors[0].pid)
+        self.assertEqual(executor.running_count(missing.id), 0)
+
+        # 슬롯이 반환되었으므로 다음 작업이 실행됨
+        self.assertTrue(executor.submit(self.task("after")))
+        self.wait_done(1)
+        self.assertEqual(len(self.finished), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from scheduler import forecast
+from scheduler.clock import VirtualClock
+from scheduler.forecast import ForecastIndex
+from scheduler.models import TaskRecord
+from scheduler.recurrence import TIME_FORMAT
+
+START = datetime(2026, 1, 5, 0, 0, 0)
+
+
+def daily(name: str, at: str) -> TaskRecord:
+    return TaskRecord(id=name, name=name, file_path="/bin/true", schedule_type="daily", time=at)
+
+
+def interval(name: str, minutes: int, next_run: datetime) -> TaskRecord:
+    return TaskRecord(id=name, name=name, file_path="/bin/true", schedule_type="interval",
+                      interval_minutes=minutes, next_run=next_run.strftime(TIME_FORMAT))
+
+
+class ForecastIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(START)
+        self.index = ForecastIndex(horizon=timedelta(hours=6), clock=self.clock)
+
+    def test_between_merges_tasks_in_time_order(self):
+        self.index.update_many([daily("b", "01:00:00"), daily("a", "01:00:00"),
+                                interval("c", 30, START + timedelta(minutes=20))])
+        occurrences = self.index.between(START, START + timedelta(hours=1, minutes=30))
+        self.assertEqual(occurrences, [
+            (START + timedelta(minutes=20), "c"),
+            (START + timedelta(minutes=50), "c"),
+            (START + timedelta(hours=1), "a"),
+            (START + timedelta(hours=1), "b"),
+            (START + timedelta(hours=1, minutes=20), "c"),
+        ])
+
+    def test_histogram(self):
+        self.index.update_many([daily("a", "00:01:00"), daily("b", "00:01:30"),
+                                interval("c", 2, START + timedelta(minutes=2))])
+        histogram = self.index.histogram(START, START + timedelta(minutes=5))
+        self.assertEqual([count for _, count in histogram], [0, 2, 1, 0, 1])
+        self.assertEqual(histogram[1][0], START + timedelta(minutes=1))
+
+    def test_update_and_remove_touch_only_that_task(self):
+        a, b = daily("a", "01:00:00"), daily("b", "02:00:00")
+        self.index.update_many([a, b])
+        self.assertEqual(len(self.index), 2)
+
+        a.time = "03:00:00"
+        self.index.update(a)
+        self.assertEqual([task_id for _, task_id in self.index.between(START, START + timedelta(hours=6))],
+                         ["b", "a"])
+        b.enabled = False
+        self.index.update(b)
+        self.index.remove("a")
+        self.assertEqual(len(self.index), 0)
+
+    def test_advance_on_time_does_not_recompute(self):
+        task = interval("c", 1, START + timedelta(minutes=1))
+        self.index.update(task)
+        # 1분부터 5시간 59분까지
+        self.assertEqual(len(self.index), 359)
+
+        # 제시간에 실행되면 지난 항목만 버림
+        task.next_run = (START + timedelta(minutes=3)).strftime(TIME_FORMAT)
+        with mock.patch.object(forecast, "iter_occurrences", side_effect=AssertionError("recomputed")):
+            self.index.advance(task)
+        self.assertEqual(len(self.index), 357)
+        self.assertEqual(self.index.between(START, START + timedelta(minutes=4))[0][0], START + timedelta(minutes=3))
+
+    def test_advance_late_recomputes_task(self):
+        task = interval("c", 1, START + timedelta(minutes=1))
+        self.index.update(task)
+        # 늦게 실행되어 기준 시각이 7초 밀림
+        task.next_run = (START + timedelta(minutes=3, seconds=7)).strftime(TIME_FORMAT)
+        self.index.advance(task)
+        times = [when for when, _ in self.index.between(START, START + timedelta(minutes=6))]
+        self.assertEqual(times, [START + timedelta(minutes=m, seconds=7) for m in (3, 4, 5)])
+
+    def test_window_slides_forward(self):
+        task = interval("c", 60, START + timedelta(hours=1))
+        self.index.update_many([task, daily("a", "05:30:00")])
+        self.clock.advance(timedelta(hours=4))
+        now = self.clock.now()
+        with mock.patch.object(forecast, "iter_occurrences", wraps=forecast.iter_occurrences) as computed:
+            occurrences = self.index.between(now, now + timedelta(hours=4))
+        # 늘어난 구간만 작업마다 한 번씩 계산
+        self.assertEqual(computed.call_count, 2)
+        for call in computed.call_args_list:
+            self.assertEqual(call.args[1], START + timedelta(hours=6))
+        self.assertEqual(occurrences, [
+            (START + timedelta(hours=4), "c"),
+            (START + timedelta(hours=5), "c"),
+            (START + timedelta(hours=5, minutes=30), "a"),
+            (START + timedelta(hours=6), "c"),
+            (START + timedelta(hours=7), "c"),
+        ])
+        # 지난 항목은 버리고 [4시, 10시) 범위만 보관
+        self.assertEqual(len(self.index), 6 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from scheduler.history import RunHistory, RunRecord
+
+BASE = datetime(2026, 1, 5, 0, 0, 0).timestamp()
+
+
+def run(task_id: str, started: float, duration: float = 1.0, exit_code: int = 0,
+        launch_latency: float = 0.0) -> RunRecord:
+    return RunRecord(task_id, 100, BASE + started, BASE + started + duration, exit_code, launch_latency)
+
+
+class RunHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.history_dir = Path(self._dir.name) / "history"
+        self.histories = []
+
+    def tearDown(self):
+        for history in self.histories:
+            history.close()
+        self._dir.cleanup()
+
+    def open_history(self, **kwargs) -> RunHistory:
+        history = RunHistory(str(self.history_dir), **kwargs)
+        self.histories.append(history)
+        return history
+
+    def segments(self):
+        return sorted(path.name for path in self.history_dir.glob("runs-*.jsonl"))
+
+    def test_ring_buffer_keeps_latest_per_task(self):
+        history = self.open_history(per_task=3)
+        for i in range(5):
+            history.record(run("a", i))
+        history.record(run("b", 10))
+
+        self.assertEqual([r.started_at - BASE for r in history.last_runs("a")], [4, 3, 2])
+        self.assertEqual([r.started_at - BASE for r in history.last_runs("a", n=2)], [4, 3])
+        self.assertEqual(len(history.last_runs("b")), 1)
+        self.assertEqual(history.last_runs("missing"), [])
+
+    def test_segments_rotate_and_old_ones_are_deleted(self):
+        # 한 줄이 42바이트이므로 세그먼트 하나에 두 줄씩 들어감
+        history = self.open_history(segment_bytes=80, max_segments=2)
+        for i in range(10):
+            history.record(run("a", i))
+
+        segments = self.segments()
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(segments[-1], "runs-00000004.jsonl")
+        for name in segments:
+            self.assertLessEqual(len((self.history_dir / name).read_text().splitlines()), 2)
+
+    def test_reload_after_restart(self):
+        history = self.open_history(per_task=3)
+        for i in range(5):
+            history.record(run("a", i, exit_code=i % 2))
+        history.close()
+        with open(self.history_dir / self.segments()[-1], "a", encoding="utf-8") as f:
+            f.write('["a",100,')
+
+        reloaded = self.open_history(per_task=3)
+        runs = reloaded.last_runs("a")
+        self.assertEqual([r.started_at - BASE for r in runs], [4, 3, 2])
+        self.assertEqual([r.exit_code for r in runs], [0, 1, 0])
+        # 잘린 줄이 있는 세그먼트에 이어서 기록해도 새 기록이 잘린 줄에 붙지 않음
+        reloaded.record(run("a", 5))
+        self.assertEqual(self.open_history().last_runs("a", n=1)[0].started_at - BASE, 5)
+
+    def test_aggregate_window(self):
+        history = self.open_history()
+        history.record(run("a", 0, duration=2, launch_latency=0.1))
+        history.record(run("a", 60, duration=4, exit_code=1, launch_latency=0.3))
+        history.record(run("b", 120, duration=6))
+
+        everything = history.aggregate()
+        self.assertEqual((everything.count, everything.failures, everything.max_duration), (3, 1, 6))
+        self.assertAlmostEqual(everything.mean_duration, 4)
+
+        # [since, until) 구간: 60초 시작은 포함, 120초 시작은 제외
+        window = history.aggregate(since=datetime.fromtimestamp(BASE + 60),
+                                   until=datetime.fromtimestamp(BASE + 120))
+        self.assertEqual((window.count, window.failures, window.mean_duration), (1, 1, 4))
+        self.assertAlmostEqual(window.mean_launch_latency, 0.3)
+
+        per_task = history.aggregate("a")
+        self.assertEqual(per_task.count, 2)
+        self.assertAlmostEqual(per_task.mean_launch_latency, 0.2)
+        empty = history.aggregate("a", since=datetime.fromtimestamp(BASE + 3600))
+        self.assertEqual((empty.count, empty.mean_duration), (0, None))
+
+    def test_forget_drops_memory_records(self):
+        history = self.open_history()
+        history.record(run("a", 0))
+        history.forget("a")
+        self.assertEqual(history.last_runs("a"), [])
+        self.assertEqual(history.aggregate().count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
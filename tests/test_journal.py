@@ -0,0 +1,116 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scheduler.journal import RunStateJournal
+from scheduler.metrics import MetricsRegistry
+from scheduler.models import Task
+from scheduler.storage import Storage
+
+
+class RunStateJournalTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._dir.name) / "run_state.jsonl"
+        self.journal = RunStateJournal(self.path)
+
+    def tearDown(self):
+        self.journal.close()
+        self._dir.cleanup()
+
+    def test_replay_keeps_last_state_and_outcome(self):
+        self.journal.append("a", "2026-01-01 03:00:00", "2026-01-02 03:00:00", "succeeded")
+        self.journal.append_many([("b", None, "2026-01-01 05:00:00", None),
+                                  ("a", "2026-01-01 03:00:00", "2026-01-03 03:00:00", None)])
+        self.assertEqual(len(self.journal), 3)
+
+        states = RunStateJournal(self.path).replay()
+        self.assertEqual(states["a"]["next_run"], "2026-01-03 03:00:00")
+        # 결과 없이 일정만 갱신한 기록은 이전 결과를 유지
+        self.assertEqual(states["a"]["outcome"], "succeeded")
+        self.assertIsNone(states["b"]["outcome"])
+
+    def test_replay_skips_torn_last_line(self):
+        self.journal.append("a", None, "2026-01-02 03:00:00")
+        self.journal.close()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"id":"a","last_run":"2026-01-02')
+
+        journal = RunStateJournal(self.path)
+        states = journal.replay()
+        self.assertEqual(states["a"]["next_run"], "2026-01-02 03:00:00")
+        self.assertEqual(len(journal), 1)
+
+    def test_truncate(self):
+        self.journal.append("a", None, "2026-01-02 03:00:00")
+        self.journal.truncate()
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(self.journal.replay(), {})
+        # 비운 뒤에도 계속 추가할 수 있음
+        self.journal.append("b", None, None)
+        self.assertEqual(list(self.journal.replay()), ["b"])
+
+
+class StorageJournalTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.storages = []
+
+    def tearDown(self):
+        for storage in self.storages:
+            storage.close()
+        self._dir.cleanup()
+
+    def open_storage(self, **kwargs) -> Storage:
+        storage = Storage(self._dir.name, flush_interval=0, metrics=MetricsRegistry(), **kwargs)
+        self.storages.append(storage)
+        return storage
+
+    def add_task(self, storage: Storage) -> Task:
+        task = Task(name="daily", file_path="/bin/true", schedule_type="daily", time="03:00:00")
+        storage.add_task(task)
+        return task
+
+    def read_snapshot(self, task_id: str) -> dict:
+        with open(Path(self._dir.name) / "tasks.json", encoding="utf-8") as f:
+            return next(data for data in json.load(f) if data["id"] == task_id)
+
+    def test_run_state_goes_to_journal_and_replays_on_load(self):
+        storage = self.open_storage()
+        task = self.add_task(storage)
+        self.assertTrue(storage.update_run_state(task.id, "2026-01-01 03:00:00", "2026-01-02 03:00:00", "failed"))
+
+        # tasks.json은 다시 쓰지 않음
+        self.assertIsNone(self.read_snapshot(task.id)["next_run"])
+        self.assertEqual(len(storage.journal), 1)
+
+        stored = self.open_storage().get_task_by_id(task.id)
+        self.assertEqual(stored.last_run, "2026-01-01 03:00:00")
+        self.assertEqual(stored.next_run, "2026-01-02 03:00:00")
+        self.assertEqual(stored.last_outcome, "failed")
+
+    def test_compacts_at_threshold(self):
+        storage = self.open_storage(compact_threshold=3)
+        task = self.add_task(storage)
+        for day in (2, 3):
+            storage.update_run_state(task.id, None, f"2026-01-0{day} 03:00:00")
+        self.assertEqual(len(storage.journal), 2)
+
+        storage.update_run_state(task.id, None, "2026-01-04 03:00:00")
+        self.assertEqual(len(storage.journal), 0)
+        self.assertEqual(self.read_snapshot(task.id)["next_run"], "2026-01-04 03:00:00")
+        self.assertEqual(self.open_storage().get_task_by_id(task.id).next_run, "2026-01-04 03:00:00")
+
+    def test_compact(self):
+        storage = self.open_storage()
+        task = self.add_task(storage)
+        storage.update_run_state(task.id, None, "2026-01-02 03:00:00")
+        storage.compact()
+        self.assertEqual(len(storage.journal), 0)
+        self.assertEqual(Path(self._dir.name, "run_state.jsonl").stat().st_size, 0)
+        self.assertEqual(self.read_snapshot(task.id)["next_run"], "2026-01-02 03:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from urllib.request import urlopen
+
+from scheduler.metrics import CONTENT_TYPE, MetricsRegistry, MetricsServer
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_render_counter_and_gauge(self):
+        self.registry.counter("runs_total", "Runs started", outcome="ok").inc(3)
+        self.registry.counter("runs_total", outcome="failed").inc()
+        gauge = self.registry.gauge("queue_depth", "Queued\nlaunches")
+        gauge.set(2.5)
+
+        self.assertEqual(self.registry.render(), "\n".join([
+            "# HELP queue_depth Queued\\nlaunches",
+            "# TYPE queue_depth gauge",
+            "queue_depth 2.5",
+            "# HELP runs_total Runs started",
+            "# TYPE runs_total counter",
+            'runs_total{outcome="ok"} 3',
+            'runs_total{outcome="failed"} 1',
+        ]) + "\n")
+
+    def test_render_histogram_buckets_are_cumulative(self):
+        histogram = self.registry.histogram("fire_lag_seconds", buckets=(0.1, 1.0), engine="main")
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(self.registry.render(), "\n".join([
+            "# TYPE fire_lag_seconds histogram",
+            'fire_lag_seconds_bucket{engine="main",le="0.1"} 2',
+            'fire_lag_seconds_bucket{engine="main",le="1"} 3',
+            'fire_lag_seconds_bucket{engine="main",le="+Inf"} 4',
+            'fire_lag_seconds_sum{engine="main"} 3.65',
+            'fire_lag_seconds_count{engine="main"} 4',
+        ]) + "\n")
+        self.assertEqual(self.registry.get("fire_lag_seconds_count", engine="main"), 4)
+
+    def test_label_values_are_escaped(self):
+        self.registry.counter("errors_total", path='C:\\jobs\\"a"\n').inc()
+        self.assertIn('errors_total{path="C:\\\\jobs\\\\\\"a\\"\\n"} 1', self.registry.render())
+
+    def test_same_name_and_labels_share_metric(self):
+        counter = self.registry.counter("runs_total", outcome="ok")
+        self.assertIs(self.registry.counter("runs_total", outcome="ok"), counter)
+        self.assertIsNot(self.registry.counter("runs_total", outcome="failed"), counter)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("runs_total")
+
+    def test_gauge_function_is_read_on_collect(self):
+        values = iter([1, 2])
+        self.registry.gauge("jobs").set_function(lambda: next(values))
+        self.assertEqual(self.registry.get("jobs"), 1)
+        self.assertIn("jobs 2\n", self.registry.render())
+
+
+class MetricsServerTest(unittest.TestCase):
+    def test_serves_metrics(self):
+        registry = MetricsRegistry()
+        registry.counter("runs_total").inc()
+        server = MetricsServer(registry, port=0)
+        server.start()
+        try:
+            with urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], CONTENT_TYPE)
+                self.assertEqual(response.read().decode("utf-8"), registry.render())
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
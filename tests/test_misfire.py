@@ -0,0 +1,84 @@
+import threading
+import unittest
+from datetime import datetime, timedelta
+
+from scheduler.clock import VirtualClock
+from scheduler.events import RUN_FINISHED
+from scheduler.models import TaskRecord
+from scheduler.recurrence import TIME_FORMAT
+from tests.helpers import StorageTestCase
+
+NOW = datetime(2026, 3, 10, 12, 0, 0)
+
+
+def daily(policy: str, next_run: datetime, file_path: str = "/bin/true", **fields) -> TaskRecord:
+    return TaskRecord(name=policy, file_path=file_path, schedule_type="daily", time="03:00:00",
+                      misfire_policy=policy, next_run=next_run.strftime(TIME_FORMAT), **fields)
+
+
+class MisfirePolicyTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = self.make_scheduler(clock=VirtualClock(NOW), max_catchup_runs=2, misfire_grace_seconds=60)
+        # 3월 7일 03:00부터 3월 10일 03:00까지 4번 놓침
+        self.missed_since = datetime(2026, 3, 7, 3, 0, 0)
+
+    def test_policies(self):
+        misfire = self.scheduler._misfire_runs
+        self.assertEqual(misfire(daily("skip", self.missed_since), NOW), (4, 0))
+        self.assertEqual(misfire(daily("run_once", self.missed_since), NOW), (4, 1))
+        self.assertEqual(misfire(daily("run_all", self.missed_since), NOW), (4, 2))
+
+    def test_future_next_run_is_not_missed(self):
+        task = daily("run_all", NOW + timedelta(hours=1))
+        self.assertEqual(self.scheduler._misfire_runs(task, NOW), (0, 0))
+
+    def test_late_within_grace_runs_once(self):
+        late = datetime(2026, 3, 10, 3, 0, 0)
+        self.assertEqual(self.scheduler._misfire_runs(daily("skip", late), late + timedelta(seconds=30)), (1, 1))
+        self.assertEqual(self.scheduler._misfire_runs(daily("skip", late), late + timedelta(seconds=90)), (1, 0))
+        task = daily("skip", late, misfire_grace_seconds=120)
+        self.assertEqual(self.scheduler._misfire_runs(task, late + timedelta(seconds=90)), (1, 1))
+
+    def test_interval_counts_by_interval(self):
+        task = TaskRecord(name="interval", file_path="/bin/true", schedule_type="interval", interval_minutes=30,
+                          misfire_policy="run_all", next_run=(NOW - timedelta(minutes=95)).strftime(TIME_FORMAT))
+        self.assertEqual(self.scheduler._misfire_runs(task, NOW), (4, 2))
+
+    def test_restart_queues_catchup_and_moves_next_run(self):
+        tasks = [daily("skip", self.missed_since), daily("run_once", self.missed_since),
+                 daily("run_all", self.missed_since)]
+        self.storage.add_tasks(tasks)
+        queued = {}
+        self.scheduler._queue_catchup = lambda task, runs: queued.__setitem__(task.name, runs)
+        self.scheduler._load_tasks()
+
+        self.assertEqual(queued, {"run_once": 1, "run_all": 2})
+        for task in self.storage.load_tasks():
+            self.assertEqual(task.next_run, "2026-03-11 03:00:00")
+
+
+class FailedLaunchTest(StorageTestCase):
+    def test_failed_launch_moves_next_run(self):
+        scheduler = self.make_scheduler()
+        past = datetime.now().replace(microsecond=0) - timedelta(days=2)
+        task = daily("run_all", past, file_path="/nonexistent/task")
+        self.storage.add_task(task)
+        finished = threading.Event()
+        self.storage.events.subscribe(RUN_FINISHED, lambda *_: finished.set())
+
+        # 타이머에 등록된 레코드가 저장된 next_run 그대로 실행된 것처럼 실행
+        scheduler.jobs.add(task.id, scheduler.engine.call_at(past + timedelta(days=30), scheduler._run_task, task))
+        scheduler._launch(task)
+        self.assertTrue(finished.wait(5))
+
+        stored = self.storage.get_task_by_id(task.id)
+        self.assertEqual(stored.last_outcome, "failed")
+        self.assertIsNotNone(stored.last_run)
+        self.assertGreater(datetime.fromisoformat(stored.next_run), datetime.now())
+        # 재시작해도 놓친 실행으로 따라잡지 않음
+        self.assertEqual(scheduler._misfire_runs(stored, datetime.now()), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import pstats
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from scheduler.events import RUN_FINISHED
+from scheduler.metrics import MetricsRegistry
+from scheduler.models import Task
+from scheduler.profiling import Profiler, metrics_hook
+from tests.helpers import StorageTestCase
+
+
+class SchedulerProfilingTestCase(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler_metrics = MetricsRegistry()
+        self.scheduler = self.make_scheduler(metrics=self.scheduler_metrics)
+        self.scheduler.start()
+
+    def run_tasks(self, count: int = 5) -> None:
+        """
+        곧 실행되는 작업 count개를 추가하고 모두 끝날 때까지 기다립니다.
+        """
+        finished = []
+        done = threading.Event()
+
+        def on_finished(task_id, run):
+            finished.append(task_id)
+            if len(finished) >= count:
+                done.set()
+
+        self.storage.events.subscribe(RUN_FINISHED, on_finished)
+        at = (datetime.now() + timedelta(seconds=1)).strftime("%H:%M:%S")
+        self.scheduler.add_tasks([Task(name=f"t{i}", file_path="/bin/true", schedule_type="daily", time=at)
+                                  for i in range(count)])
+        self.assertTrue(done.wait(10))
+
+
+class ProfilerTest(SchedulerProfilingTestCase):
+    def test_cprofile_records_scheduler_threads(self):
+        profiler = Profiler(str(Path(self.data_dir) / "profiles"))
+        path = profiler.start(60, "cprofile")
+        self.assertIsNone(profiler.start(60, "cprofile"))
+        self.run_tasks()
+        self.assertEqual(profiler.stop(), path)
+
+        functions = {(Path(filename).name, name) for filename, _, name in pstats.Stats(str(path)).stats}
+        # 타이머 스레드, 실행기 스레드, 프로세스 회수 스레드에서 실행된 함수
+        for expected in [("scheduler.py", "_run_task"), ("subprocess.py", "_execute_child"),
+                         ("scheduler.py", "_on_task_exited")]:
+            self.assertIn(expected, functions)
+
+    def test_sample_is_default_and_covers_all_threads(self):
+        profiler = Profiler(str(Path(self.data_dir) / "profiles"))
+        path = profiler.start(60)
+        self.assertEqual(path.suffix, ".folded")
+        self.run_tasks()
+        time.sleep(0.05)
+        profiler.stop()
+
+        stacks = path.read_text(encoding="utf-8")
+        for expected in ["TimerEngine._run", "LaunchExecutor._work", "default-timer", "default-launcher-worker"]:
+            self.assertIn(expected, stacks)
+
+    def test_stop_without_start(self):
+        self.assertIsNone(Profiler(str(Path(self.data_dir) / "profiles")).stop())
+
+
+class TimingHooksTest(SchedulerProfilingTestCase):
+    def test_hooks_install_and_remove(self):
+        operations = []
+        original = self.scheduler._run_task
+        remove = self.scheduler.hooks.add(post=lambda operation, elapsed, error: operations.append(operation))
+        remove_metrics = self.scheduler.hooks.add(post=metrics_hook(self.scheduler_metrics, self.scheduler.name))
+        self.assertTrue(self.scheduler.hooks.enabled)
+        self.run_tasks(2)
+        remove()
+        remove_metrics()
+
+        self.assertFalse(self.scheduler.hooks.enabled)
+        self.assertIn("scheduler.run_task", operations)
+        self.assertIn("storage.update_run_state", operations)
+        self.assertEqual(self.scheduler._run_task, original)
+        self.assertNotIn("_run_task", vars(self.scheduler))
+        count = self.scheduler_metrics.get("scheduler_operation_seconds_count", operation="scheduler.run_task",
+                                 scheduler=self.scheduler.name)
+        self.assertGreaterEqual(count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+from datetime import datetime, time, timedelta
+
+from scheduler.clock import VirtualClock
+from scheduler.models import TaskRecord
+from scheduler.recurrence import (DailyRecurrence, IntervalRecurrence, MonthlyRecurrence, Recurrence,
+                                  RecurrenceCache, WeeklyRecurrence, compile_recurrence, spread_offset)
+from tests.helpers import StorageTestCase
+
+AT = time(9, 30, 0)
+
+
+def task(schedule_type: str, **fields) -> TaskRecord:
+    fields.setdefault("time", "09:30:00")
+    return TaskRecord(name=schedule_type, file_path="/bin/true", schedule_type=schedule_type, **fields)
+
+
+class RecurrenceTest(unittest.TestCase):
+    def test_daily(self):
+        rule = DailyRecurrence(AT)
+        self.assertEqual(rule.next_after(datetime(2026, 1, 1, 9, 0)), datetime(2026, 1, 1, 9, 30))
+        # 정확히 실행 시각이면 다음 날
+        self.assertEqual(rule.next_after(datetime(2026, 1, 1, 9, 30)), datetime(2026, 1, 2, 9, 30))
+        self.assertEqual(rule.next_after(datetime(2026, 12, 31, 23, 0)), datetime(2027, 1, 1, 9, 30))
+
+    def test_weekly_mask(self):
+        # 월요일(0)과 금요일(4). 2026-01-05는 월요일
+        rule = WeeklyRecurrence(AT, 1 << 0 | 1 << 4)
+        monday = datetime(2026, 1, 5, 8, 0)
+        self.assertEqual(rule.next_after(monday), datetime(2026, 1, 5, 9, 30))
+        self.assertEqual(rule.next_after(monday.replace(hour=10)), datetime(2026, 1, 9, 9, 30))
+        self.assertEqual(rule.next_after(datetime(2026, 1, 9, 10, 0)), datetime(2026, 1, 12, 9, 30))
+        single = WeeklyRecurrence(AT, 1 << 2)
+        self.assertEqual(single.next_after(datetime(2026, 1, 7, 10, 0)), datetime(2026, 1, 14, 9, 30))
+        self.assertTrue(rule.matches(monday.date()))
+        self.assertFalse(rule.matches(datetime(2026, 1, 6).date()))
+
+    def test_monthly_skips_short_months(self):
+        rule = MonthlyRecurrence(AT, 31, False)
+        self.assertEqual(rule.next_after(datetime(2026, 1, 31, 10, 0)), datetime(2026, 3, 31, 9, 30))
+        self.assertEqual(rule.next_after(datetime(2026, 4, 1)), datetime(2026, 5, 31, 9, 30))
+        self.assertIsNone(MonthlyRecurrence(AT, 32, False).next_after(datetime(2026, 1, 1)))
+
+    def test_monthly_last_day(self):
+        rule = MonthlyRecurrence(AT, None, True)
+        self.assertEqual(rule.next_after(datetime(2026, 2, 1)), datetime(2026, 2, 28, 9, 30))
+        self.assertEqual(rule.next_after(datetime(2028, 2, 1)), datetime(2028, 2, 29, 9, 30))
+        self.assertEqual(rule.next_after(datetime(2026, 2, 28, 10, 0)), datetime(2026, 3, 31, 9, 30))
+        self.assertEqual(rule.next_after(datetime(2026, 12, 31, 10, 0)), datetime(2027, 1, 31, 9, 30))
+
+    def test_interval_is_anchored(self):
+        rule = IntervalRecurrence(45)
+        self.assertTrue(rule.anchored)
+        self.assertEqual(rule.next_after(datetime(2026, 1, 1, 23, 30)), datetime(2026, 1, 2, 0, 15))
+
+    def test_rule_must_implement_next_after(self):
+        class Incomplete(Recurrence):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_compile_rejects_incomplete_schedules(self):
+        self.assertIsNone(compile_recurrence(task("weekly", days=[])))
+        self.assertIsNone(compile_recurrence(task("monthly")))
+        self.assertIsNone(compile_recurrence(task("interval", time=None)))
+        self.assertIsNone(compile_recurrence(task("daily", time=None)))
+        # 같은 일정은 같은 규칙 객체를 공유
+        self.assertIs(compile_recurrence(task("daily")), compile_recurrence(task("daily")))
+
+    def test_spread_offset(self):
+        record = task("daily")
+        offset = spread_offset(record.id, 600)
+        self.assertTrue(0 <= offset < 600)
+        self.assertEqual(offset, spread_offset(record.id, 600))
+        self.assertEqual(spread_offset(record.id, 0), 0)
+        self.assertEqual(spread_offset(record.id, 1), 0)
+
+        spread = compile_recurrence(record, 600)
+        base = datetime(2026, 1, 1, 9, 0)
+        self.assertEqual(spread.next_after(base), datetime(2026, 1, 1, 9, 30) + timedelta(seconds=offset))
+        # 분산된 시각 직후에는 다음 날 분산 시각
+        fired = datetime(2026, 1, 1, 9, 30) + timedelta(seconds=offset)
+        self.assertEqual(spread.next_after(fired), fired + timedelta(days=1))
+        # 작업에 지정한 분산 구간이 스케줄러 값보다 우선
+        pinned = task("daily", spread_seconds=0)
+        self.assertEqual(compile_recurrence(pinned, 600).next_after(base), datetime(2026, 1, 1, 9, 30))
+
+    def test_interval_is_not_spread(self):
+        self.assertIsInstance(compile_recurrence(task("interval", interval_minutes=5), 600), IntervalRecurrence)
+
+
+class RecurrenceCacheTest(unittest.TestCase):
+    def test_batch_and_single_agree_and_invalidate(self):
+        cache = RecurrenceCache()
+        tasks = [task("daily"), task("daily"), task("interval", interval_minutes=10)]
+        now = datetime(2026, 1, 1, 8, 0)
+        batch = cache.next_runs(tasks, now)
+        self.assertEqual(batch[tasks[0].id], datetime(2026, 1, 1, 9, 30))
+        self.assertEqual(batch[tasks[2].id], datetime(2026, 1, 1, 8, 10))
+        for record in tasks:
+            self.assertEqual(cache.next_run(record, now), batch[record.id])
+        self.assertEqual(len(cache._entries), 2)
+
+        # 일정이 바뀌면 캐시를 쓰지 않음
+        tasks[0].time = "10:00:00"
+        self.assertEqual(cache.next_run(tasks[0], now), datetime(2026, 1, 1, 10, 0))
+        cache.invalidate(tasks[0].id)
+        cache.invalidate("missing")
+        self.assertNotIn(tasks[0].id, cache._entries)
+
+
+class SchedulerRecurrenceCacheTest(StorageTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = self.make_scheduler(clock=VirtualClock(datetime(2026, 1, 1, 8, 0)))
+
+    def test_unscheduled_tasks_leave_cache(self):
+        tasks = [task("daily"), task("weekly", days=[0])]
+        self.scheduler.add_tasks(tasks)
+        self.assertEqual(set(self.scheduler.recurrences._entries), {record.id for record in tasks})
+        self.assertEqual([record.next_run for record in self.storage.load_tasks()],
+                         ["2026-01-01 09:30:00", "2026-01-05 09:30:00"])
+
+        self.scheduler.delete_task(tasks[0].id)
+        self.scheduler.set_enabled([tasks[1].id], False)
+        self.assertEqual(self.scheduler.recurrences._entries, {})
+
+    def test_batch_schedule_uses_batch_results(self):
+        calls = []
+        # 실행 예정 색인은 작업마다 앞으로의 실행 시각을 따로 계산하므로 제외
+        self.scheduler.forecast.update_many = lambda tasks: None
+        original = DailyRecurrence.next_after
+        DailyRecurrence.next_after = lambda rule, t: calls.append(t) or original(rule, t)
+        try:
+            self.scheduler.add_tasks([task("daily") for _ in range(20)])
+        finally:
+            DailyRecurrence.next_after = original
+        # 같은 일정의 20개 작업은 한 번만 계산
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from scheduler.models import TaskRecord
+from scheduler.repository import TaskRepository
+
+
+def record(name: str, next_run=None, enabled: bool = True) -> TaskRecord:
+    return TaskRecord(name=name, file_path="/bin/true", schedule_type="daily", time="03:00:00",
+                      next_run=next_run, enabled=enabled)
+
+
+class TaskRepositoryTest(unittest.TestCase):
+    def test_returned_records_are_copies(self):
+        task = record("a", "2026-01-01 03:00:00")
+        repository = TaskRepository([task])
+        # 넣은 레코드와 꺼낸 레코드를 고쳐도 저장된 값과 색인은 그대로
+        task.enabled = False
+        fetched = repository.get(task.id)
+        fetched.enabled = False
+        fetched.next_run = None
+        fetched.days.append(1)
+        for listed in (repository.all(), repository.enabled(True), repository.due_before("2026-12-31 00:00:00")):
+            listed[0].next_run = "2000-01-01 00:00:00"
+
+        stored = repository.get(task.id)
+        self.assertTrue(stored.enabled)
+        self.assertEqual(stored.next_run, "2026-01-01 03:00:00")
+        self.assertEqual(stored.days, [])
+        self.assertEqual([t.id for t in repository.enabled(True)], [task.id])
+        self.assertEqual(repository.enabled(False), [])
+        self.assertEqual(repository.due_before("2025-01-01 00:00:00"), [])
+
+    def test_set_run_state_reindexes(self):
+        early, late = record("early", "2026-01-01 03:00:00"), record("late", "2026-01-03 03:00:00")
+        repository = TaskRepository([early, late])
+        self.assertTrue(repository.set_run_state(late.id, "2026-01-01 00:00:00", "2025-12-31 03:00:00", "succeeded"))
+        self.assertFalse(repository.set_run_state("missing", None, None))
+
+        due = repository.due_before("2026-01-02 00:00:00")
+        self.assertEqual([t.name for t in due], ["late", "early"])
+        self.assertEqual(due[0].last_outcome, "succeeded")
+        repository.set_run_state(late.id, None, None)
+        self.assertEqual(repository.get(late.id).last_outcome, "succeeded")
+        self.assertEqual([t.name for t in repository.due_before("2027-01-01 00:00:00")], ["early"])
+
+    def test_put_replaces_index_entries(self):
+        task = record("a", "2026-01-01 03:00:00")
+        repository = TaskRepository([task])
+        task.enabled = False
+        task.next_run = "2026-02-01 03:00:00"
+        repository.put(task)
+        self.assertEqual(repository.enabled(True), [])
+        self.assertEqual([t.id for t in repository.enabled(False)], [task.id])
+        self.assertEqual(repository.due_before("2026-01-15 00:00:00"), [])
+        self.assertEqual(len(repository.due_before("2026-03-01 00:00:00")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
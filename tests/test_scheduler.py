@@ -0,0 +1,135 @@
+import os
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from scheduler.events import RUN_FINISHED
+from scheduler.models import Task
+from tests.helpers import SchedulerTestCase
+
+
+class UpdateTaskTest(SchedulerTestCase):
+    def test_update_persists_new_next_run(self):
+        task = Task(name="daily", file_path="/bin/true", schedule_type="daily", time="03:00:00")
+        self.scheduler.add_task(task)
+        edited = self.storage.get_task_by_id(task.id)
+        edited.time = "04:00:00"
+        self.assertTrue(self.scheduler.update_task(edited))
+
+        stored = self.open_storage().get_task_by_id(task.id)
+        self.assertIsNotNone(stored.next_run)
+        self.assertTrue(stored.next_run.endswith("04:00:00"))
+        later = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d %H:%M:%S")
+        self.assertEqual([t.id for t in self.storage.get_due_tasks(later)], [task.id])
+
+    def test_update_unknown_task_is_not_scheduled(self):
+        task = Task(name="ghost", file_path="/bin/true", schedule_type="daily", time="03:00:00")
+        self.assertFalse(self.scheduler.update_task(task))
+        self.assertNotIn(task.id, self.scheduler.jobs)
+
+
+class JobCountsTest(SchedulerTestCase):
+    def assertCounts(self, tasks: int) -> None:
+        # 작업마다 핸들 하나, 핸들마다 살아 있는 타이머 하나
+        self.assertEqual(self.scheduler.job_counts(), {"tasks": tasks, "handles": tasks, "timers": tasks})
+
+    def test_handles_are_released(self):
+        tasks = [Task(name=f"t{i}", file_path="/bin/true", schedule_type="daily", time="03:00:00")
+                 for i in range(3)]
+        self.scheduler.add_tasks(tasks)
+        self.assertCounts(3)
+
+        for hour in ("04:00:00", "05:00:00"):
+            edited = self.storage.get_task_by_id(tasks[0].id)
+            edited.time = hour
+            self.assertTrue(self.scheduler.update_task(edited))
+        self.assertCounts(3)
+
+        self.scheduler.set_enabled([tasks[1].id], False)
+        self.assertCounts(2)
+        self.scheduler.set_enabled([tasks[1].id], True)
+        self.assertCounts(3)
+        disabled = self.storage.get_task_by_id(tasks[1].id)
+        disabled.enabled = False
+        self.assertTrue(self.scheduler.update_task(disabled))
+        self.assertCounts(2)
+
+        self.assertTrue(self.scheduler.delete_task(tasks[2].id))
+        self.assertCounts(1)
+        self.assertEqual(self.scheduler.delete_tasks([tasks[0].id, tasks[1].id]), 2)
+        self.assertCounts(0)
+
+
+@unittest.skipUnless(os.name == "posix", "셸 스크립트로 실행할 작업을 만듦")
+class EditWhileRunningTest(SchedulerTestCase):
+    def setUp(self):
+        super().setUp()
+        script = Path(self.data_dir) / "sleep.sh"
+        script.write_text("#!/bin/sh\nsleep 0.3\n")
+        script.chmod(0o755)
+        self.task = Task(name="daily", file_path=str(script), schedule_type="daily", time="03:00:00")
+        self.scheduler.add_task(self.task)
+        self.finished = threading.Event()
+        self.storage.events.subscribe(RUN_FINISHED, lambda *_: self.finished.set())
+
+    def launch(self):
+        """
+        등록된 타이머의 레코드를 실행하고 시작 기록이 남을 때까지 기다립니다.
+        """
+        handle, = self.scheduler.jobs.handles(self.task.id)
+        self.scheduler._launch(handle.args[0])
+        deadline = time.monotonic() + 5
+        while self.storage.get_task_by_id(self.task.id).last_outcome != "started":
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    def test_exit_keeps_edited_schedule(self):
+        self.launch()
+        edited = self.storage.get_task_by_id(self.task.id)
+        edited.time = "05:00:00"
+        self.assertTrue(self.scheduler.update_task(edited))
+        next_run = self.storage.get_task_by_id(self.task.id).next_run
+        self.assertTrue(next_run.endswith("05:00:00"))
+
+        self.assertTrue(self.finished.wait(5))
+        stored = self.open_storage().get_task_by_id(self.task.id)
+        # 실행 결과는 기록하되 실행 전 레코드의 일정(03:00)으로 되돌리지 않음
+        self.assertEqual(stored.next_run, next_run)
+        self.assertEqual(stored.last_outcome, "succeeded")
+        self.assertIsNotNone(stored.last_run)
+        self.assertEqual(self.scheduler._misfire_runs(stored, datetime.now()), (0, 0))
+
+    def test_exit_after_delete_does_not_write(self):
+        self.launch()
+        self.assertTrue(self.scheduler.delete_task(self.task.id))
+        self.assertTrue(self.finished.wait(5))
+        self.assertIsNone(self.open_storage().get_task_by_id(self.task.id))
+
+
+class SQLiteUpdateTaskTest(UpdateTaskTest):
+    backend = "sqlite"
+
+
+class ExternalEditTest(SchedulerTestCase):
+    def test_reload_after_external_edit(self):
+        task = Task(name="daily", file_path="/bin/true", schedule_type="daily", time="03:00:00")
+        self.scheduler.add_task(task)
+        self.assertFalse(self.storage.is_stale())
+
+        # 다른 프로세스가 같은 작업 파일에 작업을 추가
+        other = self.open_storage()
+        added = Task(name="other", file_path="/bin/true", schedule_type="daily", time="05:00:00")
+        other.add_task(added)
+        other.close()
+        self.assertTrue(self.storage.is_stale())
+
+        self.scheduler.reload()
+        self.assertFalse(self.storage.is_stale())
+        self.assertIn(added.id, self.scheduler.jobs)
+        self.assertIn(task.id, self.scheduler.jobs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from scheduler.history import RunHistory
+from scheduler.metrics import MetricsRegistry
+from scheduler.models import TaskRecord
+from scheduler.recurrence import TIME_FORMAT
+from scheduler.sharding import HashRing, ShardedScheduler
+from scheduler.storage import Storage
+
+
+class HashRingTest(unittest.TestCase):
+    def test_resize_moves_few_tasks(self):
+        ids = [f"task-{i}" for i in range(2000)]
+        before, after = HashRing(4), HashRing(5)
+        moved = sum(before.shard_of(task_id) != after.shard_of(task_id) for task_id in ids)
+        self.assertTrue(all(0 <= before.shard_of(task_id) < 4 for task_id in ids))
+        # 새 샤드 몫(약 1/5)만 옮겨야 함
+        self.assertLess(moved, len(ids) * 0.35)
+
+
+class ShardedMisfireTest(unittest.TestCase):
+    def test_worker_catches_up_missed_run(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            storage = Storage(data_dir, flush_interval=0, metrics=MetricsRegistry())
+            past = datetime.now().replace(microsecond=0) - timedelta(days=2)
+            task = TaskRecord(name="missed", file_path="/bin/true", schedule_type="daily",
+                              time=(past + timedelta(hours=12)).strftime("%H:%M:%S"),
+                              misfire_policy="run_once", next_run=past.strftime(TIME_FORMAT))
+            storage.add_task(task)
+
+            scheduler = ShardedScheduler(storage, workers=1, history=RunHistory(f"{data_dir}/history"))
+            scheduler.start()
+            try:
+                deadline = time.monotonic() + 30
+                while time.monotonic() < deadline:
+                    stored = storage.get_task_by_id(task.id)
+                    if stored.last_run is not None:
+                        break
+                    time.sleep(0.1)
+            finally:
+                scheduler.stop()
+                storage.close()
+
+            stored = storage.get_task_by_id(task.id)
+            self.assertIsNotNone(stored.last_run)
+            self.assertGreater(datetime.fromisoformat(stored.next_run), datetime.now())
+
+
+class ShardedBatchTest(unittest.TestCase):
+    def test_start_sends_batches_and_records_states_once(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            metrics = MetricsRegistry()
+            storage = Storage(data_dir, flush_interval=0, metrics=metrics)
+            tasks = [TaskRecord(name=f"task-{i}", file_path="/bin/true", schedule_type="daily",
+                                time=f"{i % 24:02d}:{i % 60:02d}:00") for i in range(500)]
+            storage.add_tasks(tasks)
+            writes = metrics.get("storage_writes_total", backend="json")
+
+            scheduler = ShardedScheduler(storage, workers=2, history=RunHistory(f"{data_dir}/history"))
+            sent = []
+            send = scheduler._send
+            scheduler._send = lambda shard, message: (sent.append(message[0]), send(shard, message))
+            scheduler.start()
+            try:
+                deadline = time.monotonic() + 30
+                while time.monotonic() < deadline:
+                    if all(task.next_run for task in storage.snapshot()):
+                        break
+                    time.sleep(0.1)
+            finally:
+                scheduler.stop()
+                storage.close()
+
+            self.assertTrue(all(task.next_run for task in storage.snapshot()))
+            # 샤드마다 작업 묶음 하나를 보내고, 샤드마다 실행 상태를 저널에 한 번씩 기록
+            self.assertEqual(sent.count("put_many"), 2)
+            self.assertEqual(metrics.get("storage_writes_total", backend="json") - writes, 2)
+            self.assertEqual(len(storage.journal), 500)
+
+
+class ShardedValidationTest(unittest.TestCase):
+    def test_invalid_upsert_changes_nothing(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            storage = Storage(data_dir, flush_interval=0, metrics=MetricsRegistry())
+            scheduler = ShardedScheduler(storage, workers=1, history=RunHistory(f"{data_dir}/history"))
+            good = TaskRecord(name="good", file_path="/bin/true", schedule_type="daily", time="03:00:00")
+            # 시각이 없는 매일 작업은 반복 규칙을 만들 수 없음
+            broken = TaskRecord(name="broken", file_path="/bin/true", schedule_type="daily")
+            with self.assertRaisesRegex(ValueError, "실행 일정"):
+                scheduler.upsert_tasks([good, broken])
+            with self.assertRaisesRegex(ValueError, "중복된 작업 ID"):
+                scheduler.upsert_tasks([good, good.copy()])
+            self.assertEqual(storage.snapshot(), [])
+
+            self.assertEqual(scheduler.upsert_tasks([good]), (1, 0))
+            storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import io
+import unittest
+from datetime import datetime, timedelta
+
+from scheduler.models import Task
+from scheduler.simulation import simulate
+
+START = datetime(2026, 1, 5, 0, 0, 0)
+
+
+def daily(count: int, at: str = "03:00:00", **fields) -> list:
+    return [Task(name=f"daily-{i}", file_path="/bin/true", schedule_type="daily", time=at, **fields)
+            for i in range(count)]
+
+
+class SimulateTest(unittest.TestCase):
+    def test_daily_counts(self):
+        tasks = daily(10)
+        report = simulate(tasks, START, START + timedelta(days=3))
+
+        self.assertEqual(report.launches, 30)
+        self.assertEqual(report.skipped, 0)
+        self.assertEqual(report.per_task, {task.id: 3 for task in tasks})
+        self.assertEqual(report.active_minutes, 3)
+        self.assertEqual(report.max_launches_per_minute, 10)
+        self.assertEqual(report.mean_launches_per_minute, 10.0)
+        self.assertEqual(report.peak_concurrency, 10)
+        self.assertEqual(report.peak_at, "2026-01-05 03:00:00")
+        self.assertEqual(report.busiest_minutes[0], ("2026-01-05 03:00:00", 10))
+
+    def test_end_is_exclusive(self):
+        report = simulate(daily(1), START, datetime(2026, 1, 5, 3, 0, 0))
+        self.assertEqual(report.launches, 0)
+        self.assertEqual(report.busiest_minutes, [])
+
+    def test_max_processes_queues_launches(self):
+        report = simulate(daily(10), START, START + timedelta(days=1), duration=30, max_processes=4)
+        self.assertEqual(report.launches, 10)
+        self.assertEqual(report.peak_concurrency, 4)
+        self.assertEqual(report.max_queue_depth, 6)
+        # 30초씩 세 번에 나눠 실행되므로 두 분에 걸침
+        self.assertEqual(report.active_minutes, 2)
+
+    def test_spread_lowers_peak(self):
+        report = simulate(daily(50), START, START + timedelta(days=1), spread_seconds=600)
+        self.assertEqual(report.launches, 50)
+        self.assertLess(report.max_launches_per_minute, 50)
+        self.assertLess(report.peak_concurrency, 50)
+
+    def test_max_instances_skips_overlapping_runs(self):
+        task = Task(name="interval", file_path="/bin/true", schedule_type="interval", interval_minutes=1,
+                    max_instances=1)
+        # 1분부터 59분까지 59번 실행 예정. 실행이 90초 걸리므로 짝수 분에는 이전 실행이 끝나지 않음
+        with self.assertLogs("Scheduler", level="WARNING"):
+            report = simulate([task], START, START + timedelta(hours=1), duration=90)
+        self.assertEqual(report.launches, 30)
+        self.assertEqual(report.skipped, 29)
+        self.assertEqual(report.peak_concurrency, 1)
+
+    def test_launch_log(self):
+        tasks = daily(2)
+        log = io.StringIO()
+        simulate(tasks, START, START + timedelta(days=1), launch_log=log)
+        self.assertEqual(sorted(log.getvalue().splitlines()),
+                         sorted(f"2026-01-05 03:00:00,{task.id}" for task in tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
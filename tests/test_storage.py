@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scheduler.metrics import MetricsRegistry
+from scheduler.models import Task
+from scheduler.scheduler import Scheduler
+from scheduler.storage import Storage
+
+
+def task(name: str) -> Task:
+    return Task(name=name, file_path="/bin/true", schedule_type="daily", time="03:00:00")
+
+
+class WriteBehindTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.tasks_file = Path(self._dir.name) / "tasks.json"
+        self.metrics = MetricsRegistry()
+        self.storages = []
+
+    def tearDown(self):
+        for storage in self.storages:
+            storage.close()
+        self._dir.cleanup()
+
+    def open_storage(self, **kwargs) -> Storage:
+        storage = Storage(self._dir.name, metrics=self.metrics, **kwargs)
+        self.storages.append(storage)
+        return storage
+
+    def writes(self) -> float:
+        return self.metrics.get("storage_writes_total", backend="json")
+
+    def stored_names(self) -> list:
+        with open(self.tasks_file, encoding="utf-8") as f:
+            return [data["name"] for data in json.load(f)]
+
+    def test_changes_are_coalesced_into_one_write(self):
+        storage = self.open_storage(flush_interval=0.2)
+        for name in ("a", "b", "c"):
+            storage.add_task(task(name))
+        # 기록 전에도 같은 저장소에서는 변경이 보임
+        self.assertEqual([t.name for t in storage.load_tasks()], ["a", "b", "c"])
+        self.assertEqual(self.stored_names(), [])
+        self.assertEqual(self.writes(), 0)
+
+        # 기록 횟수는 파일 교체 전에 늘어나므로 파일 내용이 바뀔 때까지 기다림
+        deadline = time.monotonic() + 5
+        while not self.stored_names() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self.stored_names(), ["a", "b", "c"])
+        self.assertEqual(self.writes(), 1)
+
+    def test_max_pending_forces_flush(self):
+        storage = self.open_storage(flush_interval=60, max_pending=3)
+        storage.add_task(task("a"))
+        storage.add_task(task("b"))
+        self.assertEqual(self.writes(), 0)
+        storage.add_task(task("c"))
+        self.assertEqual(self.writes(), 1)
+        self.assertEqual(self.stored_names(), ["a", "b", "c"])
+
+        # 다음 변경은 다시 모음
+        storage.add_task(task("d"))
+        self.assertEqual(self.writes(), 1)
+
+    def test_scheduler_stop_flushes_pending_changes(self):
+        storage = self.open_storage(flush_interval=60)
+        scheduler = Scheduler(storage, metrics=MetricsRegistry())
+        scheduler.add_task(task("a"))
+        self.assertEqual(self.stored_names(), [])
+        scheduler.stop()
+        self.assertEqual(self.stored_names(), ["a"])
+        self.assertFalse(self.tasks_file.with_name("tasks.json.tmp").exists())
+
+    def test_write_is_fsynced_then_renamed(self):
+        storage = self.open_storage(flush_interval=60)
+        storage.add_task(task("a"))
+        calls = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd):
+            calls.append("fsync")
+            real_fsync(fd)
+
+        def replace(src, dst):
+            # 교체 직전에 임시 파일에 전체 내용이 있어야 함
+            with open(src, encoding="utf-8") as f:
+                calls.append(("replace", [data["name"] for data in json.load(f)]))
+            real_replace(src, dst)
+
+        with mock.patch("os.fsync", fsync), mock.patch("os.replace", replace):
+            storage.flush()
+        self.assertEqual(calls[:2], ["fsync", ("replace", ["a"])])
+        self.assertEqual(self.stored_names(), ["a"])
+
+    def test_failed_rename_keeps_previous_file(self):
+        storage = self.open_storage(flush_interval=0)
+        storage.add_task(task("a"))
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                storage.add_task(task("b"))
+        # 이전 파일은 그대로 읽을 수 있음
+        self.assertEqual(self.stored_names(), ["a"])
+        # 기록되지 않은 변경은 다음 기록 때 함께 기록됨
+        storage.flush()
+        self.assertEqual(self.stored_names(), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
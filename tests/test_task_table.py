@@ -0,0 +1,127 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtCore import QPoint, Qt
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtWidgets import QApplication, QTableView
+except ImportError:
+    QApplication = None
+
+from scheduler.models import TaskRecord
+
+if QApplication is not None:
+    from ui.task_table import COLUMNS, ENABLED_COLUMN, CheckBoxDelegate, TaskTableModel
+
+
+def task(name: str, **fields) -> TaskRecord:
+    return TaskRecord(id=name, name=name, file_path="/bin/true", schedule_type="daily", time="03:00:00", **fields)
+
+
+def setUpModule():
+    if QApplication is not None and QApplication.instance() is None:
+        # 테스트가 끝날 때까지 참조를 유지
+        global _app
+        _app = QApplication([])
+
+
+@unittest.skipIf(QApplication is None, "PyQt6가 설치되어 있지 않음")
+class TaskTableModelTest(unittest.TestCase):
+    def setUp(self):
+        self.model = TaskTableModel()
+        self.signals = []
+        self.model.rowsInserted.connect(lambda parent, first, last: self.signals.append(("insert", first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.signals.append(("remove", first, last)))
+        self.model.dataChanged.connect(
+            lambda top, bottom, roles: self.signals.append(("changed", top.row(), bottom.row(), bottom.column())))
+
+    def ids(self):
+        return [self.model.task_id(row) for row in range(self.model.rowCount())]
+
+    def test_initial_load_is_one_insert(self):
+        self.model.set_tasks([task("a"), task("b"), task("c")])
+        self.assertEqual(self.signals, [("insert", 0, 2)])
+        self.assertEqual(self.ids(), ["a", "b", "c"])
+        self.assertEqual(self.model.data(self.model.index(1, 0)), "b")
+
+    def test_only_changed_rows_are_refreshed(self):
+        self.model.set_tasks([task("a"), task("b"), task("c")])
+        self.signals.clear()
+        self.model.upsert_tasks([task("a"), task("b", next_run="2026-01-01 03:00:00")])
+        self.assertEqual(self.signals, [("changed", 1, 1, len(COLUMNS) - 1)])
+        self.assertEqual(self.model.data(self.model.index(1, 4)), "2026-01-01 03:00:00")
+
+    def test_remove_groups_contiguous_rows(self):
+        self.model.set_tasks([task(name) for name in "abcde"])
+        self.signals.clear()
+        self.model.remove_tasks(["b", "e", "c", "missing"])
+        # 뒤쪽 구간부터 제거해야 앞쪽 행 번호가 바뀌지 않음
+        self.assertEqual(self.signals, [("remove", 4, 4), ("remove", 1, 2)])
+        self.assertEqual(self.ids(), ["a", "d"])
+        self.assertEqual(self.model.row_of("d"), 1)
+        self.assertIsNone(self.model.row_of("b"))
+
+    def test_set_tasks_diffs_against_current_rows(self):
+        self.model.set_tasks([task("a"), task("b"), task("c")])
+        self.signals.clear()
+        self.model.set_tasks([task("c", enabled=False), task("a"), task("d")])
+        self.assertEqual(self.signals, [("remove", 1, 1), ("changed", 1, 1, len(COLUMNS) - 1), ("insert", 2, 2)])
+        self.assertEqual(self.ids(), ["a", "c", "d"])
+
+    def test_checkbox_column(self):
+        self.model.set_tasks([task("a")])
+        toggled = []
+        self.model.toggled.connect(lambda task_id, enabled: toggled.append((task_id, enabled)))
+        index = self.model.index(0, ENABLED_COLUMN)
+        self.assertEqual(self.model.data(index, Qt.ItemDataRole.CheckStateRole), Qt.CheckState.Checked)
+        self.assertTrue(self.model.flags(index) & Qt.ItemFlag.ItemIsUserCheckable)
+
+        # 모델은 값을 바꾸지 않고 요청만 알림 (실제 변경은 저장소 이벤트로 반영)
+        self.assertTrue(self.model.setData(index, Qt.CheckState.Unchecked.value, Qt.ItemDataRole.CheckStateRole))
+        self.assertEqual(toggled, [("a", False)])
+        self.assertEqual(self.model.data(index, Qt.ItemDataRole.CheckStateRole), Qt.CheckState.Checked)
+        self.assertFalse(self.model.setData(self.model.index(0, 0), "x", Qt.ItemDataRole.EditRole))
+
+
+@unittest.skipIf(QApplication is None, "PyQt6가 설치되어 있지 않음")
+class CheckBoxDelegateTest(unittest.TestCase):
+    def setUp(self):
+        self.model = TaskTableModel()
+        self.model.set_tasks([task("a"), task("b", enabled=False)])
+        self.toggled = []
+        self.model.toggled.connect(lambda task_id, enabled: self.toggled.append((task_id, enabled)))
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegateForColumn(ENABLED_COLUMN, CheckBoxDelegate(self.view))
+        self.view.resize(900, 200)
+        self.view.setColumnWidth(ENABLED_COLUMN, 120)
+        self.view.show()
+        QTest.qWaitForWindowExposed(self.view)
+
+    def tearDown(self):
+        self.view.close()
+        self.view.deleteLater()
+
+    def cell(self, row: int):
+        return self.view.visualRect(self.model.index(row, ENABLED_COLUMN))
+
+    def test_click_on_checkbox_toggles(self):
+        QTest.mouseClick(self.view.viewport(), Qt.MouseButton.LeftButton, pos=self.cell(0).center())
+        QTest.mouseClick(self.view.viewport(), Qt.MouseButton.LeftButton, pos=self.cell(1).center())
+        self.assertEqual(self.toggled, [("a", False), ("b", True)])
+
+    def test_click_beside_checkbox_does_not_toggle(self):
+        rect = self.cell(0)
+        QTest.mouseClick(self.view.viewport(), Qt.MouseButton.LeftButton, pos=QPoint(rect.left() + 2, rect.center().y()))
+        self.assertEqual(self.toggled, [])
+
+    def test_space_toggles_current_cell(self):
+        self.view.setCurrentIndex(self.model.index(1, ENABLED_COLUMN))
+        QTest.keyClick(self.view, Qt.Key.Key_Space)
+        self.assertEqual(self.toggled, [("b", True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+from typing import List, Set
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal, pyqtSlot
+
+from scheduler.events import (RUN_FINISHED, RUN_STATE_CHANGED, TASK_ADDED, TASK_REMOVED, TASK_UPDATED,
+                              TASKS_RELOADED, EventBus)
+from scheduler.history import RunRecord
+
+# 변경을 모아서 전달하는 간격 (약 한 프레임)
+FRAME_INTERVAL_MS = 16
+
+
+class EventBridge(QObject):
+    """
+    저장소와 스케줄러의 이벤트를 Qt 스레드로 전달합니다.
+    어느 스레드에서 발생한 이벤트든 대기열 시그널로 넘기고, 한 프레임 동안 모인 변경을 한 번에 알립니다.
+    """
+    # (변경되거나 추가된 작업 ID, 삭제된 작업 ID, 전체 다시 불러오기 여부)
+    tasks_changed = pyqtSignal(set, set, bool)
+    # 한 프레임 동안 끝난 실행 기록 목록
+    runs_finished = pyqtSignal(list)
+    _wake = pyqtSignal()
+
+    def __init__(self, events: EventBus, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._changed: Set[str] = set()
+        self._removed: Set[str] = set()
+        self._reload = False
+        self._runs: List[RunRecord] = []
+        self._armed = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FRAME_INTERVAL_MS)
+        self._timer.timeout.connect(self._flush)
+        self._wake.connect(self._arm, Qt.ConnectionType.QueuedConnection)
+
+        self._unsubscribers = [
+            events.subscribe(TASK_ADDED, self._on_changed),
+            events.subscribe(TASK_UPDATED, self._on_changed),
+            events.subscribe(RUN_STATE_CHANGED, self._on_changed),
+            events.subscribe(TASK_REMOVED, self._on_removed),
+            events.subscribe(TASKS_RELOADED, self._on_reloaded),
+            events.subscribe(RUN_FINISHED, self._on_run_finished),
+        ]
+
+    def close(self) -> None:
+        """
+        이벤트 구독을 해제합니다.
+        """
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+
+    # 아래 처리기는 이벤트를 발생시킨 스레드에서 호출되므로 기록만 하고 Qt 스레드를 깨움
+
+    def _on_changed(self, task_id: str) -> None:
+        with self._lock:
+            self._changed.add(task_id)
+            self._removed.discard(task_id)
+            wake = self._request_flush()
+        if wake:
+            self._wake.emit()
+
+    def _on_removed(self, task_id: str) -> None:
+        with self._lock:
+            self._removed.add(task_id)
+            self._changed.discard(task_id)
+            wake = self._request_flush()
+        if wake:
+            self._wake.emit()
+
+    def _on_reloaded(self) -> None:
+        with self._lock:
+            self._reload = True
+            wake = self._request_flush()
+        if wake:
+            self._wake.emit()
+
+    def _on_run_finished(self, task_id: str, run: RunRecord) -> None:
+        with self._lock:
+            self._runs.append(run)
+            wake = self._request_flush()
+        if wake:
+            self._wake.emit()
+
+    def _request_flush(self) -> bool:
+        """
+        이미 전달이 예약되어 있으면 False를 반환합니다. 잠금을 잡은 상태에서 호출합니다.
+        """
+        if self._armed:
+            return False
+        self._armed = True
+        return True
+
+    @pyqtSlot()
+    def _arm(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @pyqtSlot()
+    def _flush(self) -> None:
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            removed, self._removed = self._removed, set()
+            reload, self._reload = self._reload, False
+            runs, self._runs = self._runs, []
+            self._armed = False
+
+        if changed or removed or reload:
+            self.tasks_changed.emit(changed, removed, reload)
+        if runs:
+            self.runs_finished.emit(runs)
@@ -1,16 +1,25 @@
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
-    QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QMessageBox, QMenu, QSystemTrayIcon, QCheckBox,
+    QHBoxLayout, QPushButton, QTableView,
+    QHeaderView, QMessageBox, QMenu, QSystemTrayIcon,
     QLabel, QFileDialog, QDialog
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtCore import QTimer, QModelIndex
 from PyQt6.QtGui import QIcon, QAction
 
 from scheduler import Task, Storage, Scheduler
+from scheduler.transfer import export_tasks, import_tasks
+from ui.event_bridge import EventBridge
+from ui.task_table import ENABLED_COLUMN, CheckBoxDelegate, TaskTableModel
+
+# 실행 예정 레이블과 작업 파일 변경을 확인하는 간격
+MINUTE_INTERVAL_MS = 60 * 1000
+
+# 가져오기/내보내기 파일 형식
+TASK_FILE_FILTER = "작업 파일 (*.json *.csv);;JSON (*.json);;CSV (*.csv)"
 
 # TaskDialog를 직접 import하지 않고, 필요할 때 동적으로 가져오기
 def get_task_dialog(parent, task=None):
@@ -22,22 +31,23 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         # 저장소 및 스케줄러 초기화
-        self.storage = Storage()
+        # 작업 실행마다 파일 전체를 다시 쓰지 않도록 200ms 단위로 모아서 기록
+        self.storage = Storage(flush_interval=0.2)
         self.scheduler = Scheduler(self.storage)
         
         self._setup_ui()
         self._load_tasks()
         
-        # 작업 목록 타이머 (10초마다 업데이트)
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self._load_tasks)
-        self.update_timer.start(10000)
+        # 주기적으로 목록을 다시 읽는 대신 저장소/스케줄러 이벤트를 받아 바뀐 작업만 갱신
+        self.event_bridge = EventBridge(self.scheduler.events, self)
+        self.event_bridge.tasks_changed.connect(self._on_tasks_changed)
+        self.event_bridge.runs_finished.connect(self._on_runs_finished)
         
-        # 카운트다운 타이머 (1초마다 업데이트)
-        self.countdown_timer = QTimer(self)
-        self.countdown_timer.timeout.connect(self._update_countdown)
-        self.countdown_timer.start(1000)
-        self.countdown_seconds = 10  # 남은 시간 초기화
+        # 이벤트가 없어도 실행 예정 레이블이 오래되지 않도록 1분마다 갱신하고,
+        # 다른 프로세스(헤드리스 데몬 등)가 작업 파일을 수정했는지 stat으로 확인
+        self.minute_timer = QTimer(self)
+        self.minute_timer.timeout.connect(self._on_minute_tick)
+        self.minute_timer.start(MINUTE_INTERVAL_MS)
         
         # 스케줄러 시작
         self.scheduler.start()
@@ -74,33 +84,46 @@ class MainWindow(QMainWindow):
         self.delete_button.clicked.connect(self._on_delete_task)
         button_layout.addWidget(self.delete_button)
         
+        # 작업 가져오기/내보내기 버튼 (JSON, CSV)
+        self.import_button = QPushButton("가져오기")
+        self.import_button.clicked.connect(self._on_import_tasks)
+        button_layout.addWidget(self.import_button)
+        
+        self.export_button = QPushButton("내보내기")
+        self.export_button.clicked.connect(self._on_export_tasks)
+        button_layout.addWidget(self.export_button)
+        
         # 레이아웃에 버튼 추가
         main_layout.addLayout(button_layout)
         
-        # 작업 테이블
-        self.task_table = QTableWidget()
-        self.task_table.setColumnCount(6)
-        self.task_table.setHorizontalHeaderLabels(["이름", "경로", "일정 유형", "실행 시간", "다음 실행", "활성화"])
-        self.task_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # 작업 테이블 (변경된 행만 다시 그리는 모델/뷰)
+        self.task_model = TaskTableModel(self)
+        self.task_model.toggled.connect(self._on_toggle_task)
+        self.task_table = QTableView()
+        self.task_table.setModel(self.task_model)
+        self.task_table.setItemDelegateForColumn(ENABLED_COLUMN, CheckBoxDelegate(self.task_table))
+        self.task_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.task_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.task_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.task_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.task_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.task_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.task_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.task_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         
         # 테이블 더블 클릭 이벤트
-        self.task_table.cellDoubleClicked.connect(self._on_table_double_clicked)
+        self.task_table.doubleClicked.connect(self._on_table_double_clicked)
         
         main_layout.addWidget(self.task_table)
         
-        # 남은 시간 표시 레이아웃
-        countdown_layout = QHBoxLayout()
-        countdown_layout.addStretch()
+        # 실행 예정 정보 레이아웃
+        forecast_layout = QHBoxLayout()
+        forecast_layout.addStretch()
         
-        # 남은 시간 레이블
-        self.countdown_label = QLabel("목록 새로고침까지 10초 남음")
-        countdown_layout.addWidget(self.countdown_label)
-        countdown_layout.addStretch()
+        # 앞으로 1시간 동안의 실행 예정 횟수 레이블
+        self.forecast_label = QLabel()
+        forecast_layout.addWidget(self.forecast_label)
+        forecast_layout.addStretch()
         
-        main_layout.addLayout(countdown_layout)
+        main_layout.addLayout(forecast_layout)
         
         # 시스템 트레이 아이콘 설정
         self._setup_system_tray()
@@ -132,124 +155,75 @@ class MainWindow(QMainWindow):
         self.tray_icon.setIcon(self.style().standardIcon(QApplication.style().StandardPixmap.SP_ComputerIcon))
         self.tray_icon.show()
     
-    def _update_countdown(self) -> None:
-        """
-        남은 시간 카운트다운 업데이트
-        """
-        self.countdown_seconds -= 1
-        if self.countdown_seconds <= 0:
-            self.countdown_seconds = 10
-            
-        self.countdown_label.setText(f"목록 새로고침까지 {self.countdown_seconds}초 남음")
-    
     def _load_tasks(self) -> None:
         """
         저장소에서 작업 목록을 로드하고 테이블에 표시
         """
-        # 카운트다운 초기화
-        self.countdown_seconds = 10
-        self.countdown_label.setText(f"목록 새로고침까지 {self.countdown_seconds}초 남음")
-        
-        # 현재 선택된 작업 ID 저장
-        selected_task_id = self._get_selected_task_id()
-        
-        tasks = self.storage.load_tasks()
-        self.task_table.setRowCount(0)  # 테이블 초기화
+        # 스케줄러와 같은 저장소의 캐시를 사용하므로 파일을 다시 읽지 않음
+        # 모델이 바뀐 행만 뷰에 알리므로 선택과 스크롤 위치가 유지됨
+        self.task_model.set_tasks(self.storage.snapshot())
         
-        task_id_to_row = {}  # 작업 ID와 행 번호 매핑
-        
-        for i, task in enumerate(tasks):
-            self.task_table.insertRow(i)
-            
-            # 이름
-            self.task_table.setItem(i, 0, QTableWidgetItem(task.name))
-            
-            # 경로
-            self.task_table.setItem(i, 1, QTableWidgetItem(task.file_path))
-            
-            # 일정 유형
-            self.task_table.setItem(i, 2, QTableWidgetItem(task.schedule_type))
-            
-            # 실행 시간
-            time_info = task.time if task.time else ""
-            if task.schedule_type == "weekly" and task.days:
-                weekday_names = ["월", "화", "수", "목", "금", "토", "일"]
-                weekdays = [weekday_names[day] for day in task.days]
-                time_info += f" ({', '.join(weekdays)})"
-            elif task.schedule_type == "monthly":
-                if hasattr(task, 'is_last_day_of_month') and task.is_last_day_of_month:
-                    time_info += " (매월 마지막 날)"
-                elif task.date:
-                    time_info += f" ({task.date}일)"
-            elif task.schedule_type == "interval" and task.interval_minutes:
-                hours = task.interval_minutes // 60
-                minutes = task.interval_minutes % 60
-                
-                if hours > 0:
-                    time_info = f"{hours}시간 "
-                time_info += f"{minutes}분마다"
-            
-            self.task_table.setItem(i, 3, QTableWidgetItem(time_info))
-            
-            # 다음 실행
-            next_run = task.next_run if task.next_run else "없음"
-            next_run_item = QTableWidgetItem(next_run)
-            
-            # 이전 실행 시간을 툴팁으로 설정
-            if task.last_run:
-                next_run_item.setToolTip(f"이전 실행: {task.last_run}")
-            
-            self.task_table.setItem(i, 4, next_run_item)
-            
-            # 활성화 체크박스 (셀 안에 넣기)
-            checkbox = QCheckBox()
-            checkbox.setChecked(task.enabled)
-            # 명시적인 함수를 사용하여 체크박스 상태 변경 연결
-            checkbox.stateChanged.connect(self._create_checkbox_handler(task.id))
-            
-            # 체크박스를 셀 중앙에 배치
-            cell_widget = QWidget()
-            layout = QHBoxLayout(cell_widget)
-            layout.addWidget(checkbox)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.setContentsMargins(0, 0, 0, 0)
-            cell_widget.setLayout(layout)
-            
-            self.task_table.setCellWidget(i, 5, cell_widget)
-            
-            # 작업 ID 저장 (숨겨진 데이터)
-            item = self.task_table.item(i, 0)
-            if item:
-                item.setData(Qt.ItemDataRole.UserRole, task.id)
-                task_id_to_row[task.id] = i  # 작업 ID와 행 번호 매핑
+        self._update_forecast()
+    
+    def _on_tasks_changed(self, changed: set, removed: set, reload: bool) -> None:
+        """
+        한 프레임 동안 모인 작업 변경을 테이블에 반영
+        """
+        if reload:
+            self._load_tasks()
+            return
         
-        # 이전에 선택된 작업이 있으면 다시 선택
-        if selected_task_id and selected_task_id in task_id_to_row:
-            row_to_select = task_id_to_row[selected_task_id]
-            self.task_table.selectRow(row_to_select)
+        self.task_model.remove_tasks(list(removed))
+        tasks = [self.storage.get_task_by_id(task_id) for task_id in changed]
+        self.task_model.upsert_tasks([task for task in tasks if task is not None])
+        self._update_forecast()
+    
+    def _on_minute_tick(self) -> None:
+        """
+        작업 파일이 외부에서 바뀌었으면 다시 스케줄링하고, 실행 예정 레이블을 갱신
+        """
+        if self.storage.is_stale():
+            # 다시 읽으면 저장소가 tasks_reloaded 이벤트를 보내 테이블도 갱신됨
+            self.scheduler.reload()
+        self._update_forecast()
+    
+    def _on_runs_finished(self, runs: list) -> None:
+        """
+        끝난 실행 중 실패한 실행을 상태 표시줄에 표시
+        """
+        failed = [run for run in runs if not run.succeeded]
+        if failed:
+            task = self.storage.get_task_by_id(failed[-1].task_id)
+            name = task.name if task else failed[-1].task_id
+            self.statusBar().showMessage(f"작업 실행 실패: {name} (종료 코드 {failed[-1].exit_code})", 10000)
+    
+    def _update_forecast(self) -> None:
+        """
+        앞으로 1시간 동안의 분당 실행 예정 횟수를 요약해 표시
+        """
+        now = datetime.now()
+        histogram = self.scheduler.launch_histogram(now, now + timedelta(hours=1))
+        total = sum(count for _, count in histogram)
+        peak = max((count for _, count in histogram), default=0)
+        self.forecast_label.setText(f"| 1시간 내 실행 예정 {total}회 (분당 최대 {peak}회)")
     
     def _get_selected_task_id(self) -> Optional[str]:
         """
         선택된 작업의 ID를 반환
         """
-        selected_rows = self.task_table.selectedItems()
+        selected_rows = self.task_table.selectionModel().selectedRows()
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        item = self.task_table.item(row, 0)
-        if not item:
-            return None
-            
-        return item.data(Qt.ItemDataRole.UserRole)
+        return self.task_model.task_id(selected_rows[0].row())
     
     def _on_add_task(self) -> None:
         """
         작업 추가 다이얼로그 표시
         """
+        # 추가된 작업은 저장소 이벤트로 테이블에 반영됨
         dialog = get_task_dialog(self)
-        if dialog.exec():
-            self._load_tasks()
+        dialog.exec()
     
     def _on_edit_task(self) -> None:
         """
@@ -266,8 +240,7 @@ class MainWindow(QMainWindow):
             return
             
         dialog = get_task_dialog(self, task)
-        if dialog.exec():
-            self._load_tasks()
+        dialog.exec()
     
     def _on_delete_task(self) -> None:
         """
@@ -284,19 +257,36 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            if self.scheduler.delete_task(task_id):
-                self._load_tasks()
-            else:
+            if not self.scheduler.delete_task(task_id):
                 QMessageBox.warning(self, "오류", "작업 삭제에 실패했습니다.")
     
-    def _create_checkbox_handler(self, task_id: str):
+    def _on_import_tasks(self) -> None:
+        """
+        JSON/CSV 파일에서 작업 가져오기
+        """
+        path, _ = QFileDialog.getOpenFileName(self, "작업 가져오기", "", TASK_FILE_FILTER)
+        if not path:
+            return
+        try:
+            added, updated = import_tasks(self.scheduler, path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "오류", f"작업을 가져오지 못했습니다.\n{e}")
+            return
+        self.statusBar().showMessage(f"작업 {added}개 추가, {updated}개 업데이트", 5000)
+    
+    def _on_export_tasks(self) -> None:
         """
-        체크박스 상태 변경 이벤트 핸들러를 생성
+        모든 작업을 JSON/CSV 파일로 내보내기
         """
-        def handler(state: int):
-            is_checked = state == Qt.CheckState.Checked.value
-            self._on_toggle_task(task_id, is_checked)
-        return handler
+        path, _ = QFileDialog.getSaveFileName(self, "작업 내보내기", "tasks.json", TASK_FILE_FILTER)
+        if not path:
+            return
+        try:
+            count = export_tasks(self.storage, path)
+        except OSError as e:
+            QMessageBox.warning(self, "오류", f"작업을 내보내지 못했습니다.\n{e}")
+            return
+        self.statusBar().showMessage(f"작업 {count}개를 내보냈습니다.", 5000)
     
     def _on_toggle_task(self, task_id: str, enabled: bool) -> None:
         """
@@ -305,10 +295,8 @@ class MainWindow(QMainWindow):
         success = self.scheduler.toggle_task(task_id, enabled)
         if not success:
             QMessageBox.warning(self, "오류", "작업 상태 변경에 실패했습니다.")
-            # 상태 변경 실패 시 테이블 다시 로드
-            self._load_tasks()
     
-    def _on_table_double_clicked(self, row: int, column: int) -> None:
+    def _on_table_double_clicked(self, index: QModelIndex) -> None:
         """
         테이블 더블 클릭 이벤트 처리
         """
@@ -329,7 +317,9 @@ class MainWindow(QMainWindow):
         """
         프로그램 종료
         """
+        self.event_bridge.close()
         self.scheduler.stop()
+        self.storage.close()
         QApplication.quit()
     
     def closeEvent(self, event):
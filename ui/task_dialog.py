@@ -11,6 +11,13 @@ import os
 
 from scheduler import Task, Storage, Scheduler
 
+# (표시 이름, Task.misfire_policy 값)
+MISFIRE_POLICIES = [
+    ("건너뛰기", "skip"),
+    ("한 번만 실행", "run_once"),
+    ("놓친 횟수만큼 실행", "run_all"),
+]
+
 class TaskDialog(QDialog):
     def __init__(self, parent: QWidget, task: Optional[Task] = None):
         super().__init__(parent)
@@ -76,6 +83,13 @@ class TaskDialog(QDialog):
         
         form_layout.addRow("실행 시간:", self.time_edit)
         
+        # 실행 시각을 놓쳤을 때(절전, 프로그램 종료) 처리 방식
+        self.misfire_combo = QComboBox()
+        for label, policy in MISFIRE_POLICIES:
+            self.misfire_combo.addItem(label, policy)
+        
+        form_layout.addRow("놓친 실행:", self.misfire_combo)
+        
         # 주간 실행 옵션 (요일 선택)
         self.weekday_group = QGroupBox("실행 요일")
         self.weekday_group.setVisible(False)
@@ -217,6 +231,10 @@ class TaskDialog(QDialog):
         if hasattr(self.task, 'is_last_day_of_month'):
             self.last_day_checkbox.setChecked(self.task.is_last_day_of_month)
         
+        # 놓친 실행 처리 방식 설정
+        index = self.misfire_combo.findData(self.task.misfire_policy)
+        self.misfire_combo.setCurrentIndex(max(index, 0))
+        
         # 주기적 설정 로드
         if self.task.schedule_type == "interval" and hasattr(self.task, "interval_minutes"):
             total_minutes = self.task.interval_minutes
@@ -293,6 +311,8 @@ class TaskDialog(QDialog):
             
             interval_minutes = hours * 60 + minutes
         
+        misfire_policy = self.misfire_combo.currentData()
+        
         # 작업 생성 또는 업데이트
         if self.is_edit_mode and self.task:
             # 기존 작업 업데이트
@@ -303,6 +323,7 @@ class TaskDialog(QDialog):
             self.task.days = days
             self.task.date = date
             self.task.is_last_day_of_month = is_last_day_of_month
+            self.task.misfire_policy = misfire_policy
             
             # 주기적 일정 속성 설정
             if schedule_type == "interval":
@@ -323,6 +344,7 @@ class TaskDialog(QDialog):
                 "days": days,
                 "date": date,
                 "is_last_day_of_month": is_last_day_of_month,
+                "misfire_policy": misfire_policy,
                 "enabled": True
             }
             
@@ -0,0 +1,232 @@
+from typing import Any, Dict, List, Optional, Tuple
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton, QStyleOptionViewItem
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, Qt, pyqtSignal
+
+from scheduler import Task
+
+COLUMNS = ["이름", "경로", "일정 유형", "실행 시간", "다음 실행", "활성화"]
+ENABLED_COLUMN = 5
+
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def format_schedule(task: Task) -> str:
+    """
+    작업의 실행 시간 열에 표시할 문자열을 만듭니다.
+    """
+    time_info = task.time if task.time else ""
+    if task.schedule_type == "weekly" and task.days:
+        weekdays = [WEEKDAY_NAMES[day] for day in task.days]
+        time_info += f" ({', '.join(weekdays)})"
+    elif task.schedule_type == "monthly":
+        if task.is_last_day_of_month:
+            time_info += " (매월 마지막 날)"
+        elif task.date:
+            time_info += f" ({task.date}일)"
+    elif task.schedule_type == "interval" and task.interval_minutes:
+        hours = task.interval_minutes // 60
+        minutes = task.interval_minutes % 60
+
+        if hours > 0:
+            time_info = f"{hours}시간 "
+        time_info += f"{minutes}분마다"
+    return time_info
+
+
+def _row_key(task: Task) -> Tuple:
+    """
+    표에 보이는 값을 결정하는 작업 필드들. 값이 같으면 행을 다시 그리지 않습니다.
+    """
+    return (task.name, task.file_path, task.schedule_type, task.time, tuple(task.days), task.date,
+            task.is_last_day_of_month, task.interval_minutes, task.next_run, task.last_run, task.enabled)
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    작업 목록 표 모델입니다. set_tasks()는 전체를 다시 만들지 않고
+    추가, 삭제, 값이 바뀐 행만 뷰에 알립니다.
+    """
+    # 사용자가 활성화 체크박스를 눌렀을 때 (작업 ID, 활성화 여부)
+    toggled = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._tasks: Dict[str, Task] = {}
+        self._keys: Dict[str, Tuple] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == ENABLED_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        task = self._tasks[self._ids[index.row()]]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return task.name
+            if column == 1:
+                return task.file_path
+            if column == 2:
+                return task.schedule_type
+            if column == 3:
+                return format_schedule(task)
+            if column == 4:
+                return task.next_run if task.next_run else "없음"
+        elif role == Qt.ItemDataRole.CheckStateRole and column == ENABLED_COLUMN:
+            return Qt.CheckState.Checked if task.enabled else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.ToolTipRole and column == 4 and task.last_run:
+            # 이전 실행 시간을 툴팁으로 표시
+            return f"이전 실행: {task.last_run}"
+        elif role == Qt.ItemDataRole.UserRole:
+            return task.id
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != ENABLED_COLUMN:
+            return False
+        # 실제 변경은 스케줄러가 처리하고, 결과는 저장소 이벤트로 반영
+        enabled = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.toggled.emit(self._ids[index.row()], enabled)
+        return True
+
+    def task_id(self, row: int) -> Optional[str]:
+        """
+        행의 작업 ID를 반환합니다.
+        """
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def row_of(self, task_id: str) -> Optional[int]:
+        """
+        작업이 표시된 행 번호를 반환합니다.
+        """
+        return self._rows.get(task_id)
+
+    def set_tasks(self, tasks: List[Task]) -> None:
+        """
+        작업 목록 전체를 반영합니다. 사라진 작업의 행을 지우고, 값이 바뀐 행만 갱신하고,
+        새 작업은 끝에 추가합니다. 선택과 스크롤 위치는 그대로 유지됩니다.
+        """
+        incoming = {task.id for task in tasks}
+        self.remove_tasks([task_id for task_id in self._ids if task_id not in incoming])
+        self.upsert_tasks(tasks)
+
+    def upsert_tasks(self, tasks: List[Task]) -> None:
+        """
+        주어진 작업들만 반영합니다. 표시 값이 달라진 행만 알리고, 새 작업은 한 번에 끝에 삽입합니다.
+        """
+        last_column = len(COLUMNS) - 1
+        added: List[Task] = []
+        for task in tasks:
+            row = self._rows.get(task.id)
+            if row is None:
+                added.append(task)
+                continue
+            self._tasks[task.id] = task
+            key = _row_key(task)
+            if key != self._keys[task.id]:
+                self._keys[task.id] = key
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        if added:
+            first = len(self._ids)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for task in added:
+                self._rows[task.id] = len(self._ids)
+                self._ids.append(task.id)
+                self._tasks[task.id] = task
+                self._keys[task.id] = _row_key(task)
+            self.endInsertRows()
+
+    def remove_tasks(self, task_ids: List[str]) -> None:
+        """
+        작업들의 행을 뒤쪽부터 연속 구간 단위로 제거합니다.
+        """
+        rows = sorted((self._rows[task_id] for task_id in task_ids if task_id in self._rows), reverse=True)
+        if not rows:
+            return
+        for first, last in self._ranges(rows):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for task_id in self._ids[first:last + 1]:
+                del self._tasks[task_id]
+                del self._keys[task_id]
+            del self._ids[first:last + 1]
+            self.endRemoveRows()
+        self._rows = {task_id: row for row, task_id in enumerate(self._ids)}
+
+    @staticmethod
+    def _ranges(rows: List[int]) -> List[Tuple[int, int]]:
+        """
+        내림차순 행 번호 목록을 (시작, 끝) 연속 구간 목록으로 묶습니다.
+        """
+        ranges: List[Tuple[int, int]] = []
+        for row in rows:
+            if ranges and ranges[-1][0] == row + 1:
+                ranges[-1] = (row, ranges[-1][1])
+            else:
+                ranges.append((row, row))
+        return ranges
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """
+    셀 중앙에 체크박스를 그리는 델리게이트입니다. 행마다 위젯을 만들지 않습니다.
+    """
+
+    def _checkbox_rect(self, option: QStyleOptionViewItem) -> QRect:
+        style = option.widget.style() if option.widget else QApplication.style()
+        size = style.subElementRect(QStyle.SubElement.SE_CheckBoxIndicator, QStyleOptionButton(), option.widget).size()
+        rect = QRect(option.rect.topLeft(), size)
+        rect.moveCenter(option.rect.center())
+        return rect
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        # 선택 배경 등은 기본 델리게이트가 그리고, 체크 표시만 직접 그림
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, background, painter, option.widget)
+
+        checkbox = QStyleOptionButton()
+        checkbox.rect = self._checkbox_rect(option)
+        checkbox.state = QStyle.StateFlag.State_Enabled
+        if index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked:
+            checkbox.state |= QStyle.StateFlag.State_On
+        else:
+            checkbox.state |= QStyle.StateFlag.State_Off
+        style.drawControl(QStyle.ControlElement.CE_CheckBox, checkbox, painter, option.widget)
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            if not self._checkbox_rect(option).contains(event.position().toPoint()):
+                return False
+        elif event.type() == QEvent.Type.KeyPress:
+            if event.key() != Qt.Key.Key_Space:
+                return False
+        elif event.type() == QEvent.Type.MouseButtonDblClick:
+            # 체크박스를 빠르게 두 번 눌러도 편집 창이 열리지 않도록 처리
+            return self._checkbox_rect(option).contains(event.position().toPoint())
+        else:
+            return False
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+        return model.setData(index, new_state.value, Qt.ItemDataRole.CheckStateRole)